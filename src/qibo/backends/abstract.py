@@ -16,6 +16,9 @@ class Backend(abc.ABC):
         self.device = "/CPU:0"
         self.nthreads = 1
         self.supports_multigpu = False
+        # whether ``execute_circuit`` generates the channels of
+        # ``circuit.noise_model`` during execution
+        self.supports_lazy_noise = False
         self.oom_error = MemoryError
 
     def __repr__(self):
@@ -114,6 +117,15 @@ class Backend(abc.ABC):
         """Fuse matrices of multiple gates."""
         raise_error(NotImplementedError)
 
+    @abc.abstractmethod
+    def superop_fused(self, gate):  # pragma: no cover
+        """Fuse gates and channels of a fused gate to a single superoperator.
+
+        The superoperator acts on the density matrix of the fused gate's target
+        qubits, flattened in row-major order.
+        """
+        raise_error(NotImplementedError)
+
     @abc.abstractmethod
     def control_matrix(self, gate):  # pragma: no cover
         """ "Calculate full matrix representation of a controlled gate."""
@@ -134,6 +146,11 @@ class Backend(abc.ABC):
         """Apply a gate to one side of the density matrix."""
         raise_error(NotImplementedError)
 
+    @abc.abstractmethod
+    def apply_superop_density_matrix(self, gate, state, nqubits):  # pragma: no cover
+        """Apply a fused gate that contains channels to density matrix."""
+        raise_error(NotImplementedError)
+
     @abc.abstractmethod
     def apply_channel(self, channel, state, nqubits):  # pragma: no cover
         """Apply a channel to state vector."""
@@ -168,6 +185,18 @@ class Backend(abc.ABC):
         """Apply thermal relaxation error to density matrix."""
         raise_error(NotImplementedError)
 
+    @abc.abstractmethod
+    def pauli_error_density_matrix(self, gate, state, nqubits):  # pragma: no cover
+        """Apply single-qubit Pauli error to density matrix."""
+        raise_error(NotImplementedError)
+
+    @abc.abstractmethod
+    def depolarizing_error_density_matrix(
+        self, gate, state, nqubits
+    ):  # pragma: no cover
+        """Apply depolarizing error to density matrix."""
+        raise_error(NotImplementedError)
+
     @abc.abstractmethod
     def execute_circuit(
         self, circuit, initial_state=None, nshots=None
@@ -336,6 +365,29 @@ class Backend(abc.ABC):
         """Calculate eigenvectors of a matrix."""
         raise_error(NotImplementedError)
 
+    @abc.abstractmethod
+    def calculate_partial_eigenvectors(
+        self, matrix, k=1, v0=None, sigma=None
+    ):  # pragma: no cover
+        """Calculate ``k`` eigenvalues and eigenvectors of a Hermitian matrix using iterative solvers.
+
+        Args:
+            matrix: Dense or sparse matrix, or a ``scipy.sparse.linalg.LinearOperator``
+                for matrix-free calculation.
+            k (int): Number of eigenpairs.
+            v0: Starting vector or block of starting vectors, for example
+                the eigenvectors of a slightly different matrix. If not given,
+                a fixed starting vector is used, so that the result is the
+                same in every call also for degenerate eigenvalues.
+            sigma (float): If given, the eigenvalues closest to ``sigma``
+                are calculated using shift-invert mode. Otherwise the lowest
+                eigenvalues are calculated.
+
+        Returns:
+            Eigenvalues in ascending order and the corresponding eigenvectors.
+        """
+        raise_error(NotImplementedError)
+
     @abc.abstractmethod
     def calculate_matrix_exp(
         self, matrix, a, eigenvectors=None, eigenvalues=None
@@ -373,6 +425,11 @@ class Backend(abc.ABC):
         """Multiply a matrix to a state vector or density matrix."""
         raise_error(NotImplementedError)
 
+    @abc.abstractmethod
+    def apply_pauli_sum(self, paulis, state, nqubits):  # pragma: no cover
+        """Multiply a :class:`qibo.hamiltonians.terms.PauliSum` to a state vector or density matrix."""
+        raise_error(NotImplementedError)
+
     @abc.abstractmethod
     def assert_allclose(self, value, target, rtol=1e-7, atol=0.0):  # pragma: no cover
         raise_error(NotImplementedError)
@@ -17,6 +17,7 @@ class NumpyBackend(Backend):
         self.name = "numpy"
         self.matrices = NumpyMatrices(self.dtype)
         self.tensor_types = np.ndarray
+        self.supports_lazy_noise = True
         self.versions = {"qibo": __version__, "numpy": self.np.__version__}
         self.numeric_types = (
             int,
@@ -105,32 +106,68 @@ class NumpyBackend(Backend):
         name = gate.__class__.__name__
         return getattr(self.matrices, name)(*gate.parameters)
 
+    def _asmatrix_in_fused(self, fgate, gate):
+        """Matrix of a gate acting on all the target qubits of a fused gate."""
+        rank = len(fgate.target_qubits)
+        # transfer gate matrix to numpy as it is more efficient for
+        # small tensor calculations
+        gmatrix = gate.asmatrix(self)
+        # Kronecker product with identity is needed to make the
+        # original matrix have shape (2**rank x 2**rank)
+        eye = np.eye(2 ** (rank - len(gate.qubits)), dtype=self.dtype)
+        gmatrix = np.kron(gmatrix, eye)
+        # Transpose the new matrix indices so that it targets the
+        # target qubits of the original gate
+        original_shape = gmatrix.shape
+        gmatrix = np.reshape(gmatrix, 2 * rank * (2,))
+        qubits = list(gate.qubits)
+        indices = qubits + [q for q in fgate.target_qubits if q not in qubits]
+        indices = np.argsort(indices)
+        transpose_indices = list(indices)
+        transpose_indices.extend(indices + rank)
+        gmatrix = np.transpose(gmatrix, transpose_indices)
+        return np.reshape(gmatrix, original_shape)
+
     def asmatrix_fused(self, fgate):
         rank = len(fgate.target_qubits)
         matrix = np.eye(2**rank, dtype=self.dtype)
         for gate in fgate.gates:
-            # transfer gate matrix to numpy as it is more efficient for
-            # small tensor calculations
-            gmatrix = gate.asmatrix(self)
-            # Kronecker product with identity is needed to make the
-            # original matrix have shape (2**rank x 2**rank)
-            eye = np.eye(2 ** (rank - len(gate.qubits)), dtype=self.dtype)
-            gmatrix = np.kron(gmatrix, eye)
-            # Transpose the new matrix indices so that it targets the
-            # target qubits of the original gate
-            original_shape = gmatrix.shape
-            gmatrix = np.reshape(gmatrix, 2 * rank * (2,))
-            qubits = list(gate.qubits)
-            indices = qubits + [q for q in fgate.target_qubits if q not in qubits]
-            indices = np.argsort(indices)
-            transpose_indices = list(indices)
-            transpose_indices.extend(indices + rank)
-            gmatrix = np.transpose(gmatrix, transpose_indices)
-            gmatrix = np.reshape(gmatrix, original_shape)
+            gmatrix = self._asmatrix_in_fused(fgate, gate)
             # fuse the individual gate matrix to the total ``FusedGate`` matrix
             matrix = gmatrix @ matrix
         return matrix
 
+    def superop_fused(self, fgate):
+        from qibo.gates import Channel
+
+        rank = len(fgate.target_qubits)
+        superop = np.eye(4**rank, dtype=self.dtype)
+        for gate in fgate.gates:
+            if isinstance(gate, Channel):
+                identity = (1 - gate.coefficient_sum) * np.eye(4**rank)
+                gsuperop = identity.astype(self.dtype)
+                for coeff, kraus in zip(gate.coefficients, gate.gates):
+                    kmatrix = self._asmatrix_in_fused(fgate, kraus)
+                    gsuperop += coeff * np.kron(kmatrix, np.conj(kmatrix))
+            else:
+                gmatrix = self._asmatrix_in_fused(fgate, gate)
+                gsuperop = np.kron(gmatrix, np.conj(gmatrix))
+            superop = gsuperop @ superop
+        return superop
+
+    def apply_superop_density_matrix(self, fgate, state, nqubits):
+        from qibo.gates import Unitary
+
+        state = self.cast(state)
+        shape = state.shape
+        # the superoperator is a ``2 * rank``-qubit matrix acting on the
+        # density matrix viewed as a ``2 * nqubits``-qubit vector
+        qubits = tuple(fgate.target_qubits)
+        qubits += tuple(q + nqubits for q in fgate.target_qubits)
+        gate = Unitary(self.superop_fused(fgate), *qubits)
+        state = self.apply_gate(gate, self.np.reshape(state, (-1,)), 2 * nqubits)
+        return self.np.reshape(state, shape)
+
     def control_matrix(self, gate):
         if len(gate.control_qubits) > 1:
             raise_error(
@@ -328,6 +365,50 @@ class NumpyBackend(Backend):
         state = self.apply_gate(gate, state.ravel(), 2 * nqubits)
         return self.np.reshape(state, shape)
 
+    def pauli_error_density_matrix(self, gate, state, nqubits):
+        state = self.cast(state)
+        shape = state.shape
+        q = gate.target_qubits[0]
+        px, py, pz = (gate.init_kwargs[k] for k in ("px", "py", "pz"))
+        # Pauli channels only mix each 2x2 block of the density matrix along
+        # ``q`` with its flipped block ``rho[1 - i, 1 - j]``, so the channel
+        # reduces to two elementwise weightings without any gate matrices
+        pdiag, poff = 1 - px - py, 1 - px - py - 2 * pz
+        weights = self.cast([[pdiag, poff], [poff, pdiag]])
+        weights = self.np.reshape(weights, (1, 2, 1, 1, 2, 1))
+        fweights = self.cast([[px + py, px - py], [px - py, px + py]])
+        fweights = self.np.reshape(fweights, (1, 2, 1, 1, 2, 1))
+        state = self.np.reshape(state, 2 * (2**q, 2, 2 ** (nqubits - q - 1)))
+        state = weights * state + fweights * state[:, ::-1, :, :, ::-1]
+        return self.np.reshape(state, shape)
+
+    def depolarizing_error_density_matrix(self, gate, state, nqubits):
+        state = self.cast(state)
+        shape = state.shape
+        qubits = tuple(sorted(gate.target_qubits))
+        lam = gate.init_kwargs["lam"]
+        ntargets = len(qubits)
+        others = [q for q in range(nqubits) if q not in qubits]
+        trace = self.partial_trace_density_matrix(state, qubits, nqubits)
+        trace = self.np.reshape(trace, 2 * len(others) * (2,))
+        identity = self.np.eye(2**ntargets, dtype=self.dtype) / 2**ntargets
+        identity = self.np.reshape(identity, 2 * ntargets * (2,))
+        mixed = self.np.tensordot(trace, identity, axes=0)
+        # move the traced out qubits back to their original positions
+        rows = [
+            others.index(q) if q in others else 2 * len(others) + qubits.index(q)
+            for q in range(nqubits)
+        ]
+        columns = [i + len(others) if i < len(others) else i + ntargets for i in rows]
+        mixed = self.np.reshape(self.np.transpose(mixed, rows + columns), shape)
+        return (1 - lam) * state + lam * mixed
+
+    def _execution_queue(self, circuit):
+        """Gates to apply when executing a circuit, including lazy noise."""
+        if circuit.noise_model is None:
+            return circuit.queue
+        return circuit.noise_model.noisy_queue(circuit)
+
     def execute_circuit(
         self, circuit, initial_state=None, nshots=None, return_array=False
     ):
@@ -349,9 +430,16 @@ class NumpyBackend(Backend):
                     # cast to proper complex type
                     state = self.cast(initial_state)
 
-                for gate in circuit.queue:
+                for gate in self._execution_queue(circuit):
                     state = gate.apply_density_matrix(self, state, nqubits)
 
+            elif (
+                circuit.cache_states
+                and initial_state is None
+                and circuit.noise_model is None
+            ):
+                state = self._execute_circuit_with_cache(circuit)
+
             else:
                 if initial_state is None:
                     state = self.zero_state(nqubits)
@@ -359,7 +447,7 @@ class NumpyBackend(Backend):
                     # cast to proper complex type
                     state = self.cast(initial_state)
 
-                for gate in circuit.queue:
+                for gate in self._execution_queue(circuit):
                     state = gate.apply(self, state, nqubits)
 
             if return_array:
@@ -376,6 +464,45 @@ class NumpyBackend(Backend):
                 "different one using ``qibo.set_device``.",
             )
 
+    def _execute_circuit_with_cache(self, circuit):
+        """Executes a circuit reusing the states cached in a previous execution.
+
+        The state before each parametrized gate is cached together with the
+        gate parameters. Execution restarts from the cached state before the
+        first gate whose parameters changed since the previous execution, so
+        that coordinate-wise optimizers simulate only the part of the circuit
+        after the updated parameter.
+        """
+        nqubits = circuit.nqubits
+        parameters = [_parameters_snapshot(gate) for gate in circuit.queue]
+        cache = circuit._state_cache
+        if cache is None or len(cache["parameters"]) != len(parameters):
+            cache = {"parameters": parameters, "states": {}, "final": None}
+            start = 0
+        else:
+            start = next(
+                (
+                    i
+                    for i, (old, new) in enumerate(zip(cache["parameters"], parameters))
+                    if not _same_parameters(old, new)
+                ),
+                None,
+            )
+            if start is None:
+                return self.cast(cache["final"], copy=True)
+            cache["parameters"] = parameters
+
+        state = cache["states"][start] if start > 0 else self.zero_state(nqubits)
+        for i, gate in enumerate(circuit.queue[start:], start):
+            if parameters[i]:
+                # copy so that backends which apply gates in place do not
+                # overwrite the cached states
+                cache["states"][i] = self.cast(state, copy=True)
+            state = gate.apply(self, state, nqubits)
+        cache["final"] = state
+        circuit._state_cache = cache
+        return self.cast(state, copy=True)
+
     def execute_circuit_repeated(self, circuit, initial_state=None, nshots=None):
         if nshots is None:
             nshots = 1
@@ -389,7 +516,7 @@ class NumpyBackend(Backend):
                 else:
                     state = self.cast(initial_state, copy=True)
 
-                for gate in circuit.queue:
+                for gate in self._execution_queue(circuit):
                     if gate.symbolic_parameters:
                         gate.substitute_symbols()
                     state = gate.apply_density_matrix(self, state, nqubits)
@@ -405,7 +532,7 @@ class NumpyBackend(Backend):
                     else:
                         state = self.cast(initial_state, copy=True)
 
-                    for gate in circuit.queue:
+                    for gate in self._execution_queue(circuit):
                         if gate.symbolic_parameters:
                             gate.substitute_symbols()
                         state = gate.apply(self, state, nqubits)
@@ -622,13 +749,66 @@ class NumpyBackend(Backend):
     def calculate_eigenvectors(self, matrix, k=6):
         if self.issparse(matrix):
             if k < matrix.shape[0]:
-                from scipy.sparse.linalg import eigsh
-
-                return eigsh(matrix, k=k, which="SA")
+                return self.calculate_partial_eigenvectors(matrix, k)
             else:  # pragma: no cover
                 matrix = self.to_numpy(matrix)
         return np.linalg.eigh(matrix)
 
+    def calculate_partial_eigenvectors(self, matrix, k=1, v0=None, sigma=None):
+        import warnings
+
+        from scipy.sparse.linalg import LinearOperator, eigsh, lobpcg
+
+        if not (self.issparse(matrix) or isinstance(matrix, LinearOperator)):
+            matrix = self.to_numpy(matrix)
+        n = matrix.shape[0]
+        if v0 is not None:
+            v0 = np.array(self.to_numpy(v0))
+            if v0.ndim == 1:
+                v0 = v0[:, np.newaxis]
+
+        if sigma is None and v0 is not None and v0.shape[1] >= k and 5 * k < n:
+            # block solver warm-started from the given eigenvectors,
+            # convergence is checked below using the residuals
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                eigvals, eigvecs = lobpcg(
+                    matrix, v0[:, :k], largest=False, tol=1e-8, maxiter=100
+                )
+            residual = matrix @ eigvecs - eigvecs * eigvals
+            if np.max(np.linalg.norm(residual, axis=0)) < 1e-6:
+                order = np.argsort(eigvals)
+                return eigvals[order], eigvecs[:, order]
+
+        if k >= n - 1:
+            # ARPACK cannot calculate all eigenvalues
+            if isinstance(matrix, LinearOperator):
+                matrix = matrix @ np.eye(n, dtype=matrix.dtype)
+            eigvals, eigvecs = np.linalg.eigh(self.to_numpy(matrix))
+            if sigma is not None:
+                order = np.sort(np.argsort(np.abs(eigvals - sigma))[:k])
+                return eigvals[order], eigvecs[:, order]
+            return eigvals[:k], eigvecs[:, :k]
+
+        if v0 is None:
+            # fixed starting vector so that the eigenvectors of degenerate
+            # eigenvalues are the same in every call
+            rng = np.random.default_rng(1234)
+            start = rng.standard_normal(n).astype(matrix.dtype)
+        else:
+            start = v0[:, 0]
+        if sigma is not None and isinstance(matrix, LinearOperator):
+            raise_error(
+                NotImplementedError,
+                "Shift-invert mode is not available for matrix-free operators.",
+            )
+        if sigma is None:
+            eigvals, eigvecs = eigsh(matrix, k=k, which="SA", v0=start)
+        else:
+            eigvals, eigvecs = eigsh(matrix, k=k, sigma=sigma, which="LM", v0=start)
+        order = np.argsort(eigvals)
+        return eigvals[order], eigvecs[:, order]
+
     def calculate_matrix_exp(self, a, matrix, eigenvectors=None, eigenvalues=None):
         if eigenvectors is None or self.issparse(matrix):
             if self.issparse(matrix):
@@ -673,6 +853,26 @@ class NumpyBackend(Backend):
                 "Cannot multiply Hamiltonian with " "rank-{} tensor.".format(rank),
             )
 
+    def apply_pauli_sum(self, paulis, state, nqubits):
+        state = self.cast(state)
+        shape = tuple(state.shape)
+        # the first ``nqubits`` axes correspond to the rows of density matrices
+        state = self.np.reshape(state, nqubits * (2,) + shape[1:])
+        ndim = len(state.shape)
+        result = self.np.zeros_like(state)
+        for coefficient, xqubits, zqubits in paulis.strings:
+            # ``X^x Z^z`` flips the ``x`` axes after changing the sign of the
+            # ``z`` axes, so the signs are flipped too when the axes coincide
+            factor = np.array(coefficient, dtype=state.dtype)
+            for q in zqubits:
+                sign = np.array([-1, 1] if q in xqubits else [1, -1])
+                factor = factor * np.reshape(
+                    sign, q * (1,) + (2,) + (ndim - q - 1) * (1,)
+                )
+            term = self.np.flip(state, axis=xqubits) if xqubits else state
+            result += self.cast(factor, dtype=state.dtype) * term
+        return self.np.reshape(result, shape)
+
     def assert_allclose(self, value, target, rtol=1e-7, atol=0.0):
         value = self.to_numpy(value)
         target = self.to_numpy(target)
@@ -696,3 +896,19 @@ class NumpyBackend(Backend):
                 {5: 18, 4: 5, 7: 4, 1: 2, 6: 1},
                 {4: 8, 2: 6, 5: 5, 1: 3, 3: 3, 6: 2, 7: 2, 0: 1},
             ]
+
+
+def _parameters_snapshot(gate):
+    """Copy of the parameters of a gate used to detect parameter updates."""
+    from qibo.gates.abstract import ParametrizedGate
+    from qibo.gates.special import FusedGate
+
+    if isinstance(gate, FusedGate):
+        return [p for g in gate.gates for p in _parameters_snapshot(g)]
+    if isinstance(gate, ParametrizedGate):
+        return [np.array(p, copy=True) for p in gate.parameters]
+    return []
+
+
+def _same_parameters(old, new):
+    return len(old) == len(new) and all(np.array_equal(x, y) for x, y in zip(old, new))
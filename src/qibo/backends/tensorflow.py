@@ -254,6 +254,10 @@ class TensorflowBackend(NumpyBackend):
         npmatrix = super().asmatrix_fused(gate)
         return self.tf.cast(npmatrix, dtype=self.dtype)
 
+    def superop_fused(self, gate):
+        npmatrix = super().superop_fused(gate)
+        return self.tf.cast(npmatrix, dtype=self.dtype)
+
     def execute_circuit(
         self, circuit, initial_state=None, nshots=None, return_array=False
     ):
@@ -310,6 +314,10 @@ class TensorflowBackend(NumpyBackend):
     def calculate_eigenvectors(self, matrix, k=6):
         return self.tf.linalg.eigh(matrix)
 
+    def calculate_partial_eigenvectors(self, matrix, k=1, v0=None, sigma=None):
+        eigvals, eigvecs = super().calculate_partial_eigenvectors(matrix, k, v0, sigma)
+        return self.cast(eigvals, dtype=eigvals.dtype), self.cast(eigvecs)
+
     def calculate_matrix_exp(self, a, matrix, eigenvectors=None, eigenvalues=None):
         if eigenvectors is None or self.issparse(matrix):
             return self.tf.linalg.expm(-1j * a * matrix)
@@ -1,5 +1,7 @@
 from typing import List, Optional, Set, Union
 
+import numpy as np
+
 from qibo.config import raise_error
 
 
@@ -244,6 +246,11 @@ class Gap(Callback):
     Note that this callback can only be added in
     :class:`qibo.evolution.AdiabaticEvolution` models.
 
+    Only the lowest few eigenpairs are calculated, using
+    :meth:`qibo.hamiltonians.abstract.AbstractHamiltonian.partial_eigenvectors`.
+    The eigenvectors of each evaluation are used as starting vectors for the
+    next one, since they change slowly along the adiabatic schedule.
+
     Args:
         mode (str/int): Defines which quantity this callback calculates.
             If ``mode == 'gap'`` then the difference between ground state and
@@ -255,6 +262,9 @@ class Gap(Callback):
             proper gap in the case of degenerate Hamiltonians.
             This flag is relevant only if ``mode`` is ``'gap'``.
             Default is ``True``.
+        interval (int): The callback is evaluated once every ``interval``
+            evolution steps, starting from the initial time. The times of the
+            evaluations are stored in ``times``. Default is 1.
 
     Example:
 
@@ -284,7 +294,17 @@ class Gap(Callback):
             ...
     """
 
-    def __init__(self, mode: Union[str, int] = "gap", check_degenerate: bool = True):
+    # eigenvalues closer than this are considered degenerate
+    DEGENERACY_TOL = 1e-8
+    # number of additional eigenpairs tracked to improve convergence
+    EXTRA_STATES = 2
+
+    def __init__(
+        self,
+        mode: Union[str, int] = "gap",
+        check_degenerate: bool = True,
+        interval: int = 1,
+    ):
         super().__init__()
         if not isinstance(mode, (int, str)):
             raise_error(
@@ -296,41 +316,88 @@ class Gap(Callback):
             raise_error(
                 ValueError, "Unsupported mode {} for gap callback." "".format(mode)
             )
+        if not isinstance(interval, int) or interval < 1:
+            raise_error(
+                ValueError,
+                "Gap callback interval should be a positive integer "
+                "but is {}.".format(interval),
+            )
         self.mode = mode
         self.check_degenerate = check_degenerate
+        self.interval = interval
         self.evolution = None
+        self.times = []
+        self._step = 0
+        self._last_time = None
+        self._eigenvectors = None
+        self._rng = None
+
+    def append(self, x):
+        # ``apply`` returns ``None`` for the steps that are skipped
+        if x is not None:
+            super().append(x)
+
+    def _lowest_eigenvalues(self, hamiltonian, k):
+        """Lowest ``k`` eigenvalues, warm-started from the previous evaluation."""
+        dim = 2**hamiltonian.nqubits
+        nstates = min(k + self.EXTRA_STATES, dim)
+        v0 = None
+        if self._eigenvectors is not None:
+            # random components allow the solver to find states that
+            # have no overlap with the previous eigenvectors due to symmetries
+            noise = self._rng.standard_normal((dim, nstates))
+            v0 = np.array(hamiltonian.backend.to_numpy(self._eigenvectors))
+            v0 = np.concatenate([v0, noise[:, v0.shape[1] :]], axis=1)
+            v0 = v0[:, :nstates] + 1e-3 * noise
+        eigvals, self._eigenvectors = hamiltonian.partial_eigenvectors(nstates, v0=v0)
+        return eigvals[:k]
 
     def apply(self, backend, state):
-        from qibo.config import EIGVAL_CUTOFF, log
+        from qibo.config import log
 
         if self.evolution is None:
             raise_error(
                 RuntimeError,
                 "Gap callback can only be used in " "adiabatic evolution models.",
             )
-        hamiltonian = self.evolution.solver.current_hamiltonian  # pylint: disable=E1101
+        solver = self.evolution.solver  # pylint: disable=E1101
+        hamiltonian = solver.current_hamiltonian
         assert type(hamiltonian.backend) == type(backend)
-        # Call the eigenvectors so that they are cached for the ``exp`` call
-        hamiltonian.eigenvectors()
-        eigvals = hamiltonian.eigenvalues()
+
+        if self._last_time is None or solver.t <= self._last_time:
+            # new evolution
+            self._step = 0
+            self._eigenvectors = None
+            self._rng = np.random.default_rng(1234)
+        self._last_time = solver.t
+        self._step += 1
+        if (self._step - 1) % self.interval:
+            return None
+        self.times.append(solver.t)
+
         if isinstance(self.mode, int):
+            eigvals = self._lowest_eigenvalues(hamiltonian, self.mode + 1)
             return backend.np.real(eigvals[self.mode])
 
         # case: self.mode == "gap"
-        excited = 1
-        gap = backend.np.real(eigvals[excited] - eigvals[0])
+        dim = 2**hamiltonian.nqubits
+        k = 2
+        eigvals = self._lowest_eigenvalues(hamiltonian, k)
         if not self.check_degenerate:
-            return gap
-
-        while backend.np.less(gap, EIGVAL_CUTOFF):
-            gap = backend.np.real(eigvals[excited] - eigvals[0])
-            excited += 1
+            return backend.np.real(eigvals[1] - eigvals[0])
+
+        gaps = np.real(backend.to_numpy(eigvals) - backend.to_numpy(eigvals)[0])
+        while gaps[-1] < self.DEGENERACY_TOL and k < dim:
+            k = min(2 * k, dim)
+            eigvals = self._lowest_eigenvalues(hamiltonian, k)
+            gaps = np.real(backend.to_numpy(eigvals) - backend.to_numpy(eigvals)[0])
+        excited = int(np.argmax(gaps >= self.DEGENERACY_TOL))
         if excited > 1:
             log.warning(
                 "The Hamiltonian is degenerate. Using eigenvalue {} "
                 "to calculate gap.".format(excited)
             )
-        return gap
+        return backend.np.real(eigvals[excited] - eigvals[0])
 
     def apply_density_matrix(self, backend, state):
         raise_error(
@@ -122,3 +122,232 @@ def parameter_shift(
     circuit.set_parameters(original)
 
     return generator_eigenval * (forward - backward) * scale_factor
+
+
+# Shifts and coefficients of the exact derivative rule for functions whose
+# Fourier spectrum is contained in {0, 1/2, 1}, which is the case for the
+# matrices of all single-parameter dependencies of the parametrized gates.
+_SHIFTS = (2 * np.arange(1, 5) - 1) * np.pi / 2
+_SHIFT_COEFFICIENTS = (-1) ** np.arange(4) / (16 * np.sin(_SHIFTS / 4) ** 2)
+
+
+def _matrix_derivatives(backend, gate):
+    """Derivatives of a gate matrix with respect to each of its parameters.
+
+    The derivative matrices are defined on ``gate.qubits``, so that for gates
+    created using ``controlled_by`` the block where the controls are not
+    active is zero.
+    """
+    parameters = list(gate.parameters)
+    if any(np.ndim(p) != 0 for p in parameters):
+        raise_error(
+            NotImplementedError,
+            f"Derivatives are not implemented for gate {gate.name} with "
+            "non-scalar parameters.",
+        )
+    matrix = getattr(backend.matrices, gate.__class__.__name__)
+
+    derivatives = []
+    for i in range(len(parameters)):
+        derivative = 0
+        for shift, coefficient in zip(_SHIFTS, _SHIFT_COEFFICIENTS):
+            shifted = list(parameters)
+            shifted[i] += shift
+            derivative += coefficient * backend.to_numpy(matrix(*shifted))
+        if gate.is_controlled_by:
+            size = 2 ** len(gate.qubits)
+            full = np.zeros((size, size), dtype=derivative.dtype)
+            full[-len(derivative) :, -len(derivative) :] = derivative
+            derivative = full
+        derivatives.append(backend.cast(derivative))
+    return derivatives
+
+
+def adjoint_gradient(circuit, hamiltonian, initial_state=None):
+    """Gradient of the expectation value of a Hamiltonian using the adjoint method.
+
+    Calculates the derivatives of :math:`\\langle \\psi (\\theta )|H|\\psi (\\theta )\\rangle`
+    with respect to all trainable parameters of the circuit using a forward
+    simulation of the circuit followed by a single backward sweep over its gates,
+    in which the state and :math:`H|\\psi \\rangle` are evolved by the inverse
+    gates. The cost is therefore independent of the number of parameters,
+    contrary to :meth:`qibo.derivative.parameter_shift` that requires two circuit
+    simulations for each parameter. Applies only to state vector simulation of
+    unitary circuits.
+
+    Args:
+        circuit (:class:`qibo.models.circuit.Circuit`): parametrized circuit.
+        hamiltonian (:class:`qibo.hamiltonians.Hamiltonian`): target observable.
+        initial_state ((2**nqubits) vector): initial state on which the circuit
+            acts. If ``None`` the zero state is used.
+
+    Returns:
+        np.ndarray with the derivatives of the expectation value with respect
+        to each trainable parameter, following the order of
+        ``circuit.get_parameters(format="flatlist")``.
+
+    Example:
+        .. testcode::
+
+            import numpy as np
+            from qibo import gates, hamiltonians
+            from qibo.models import Circuit
+            from qibo.derivative import adjoint_gradient
+
+            c = Circuit(2)
+            c.add(gates.RY(0, theta=0.1))
+            c.add(gates.CNOT(0, 1))
+            c.add(gates.RX(1, theta=0.2))
+            gradient = adjoint_gradient(c, hamiltonians.XXZ(2))
+    """
+    from qibo import gates
+
+    if not isinstance(hamiltonian, AbstractHamiltonian):
+        raise_error(
+            TypeError,
+            "hamiltonian must be a qibo.hamiltonians.Hamiltonian or qibo.hamiltonians.SymbolicHamiltonian object",
+        )
+    if circuit.density_matrix:
+        raise_error(
+            NotImplementedError,
+            "Adjoint gradients are not implemented for density matrices.",
+        )
+
+    backend = hamiltonian.backend
+    nqubits = circuit.nqubits
+    queue = [gate for gate in circuit.queue if not isinstance(gate, gates.M)]
+    for gate in queue:
+        if isinstance(gate, (gates.Channel, gates.SpecialGate)):
+            raise_error(
+                NotImplementedError,
+                f"Adjoint gradients are not implemented for circuits containing {gate.name}.",
+            )
+
+    offsets, nparams = {}, 0
+    for gate in circuit.trainable_gates:
+        offsets[id(gate)] = nparams
+        nparams += gate.nparams
+    if not set(offsets).issubset(id(gate) for gate in queue):
+        raise_error(
+            NotImplementedError,
+            "Adjoint gradients require access to the trainable gates in the "
+            "circuit queue and are not available for fused circuits.",
+        )
+
+    if initial_state is None:
+        state = backend.zero_state(nqubits)
+    else:
+        state = backend.cast(initial_state, copy=True)
+    for gate in queue:
+        state = backend.apply_gate(gate, state, nqubits)
+
+    gradient = np.zeros(nparams)
+    adjoint = hamiltonian @ state
+    for gate in reversed(queue):
+        dagger = gate.dagger()
+        state = backend.apply_gate(dagger, state, nqubits)
+        if id(gate) in offsets:
+            k = offsets[id(gate)]
+            for i, derivative in enumerate(_matrix_derivatives(backend, gate)):
+                dgate = gates.Unitary(derivative, *gate.qubits)
+                # copy because backends may apply gates in place
+                dstate = backend.cast(state, copy=True)
+                dstate = backend.apply_gate(dgate, dstate, nqubits)
+                overlap = backend.np.sum(backend.np.conj(adjoint) * dstate)
+                gradient[k + i] = 2 * float(backend.np.real(overlap))
+        adjoint = backend.apply_gate(dagger, adjoint, nqubits)
+    return gradient
+
+
+def parameter_shift_gradient(circuit, hamiltonian, initial_state=None, scale_factor=1):
+    """Gradient of the expectation value of a Hamiltonian using the parameter shift rule.
+
+    Calculates the derivatives with respect to all trainable parameters of the
+    circuit using the same rule as :meth:`qibo.derivative.parameter_shift`.
+    The circuit is simulated once gate by gate, and the two shifted evaluations
+    of each parameter restart from the state before the corresponding gate
+    instead of the initial state. Both shifted states are evolved through the
+    rest of the circuit together, as a single state with one additional qubit
+    that labels the shift.
+
+    Args:
+        circuit (:class:`qibo.models.circuit.Circuit`): custom quantum circuit.
+        hamiltonian (:class:`qibo.hamiltonians.Hamiltonian`): target observable.
+        initial_state ((2**nqubits) vector): initial state on which the circuit acts (default None).
+        scale_factor (float): parameter scale factor (default 1).
+
+    Returns:
+        np.ndarray with the derivatives of the expectation value with respect
+        to each trainable parameter, following the order of
+        ``circuit.get_parameters(format="flatlist")``.
+    """
+    from qibo import gates
+
+    if not isinstance(hamiltonian, AbstractHamiltonian):
+        raise_error(
+            TypeError,
+            "hamiltonian must be a qibo.hamiltonians.Hamiltonian or qibo.hamiltonians.SymbolicHamiltonian object",
+        )
+    if circuit.density_matrix:
+        raise_error(
+            NotImplementedError,
+            "Parameter shift gradients are not implemented for density matrices.",
+        )
+
+    backend = hamiltonian.backend
+    nqubits = circuit.nqubits
+    queue = [gate for gate in circuit.queue if not isinstance(gate, gates.M)]
+    for gate in queue:
+        if isinstance(gate, (gates.Channel, gates.SpecialGate)):
+            raise_error(
+                NotImplementedError,
+                f"Parameter shift gradients are not implemented for circuits containing {gate.name}.",
+            )
+
+    offsets = {id(gate): i for i, gate in enumerate(circuit.trainable_gates)}
+    if not set(offsets).issubset(id(gate) for gate in queue):
+        raise_error(
+            NotImplementedError,
+            "Parameter shift gradients require access to the trainable gates "
+            "in the circuit queue and are not available for fused circuits.",
+        )
+
+    # gates acting on the batch of the two shifted states, which is labeled
+    # by the additional qubit 0
+    qubit_map = {q: q + 1 for q in range(nqubits)}
+    batched_queue = [gate.on_qubits(qubit_map) for gate in queue]
+
+    if initial_state is None:
+        state = backend.zero_state(nqubits)
+    else:
+        state = backend.cast(initial_state, copy=True)
+
+    gradient = np.zeros(len(offsets))
+    for i, gate in enumerate(queue):
+        if id(gate) in offsets:
+            if gate.is_controlled_by:
+                # the generator of a controlled rotation has three eigenvalues
+                raise_error(
+                    NotImplementedError,
+                    "Parameter shift rule is not implemented for controlled gates.",
+                )
+            generator_eigenval = gate.generator_eigenvalue()
+            s = np.pi / (4 * generator_eigenval)
+            batch = []
+            for shift in (s, -s):
+                shifted_gate = gate.on_qubits({q: q for q in gate.qubits})
+                shifted_gate.parameters = gate.parameters[0] + shift
+                # copy because backends may apply gates in place
+                shifted_state = backend.cast(state, copy=True)
+                batch.append(backend.apply_gate(shifted_gate, shifted_state, nqubits))
+            batch = backend.np.concatenate(batch)
+            for batched_gate in batched_queue[i + 1 :]:
+                batch = backend.apply_gate(batched_gate, batch, nqubits + 1)
+            batch = backend.np.reshape(batch, (2, 2**nqubits))
+            forward = hamiltonian.expectation(batch[0])
+            backward = hamiltonian.expectation(batch[1])
+            gradient[offsets[id(gate)]] = (
+                generator_eigenval * float(forward - backward) * scale_factor
+            )
+        state = backend.apply_gate(gate, state, nqubits)
+    return gradient
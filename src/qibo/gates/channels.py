@@ -264,6 +264,9 @@ class PauliNoiseChannel(UnitaryChannel):
         self.init_args = [q]
         self.init_kwargs = {"px": px, "py": py, "pz": pz}
 
+    def apply_density_matrix(self, backend, state, nqubits):
+        return backend.pauli_error_density_matrix(self, state, nqubits)
+
 
 class DepolarizingChannel(UnitaryChannel):
     """:math:`n`-qubit Depolarizing quantum error channel,
@@ -312,6 +315,9 @@ class DepolarizingChannel(UnitaryChannel):
         self.init_args = [q]
         self.init_kwargs = {"lam": lam}
 
+    def apply_density_matrix(self, backend, state, nqubits):
+        return backend.depolarizing_error_density_matrix(self, state, nqubits)
+
 
 class ResetChannel(Channel):
     """Single-qubit reset channel.
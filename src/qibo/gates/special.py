@@ -97,6 +97,13 @@ class FusedGate(SpecialGate):
     def asmatrix(self, backend):
         return backend.asmatrix_fused(self)
 
+    def apply_density_matrix(self, backend, state, nqubits):
+        from qibo.gates.channels import Channel
+
+        if any(isinstance(gate, Channel) for gate in self.gates):
+            return backend.apply_superop_density_matrix(self, state, nqubits)
+        return backend.apply_gate_density_matrix(self, state, nqubits)
+
     def fuse(self, gate):
         """Fuses two gates."""
         left_gates = set(self.right_neighbors.values()) - {gate}
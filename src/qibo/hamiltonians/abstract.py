@@ -51,6 +51,30 @@ class AbstractHamiltonian:
         """
         raise_error(NotImplementedError)
 
+    @abstractmethod
+    def partial_eigenvectors(self, k=1, v0=None, sigma=None):  # pragma: no cover
+        """Computes ``k`` eigenvalues and eigenvectors without full diagonalization.
+
+        Iterative solvers are used, so only matrix-vector products with the
+        Hamiltonian are needed. Results are not cached.
+
+        Args:
+            k (int): Number of eigenpairs to calculate.
+            v0 (np.ndarray): Starting vector, or matrix with starting vectors
+                as columns. Passing the eigenvectors of a slightly different
+                Hamiltonian, for example from the previous step of an
+                adiabatic schedule, reduces the number of iterations.
+            sigma (float): If given, the eigenvalues closest to ``sigma`` are
+                calculated using shift-invert mode, otherwise the lowest ones.
+                See :meth:`qibo.backends.abstract.Backend.calculate_partial_eigenvectors`
+                for more details.
+
+        Returns:
+            Eigenvalues in ascending order and a tensor with the corresponding
+            eigenvectors as columns.
+        """
+        raise_error(NotImplementedError)
+
     def ground_state(self):
         """Computes the ground state of the Hamiltonian.
 
@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 
 from qibo.config import raise_error
 from qibo.hamiltonians import hamiltonians, terms
+from qibo.hamiltonians.abstract import AbstractHamiltonian
 
 
 class AdiabaticHamiltonian(ABC):
@@ -56,6 +57,179 @@ class AdiabaticHamiltonian(ABC):
         raise_error(NotImplementedError)
 
 
+class InterpolatedHamiltonian(hamiltonians.Hamiltonian):
+    """Hamiltonian ``(1 - s) * H0 + s * H1`` for a fixed value of ``s``.
+
+    Returned when an adiabatic Hamiltonian is called at a given time. The
+    Hamiltonian is applied to states as ``(1 - s) * (H0 @ state) + s * (H1 @ state)``
+    without constructing its matrix. The matrix is constructed only when it
+    is needed, for example to calculate the exponential or the eigenvalues,
+    and is written to a buffer that is shared by all Hamiltonians of the
+    same adiabatic evolution. Therefore the buffered matrix of a previous
+    time step is overwritten when the matrix of a different time is needed.
+    While the buffer holds the matrix of this Hamiltonian, it is also used to
+    apply the Hamiltonian to states. The public :attr:`matrix` returns a copy
+    of the buffer, so that it is not modified by later time steps.
+
+    Args:
+        h0, h1: Hamiltonian objects at the start and end of the evolution.
+        s (float): Value of the scheduling function.
+        buffer (dict): Buffer shared by all Hamiltonians of the same
+            adiabatic evolution. If ``None`` a new matrix is allocated.
+    """
+
+    def __init__(self, h0, h1, s, buffer=None):
+        AbstractHamiltonian.__init__(self)
+        self.backend = h0.backend
+        self.nqubits = h0.nqubits
+        self.h0, self.h1 = h0, h1
+        self._buffer = {} if buffer is None else buffer
+        self.s = s
+
+    @property
+    def s(self):
+        """Value of the scheduling function.
+
+        It can be updated in place, in which case cached quantities that
+        depend on ``s`` are reset, so that the same object can be reused for
+        different times, for example in :class:`qibo.models.AAVQE`.
+        """
+        return self._s
+
+    @s.setter
+    def s(self, s):
+        self._s = s
+        if self._buffer.get("owner") is self:
+            self._buffer["owner"] = None
+        self._energies = None
+        self._eigenvalues = None
+        self._eigenvectors = None
+        self._exp = {"a": None, "result": None}
+
+    @property
+    def matrix(self):
+        return self.backend.cast(self._buffered_matrix, copy=True)
+
+    @property
+    def _buffered_matrix(self):
+        """Matrix of the Hamiltonian in the shared buffer, used by the solvers.
+
+        The returned array is overwritten when the matrix of a Hamiltonian
+        with different ``s`` is calculated.
+        """
+        if self._buffer.get("owner") is not self:
+            self._buffer["matrix"] = self._calculate_matrix(self._buffer.get("matrix"))
+            self._buffer["owner"] = self
+        return self._buffer["matrix"]
+
+    def _calculate_matrix(self, out=None):
+        import numpy as np
+
+        m0, m1 = self.h0.matrix, self.h1.matrix
+        if not (isinstance(m0, np.ndarray) and isinstance(m1, np.ndarray)):
+            return m0 * (1 - self.s) + m1 * self.s
+
+        dtype = np.result_type(m0.dtype, m1.dtype, np.asarray(self.s).dtype)
+        if out is None or out.dtype != dtype:
+            out = np.empty(m0.shape, dtype=dtype)
+            self._buffer["temp"] = np.empty(m0.shape, dtype=dtype)
+        np.multiply(m0, 1 - self.s, out=out)
+        np.multiply(m1, self.s, out=self._buffer["temp"])
+        np.add(out, self._buffer["temp"], out=out)
+        return out
+
+    @property
+    def dense(self):
+        return self
+
+    def eigenvalues(self, k=6):
+        if self._eigenvalues is None:
+            self._eigenvalues = self.backend.calculate_eigenvalues(
+                self._buffered_matrix, k
+            )
+        return self._eigenvalues
+
+    def eigenvectors(self, k=6):
+        if self._eigenvectors is None:
+            self._eigenvalues, self._eigenvectors = self.backend.calculate_eigenvectors(
+                self._buffered_matrix, k
+            )
+        return self._eigenvectors
+
+    def exp(self, a):
+        if self._exp.get("a") != a:
+            self._exp["a"] = a
+            self._exp["result"] = self.backend.calculate_matrix_exp(
+                a, self._buffered_matrix, self._eigenvectors, self._eigenvalues
+            )
+        return self._exp.get("result")
+
+    @property
+    def energies(self):
+        if self._energies is None:
+            e0, e1 = self.h0.energies, self.h1.energies
+            if e0 is None or e1 is None:
+                self._energies = False
+            else:
+                self._energies = (1 - self.s) * e0 + self.s * e1
+        if self._energies is False:
+            return None
+        return self._energies
+
+    def partial_eigenvectors(self, k=1, v0=None, sigma=None):
+        """Computes ``k`` eigenvalues and eigenvectors without full diagonalization.
+
+        If ``v0`` is not given, the solver is warm-started from the
+        eigenvectors that were last calculated for a Hamiltonian sharing the
+        same buffer, which are close to the current ones when the schedule
+        changes slowly. If ``H0`` or ``H1`` are symbolic, the Hamiltonian is
+        applied to states without constructing its matrix, unless
+        shift-invert mode is used.
+        """
+        from qibo.hamiltonians.hamiltonians import _linear_operator
+
+        if v0 is None:
+            v0 = self._buffer.get("eigenvectors")
+        symbolic = isinstance(self.h0, hamiltonians.SymbolicHamiltonian) or isinstance(
+            self.h1, hamiltonians.SymbolicHamiltonian
+        )
+        if symbolic and sigma is None:
+            matrix = _linear_operator(self)
+        else:
+            matrix = self._buffered_matrix
+        eigenvalues, eigenvectors = self.backend.calculate_partial_eigenvectors(
+            matrix, k, v0, sigma
+        )
+        if sigma is None:
+            self._buffer["eigenvectors"] = eigenvectors
+        return eigenvalues, eigenvectors
+
+    def _to_hamiltonian(self):
+        return hamiltonians.Hamiltonian(self.nqubits, self.matrix, backend=self.backend)
+
+    def __add__(self, o):
+        return self._to_hamiltonian() + o
+
+    def __sub__(self, o):
+        return self._to_hamiltonian() - o
+
+    def __rsub__(self, o):
+        return o - self._to_hamiltonian()
+
+    def __mul__(self, o):
+        return self._to_hamiltonian() * o
+
+    def __matmul__(self, o):
+        if isinstance(o, self.backend.tensor_types):
+            if self._buffer.get("owner") is self:
+                # matrix was already calculated for this ``s``
+                return self.backend.calculate_hamiltonian_state_product(
+                    self._buffer["matrix"], o
+                )
+            return (1 - self.s) * (self.h0 @ o) + self.s * (self.h1 @ o)
+        return self._to_hamiltonian() @ o
+
+
 class BaseAdiabaticHamiltonian:
     """Adiabatic Hamiltonian that is a sum of :class:`qibo.hamiltonians.hamiltonians.Hamiltonian`."""
 
@@ -72,6 +246,7 @@ class BaseAdiabaticHamiltonian:
         self.h0, self.h1 = h0, h1
         self.schedule = None
         self.total_time = None
+        self._buffer = {}
 
     def ground_state(self):
         return self.h0.ground_state()
@@ -80,8 +255,9 @@ class BaseAdiabaticHamiltonian:
         """Hamiltonian object corresponding to the given time.
 
         Returns:
-            A :class:`qibo.hamiltonians.hamiltonians.Hamiltonian` object corresponding
-            to the adiabatic Hamiltonian at a given time.
+            A :class:`qibo.hamiltonians.adiabatic.InterpolatedHamiltonian` object
+            corresponding to the adiabatic Hamiltonian at a given time.
+            This is applied to states without constructing its matrix.
         """
         if t == 0:
             return self.h0
@@ -94,7 +270,7 @@ class BaseAdiabaticHamiltonian:
                 "scheduling.",
             )
         st = self.schedule(t / self.total_time)  # pylint: disable=E1102
-        return self.h0 * (1 - st) + self.h1 * st
+        return InterpolatedHamiltonian(self.h0, self.h1, st, self._buffer)
 
     def circuit(self, dt, accelerators=None, t=0):  # pragma: no cover
         raise_error(
@@ -116,8 +292,8 @@ class TrotterCircuit(hamiltonians.TrotterCircuit):
         recreating the circuit and gates.
         """
         params = {
-            gate: group.to_term(coefficients).exp(dt / 2.0)
-            for gate, group in self.gates.items()
+            gate: group.exp(c * dt, coefficients)
+            for gate, (group, c) in self.gates.items()
         }
         self.dt = dt
         self.circuit.set_parameters(params)
@@ -129,6 +305,7 @@ class SymbolicAdiabaticHamiltonian(BaseAdiabaticHamiltonian):
     def __init__(self, h0, h1):
         super().__init__(h0, h1)
         self.trotter_circuit = None
+        self._trotter_circuits = {}
         self.groups0 = terms.TermGroup.from_terms(self.h0.terms)
         self.groups1 = terms.TermGroup.from_terms(self.h1.terms)
         all_terms = []
@@ -142,7 +319,7 @@ class SymbolicAdiabaticHamiltonian(BaseAdiabaticHamiltonian):
                 all_terms.append(term)
         self.groups = terms.TermGroup.from_terms(all_terms)
 
-    def circuit(self, dt, accelerators=None, t=0):
+    def circuit(self, dt, accelerators=None, t=0, order=2):
         """Circuit that implements the Trotterized evolution under the adiabatic Hamiltonian.
 
         Args:
@@ -150,14 +327,21 @@ class SymbolicAdiabaticHamiltonian(BaseAdiabaticHamiltonian):
             accelerators (dict): Dictionary with accelerators for distributed
                 circuits.
             t (float): Time that the Hamiltonian should be calculated.
+            order (int): Order of the Trotter-Suzuki formula (1, 2 or 4).
 
         Returns:
             A :class:`qibo.models.Circuit` implementing the Trotterized evolution.
         """
-        if self.trotter_circuit is None:
-            self.trotter_circuit = TrotterCircuit(
-                self.groups, dt, self.nqubits, accelerators
+        if order == "qdrift":
+            raise_error(
+                NotImplementedError,
+                "qDRIFT is not implemented for adiabatic Hamiltonians.",
+            )
+        if order not in self._trotter_circuits:
+            self._trotter_circuits[order] = TrotterCircuit(
+                self.groups, dt, self.nqubits, accelerators, order
             )
+        self.trotter_circuit = self._trotter_circuits[order]
         st = (
             self.schedule(t / self.total_time) if t != 0 else 0
         )  # pylint: disable=E1102
@@ -1,6 +1,6 @@
 import sympy
 
-from qibo.config import EINSUM_CHARS, log, raise_error
+from qibo.config import log, raise_error
 from qibo.hamiltonians.abstract import AbstractHamiltonian
 from qibo.symbols import Z
 
@@ -17,6 +17,9 @@ class Hamiltonian(AbstractHamiltonian):
             supported.
     """
 
+    FULL_DIAGONALIZATION_QUBITS = 10
+    """Maximum number of qubits for which :meth:`ground_state` diagonalizes the full matrix."""
+
     def __init__(self, nqubits, matrix=None, backend=None):
         if backend is None:  # pragma: no cover
             from qibo.backends import GlobalBackend
@@ -64,6 +67,7 @@ class Hamiltonian(AbstractHamiltonian):
                 "".format(self.nqubits, shape),
             )
         self._matrix = m
+        self._energies = None
 
     @classmethod
     def from_symbolic(cls, symbolic_hamiltonian, symbol_map, backend=None):
@@ -102,6 +106,29 @@ class Hamiltonian(AbstractHamiltonian):
             )
         return self._eigenvectors
 
+    def partial_eigenvectors(self, k=1, v0=None, sigma=None):
+        return self.backend.calculate_partial_eigenvectors(self.matrix, k, v0, sigma)
+
+    def ground_state(self):
+        """Computes the ground state of the Hamiltonian.
+
+        If the eigenvectors were already calculated, or the Hamiltonian has
+        at most :attr:`FULL_DIAGONALIZATION_QUBITS` qubits, the eigenvector of
+        the full diagonalization that corresponds to the lowest energy is
+        returned. Otherwise only the lowest eigenvector is calculated using
+        :meth:`qibo.hamiltonians.Hamiltonian.partial_eigenvectors`.
+        In both cases the global phase is fixed so that the largest element
+        of the vector is real and positive.
+        """
+        if self._eigenvectors is None and (
+            self.nqubits <= self.FULL_DIAGONALIZATION_QUBITS
+        ):
+            self.eigenvectors()
+        if self._eigenvectors is not None:
+            return _fix_phase(self.backend, self._eigenvectors[:, 0])
+        _, eigenvectors = self.partial_eigenvectors(k=1)
+        return _fix_phase(self.backend, eigenvectors[:, 0])
+
     def exp(self, a):
         if self._exp.get("a") != a:
             self._exp["a"] = a
@@ -110,6 +137,39 @@ class Hamiltonian(AbstractHamiltonian):
             )
         return self._exp.get("result")
 
+    @property
+    def energies(self):
+        """Energies of all computational basis states if the Hamiltonian is diagonal.
+
+        Calculated once from the diagonal of the matrix and cached. Used by
+        :class:`qibo.models.QAOA` to apply the problem Hamiltonian exponential
+        as elementwise phases.
+
+        Returns:
+            Real ``np.ndarray`` of length ``2 ** nqubits``, or ``None`` if the
+            matrix has non-zero off-diagonal elements.
+        """
+        if self._energies is None:
+            import numpy as np
+
+            matrix = self.matrix
+            if self.backend.issparse(matrix):
+                if not hasattr(matrix, "tocoo"):  # pragma: no cover
+                    # ``tf.sparse`` matrices are not checked
+                    self._energies = False
+                    return None
+                coo = matrix.tocoo()
+                diagonal = matrix.diagonal()
+                offdiagonal = np.count_nonzero(coo.data[coo.row != coo.col])
+            else:
+                matrix = self.backend.to_numpy(matrix)
+                diagonal = np.diagonal(matrix)
+                offdiagonal = np.count_nonzero(matrix) - np.count_nonzero(diagonal)
+            self._energies = False if offdiagonal else np.real(diagonal).copy()
+        if self._energies is False:
+            return None
+        return self._energies
+
     def expectation(self, state, normalize=False):
         if isinstance(state, self.backend.tensor_types):
             shape = tuple(state.shape)
@@ -250,6 +310,45 @@ class Hamiltonian(AbstractHamiltonian):
             )
 
 
+def _trotter_sequence(groups, order):
+    """Sequence of exponentials that implements a Trotter-Suzuki step.
+
+    Args:
+        groups (list): List of :class:`qibo.hamiltonians.terms.TermGroup` objects.
+        order (int): Order of the Trotter-Suzuki formula (1, 2 or 4).
+
+    Returns:
+        List of ``(group, coefficient)`` pairs, each corresponding to the
+        exponential :math:`e^{-i c \\delta t H_g}` of the group terms.
+        Adjacent exponentials of the same group are fused to a single one.
+    """
+    if order == 1:
+        sequence = [(group, 1.0) for group in groups]
+    elif order == 2:
+        sequence = [(group, 0.5) for group in groups]
+        sequence.extend((group, 0.5) for group in groups[::-1])
+    elif order == 4:
+        # Suzuki's recursive formula from second order steps
+        p = 1.0 / (4.0 - 4.0 ** (1.0 / 3.0))
+        step = _trotter_sequence(groups, 2)
+        sequence = []
+        for c in (p, p, 1 - 4 * p, p, p):
+            sequence.extend((group, c * x) for group, x in step)
+    else:
+        raise_error(
+            ValueError,
+            "Trotter-Suzuki formula of order {} is not available.".format(order),
+        )
+
+    fused = []
+    for group, c in sequence:
+        if fused and fused[-1][0] is group:
+            fused[-1] = (group, fused[-1][1] + c)
+        else:
+            fused.append((group, c))
+    return fused
+
+
 class TrotterCircuit:
     """Object that caches the Trotterized evolution circuit.
 
@@ -265,28 +364,104 @@ class TrotterCircuit:
         nqubits (int): Number of qubits in the system that evolves.
         accelerators (dict): Dictionary with accelerators for distributed
             circuits.
+        order: Order of the Trotter-Suzuki formula used for each step. Can be
+            1, 2 or 4, or ``"qdrift"`` for the randomized qDRIFT protocol
+            (`arXiv:1811.08017 <https://arxiv.org/abs/1811.08017>`_), in which
+            case a new circuit is sampled every time :meth:`set` is called.
     """
 
-    def __init__(self, groups, dt, nqubits, accelerators):
-        from itertools import chain
-
+    def __init__(self, groups, dt, nqubits, accelerators, order=2):
         from qibo.models import Circuit
 
         self.gates = {}
         self.dt = dt
-        self.circuit = Circuit(nqubits, accelerators=accelerators)
-        for group in chain(groups, groups[::-1]):
-            gate = group.term.expgate(dt / 2.0)
-            self.gates[gate] = group
-            self.circuit.add(gate)
+        self.order = order
+        self.nqubits = nqubits
+        self.accelerators = accelerators
+        self._boundary = None
+        if order == "qdrift":
+            import numpy as np
+
+            self.groups = groups
+            self.norms = np.array([np.linalg.norm(g.term.matrix, 2) for g in groups])
+            self.sample(dt)
+        else:
+            self.sequence = _trotter_sequence(groups, order)
+            self.circuit, self.gates = self._create_circuit(self.sequence)
+
+    def _create_circuit(self, sequence):
+        """Circuit of the exponentials in ``sequence`` and the map from its gates to ``(group, coefficient)``."""
+        from qibo.models import Circuit
+
+        circuit = Circuit(self.nqubits, accelerators=self.accelerators)
+        gates = {}
+        for group, c in sequence:
+            gate = group.term.expgate(c * self.dt)
+            gates[gate] = (group, c)
+            circuit.add(gate)
+        return circuit, gates
+
+    def boundary_circuits(self):
+        """Circuits for applying consecutive steps with fused step boundaries.
+
+        If a step starts and ends with an exponential of the same group, as in
+        the second and fourth order formulas, the last exponential of each
+        step is fused with the first exponential of the following step.
+        Applying ``n`` steps is then equivalent to applying the first circuit
+        once, the second ``n - 1`` times and the third once.
+
+        Returns:
+            Tuple of three :class:`qibo.models.Circuit` that apply the first
+            exponential of a step, a step without its first exponential and
+            with its last exponential fused to the first exponential of the
+            next step, and a step without its first exponential. ``None`` if
+            the step boundaries cannot be fused.
+        """
+        if self.order == "qdrift":
+            return None
+        (first, c0), (last, c1) = self.sequence[0], self.sequence[-1]
+        if len(self.sequence) < 2 or first is not last:
+            return None
+        if self._boundary is None:
+            middle = self.sequence[1:-1] + [(first, c0 + c1)]
+            self._boundary = [
+                self._create_circuit(sequence)
+                for sequence in ([self.sequence[0]], middle, self.sequence[1:])
+            ]
+        return tuple(circuit for circuit, _ in self._boundary)
+
+    def sample(self, dt):
+        """Samples a new qDRIFT circuit for the given time step.
+
+        Each of the ``len(groups)`` exponentials of the step is chosen randomly
+        with probability proportional to the norm of the group.
+        """
+        import numpy as np
+
+        from qibo.models import Circuit
+
+        total = np.sum(self.norms)
+        nsamples = len(self.groups)
+        samples = np.random.choice(nsamples, size=nsamples, p=self.norms / total)
+        self.circuit = Circuit(self.nqubits, accelerators=self.accelerators)
+        for i in samples:
+            x = total * dt / (nsamples * self.norms[i])
+            self.circuit.add(self.groups[i].term.expgate(x))
+        self.dt = dt
 
     def set(self, dt):
-        if self.dt != dt:
+        if self.order == "qdrift":
+            self.sample(dt)
+        elif self.dt != dt:
             params = {
-                gate: group.term.exp(dt / 2.0) for gate, group in self.gates.items()
+                gate: group.term.exp(c * dt) for gate, (group, c) in self.gates.items()
             }
             self.dt = dt
             self.circuit.set_parameters(params)
+            for circuit, gates in self._boundary or []:
+                circuit.set_parameters(
+                    {gate: group.term.exp(c * dt) for gate, (group, c) in gates.items()}
+                )
 
 
 class SymbolicHamiltonian(AbstractHamiltonian):
@@ -322,12 +497,16 @@ class SymbolicHamiltonian(AbstractHamiltonian):
         super().__init__()
         self._form = None
         self._terms = None
+        self._pauli_sum = None
+        self._measurement_groups = None
+        self._energies = None
         self.constant = 0  # used only when we perform calculations using ``_terms``
         self._dense = None
         self.symbol_map = symbol_map
         # if a symbol in the given form is not a Qibo symbol it must be
         # included in the ``symbol_map``
         self.trotter_circuit = None
+        self._trotter_circuits = {}
         from qibo.symbols import Symbol
 
         self._qiboSymbol = Symbol  # also used in ``self._get_symbol_matrix``
@@ -340,6 +519,38 @@ class SymbolicHamiltonian(AbstractHamiltonian):
         if form is not None:
             self.form = form
 
+    @classmethod
+    def from_pauli_sum(cls, pauli_sum, backend=None):
+        """Creates the Hamiltonian from a :class:`qibo.hamiltonians.terms.PauliSum`.
+
+        The ``terms`` of the resulting Hamiltonian are created directly from
+        the Pauli strings, avoiding the ``sympy.expand`` call, and the given
+        ``pauli_sum`` is used to multiply it to states. The ``sympy`` form is
+        created from the terms only if it is needed, for example when
+        multiplying with another symbolic Hamiltonian.
+        See :class:`qibo.hamiltonians.terms.PauliSumBuilder` for constructing
+        Pauli sums term by term.
+
+        Args:
+            pauli_sum (:class:`qibo.hamiltonians.terms.PauliSum`): Sum of Pauli strings.
+        """
+        import numpy as np
+
+        ham = cls(backend=backend)
+        identity = (pauli_sum.xmasks | pauli_sum.zmasks) == 0
+        ham.terms = pauli_sum.to_terms()
+        ham.constant = complex(np.sum(pauli_sum.coefficients[identity]))
+        ham.nqubits = max(ham.nqubits, pauli_sum.nqubits)
+        # the Pauli sum without identities corresponds to ``terms``
+        indices = np.flatnonzero(~identity)
+        ham._pauli_sum = pauli_sum.__class__(
+            pauli_sum.xmasks[indices],
+            pauli_sum.zmasks[indices],
+            pauli_sum.coefficients[indices],
+            ham.nqubits,
+        )
+        return ham
+
     @property
     def dense(self):
         """Creates the equivalent :class:`qibo.hamiltonians.MatrixHamiltonian`."""
@@ -361,6 +572,17 @@ class SymbolicHamiltonian(AbstractHamiltonian):
 
     @property
     def form(self):
+        if self._form is None and self._terms is not None:
+            from qibo.hamiltonians.terms import SymbolicTerm
+
+            if not all(isinstance(term, SymbolicTerm) for term in self._terms):
+                return None
+            # Hamiltonians created from symbolic terms get a form only when needed
+            form = sum(
+                (term.coefficient * sympy.Mul(*term.factors) for term in self._terms),
+                sympy.Integer(0),
+            )
+            self._form = form + self.constant
         return self._form
 
     @form.setter
@@ -418,7 +640,29 @@ class SymbolicHamiltonian(AbstractHamiltonian):
     @terms.setter
     def terms(self, terms):
         self._terms = terms
-        self.nqubits = max(q for term in self._terms for q in term.target_qubits) + 1
+        self._pauli_sum = None
+        self._measurement_groups = None
+        self._energies = None
+        self.nqubits = (
+            max((q for term in self._terms for q in term.target_qubits), default=0) + 1
+        )
+
+    @property
+    def pauli_sum(self):
+        """:class:`qibo.hamiltonians.terms.PauliSum` representation of the ``terms``.
+
+        Used to multiply the Hamiltonian to states without applying the terms
+        as gates. It is ``None`` if some of the terms is not a product of
+        Pauli operators.
+        """
+        if self._pauli_sum is None:
+            from qibo.hamiltonians.terms import PauliSum
+
+            pauli_sum = PauliSum.from_terms(self.terms, self.nqubits)
+            self._pauli_sum = False if pauli_sum is None else pauli_sum
+        if self._pauli_sum is False:
+            return None
+        return self._pauli_sum
 
     @property
     def matrix(self):
@@ -431,12 +675,87 @@ class SymbolicHamiltonian(AbstractHamiltonian):
     def eigenvectors(self, k=6):
         return self.dense.eigenvectors(k)
 
+    def partial_eigenvectors(self, k=1, v0=None, sigma=None):
+        """Computes ``k`` eigenvalues and eigenvectors without full diagonalization.
+
+        If the dense form was not calculated, the Hamiltonian is used as a
+        matrix-free ``scipy.sparse.linalg.LinearOperator`` that multiplies
+        states using :meth:`qibo.hamiltonians.SymbolicHamiltonian.apply_gates`.
+        Shift-invert mode (``sigma``) requires the dense form.
+        See :meth:`qibo.hamiltonians.abstract.AbstractHamiltonian.partial_eigenvectors`.
+        """
+        if self._dense is not None or sigma is not None:
+            return self.dense.partial_eigenvectors(k, v0, sigma)
+        matrix = _linear_operator(self)
+        return self.backend.calculate_partial_eigenvectors(matrix, k, v0, sigma)
+
     def ground_state(self):
-        return self.eigenvectors()[:, 0]
+        if self._dense is not None:
+            return self.dense.ground_state()
+        _, eigenvectors = self.partial_eigenvectors(k=1)
+        return _fix_phase(self.backend, eigenvectors[:, 0])
 
     def exp(self, a):
         return self.dense.exp(a)
 
+    @property
+    def energies(self):
+        """Energies of all computational basis states if the Hamiltonian is diagonal.
+
+        Calculated once from the ``terms`` without constructing the dense
+        matrix and cached. Terms that are products of Pauli operators are
+        evaluated as parities of the basis indices, other terms are
+        embedded using the diagonal of their matrix.
+
+        Returns:
+            Real ``np.ndarray`` of length ``2 ** nqubits``, or ``None`` if some
+            of the terms is not diagonal.
+        """
+        if self._energies is None:
+            self._energies = self._calculate_energies()
+        if self._energies is False:
+            return None
+        return self._energies
+
+    def _calculate_energies(self):
+        import numpy as np
+
+        if self.pauli_sum is not None:
+            if np.any(self.pauli_sum.xmasks):
+                return False
+        else:
+            for term in self.terms:
+                tmat = self.backend.to_numpy(term.matrix)
+                if np.count_nonzero(tmat) != np.count_nonzero(np.diagonal(tmat)):
+                    return False
+        return self.diagonal()
+
+    def diagonal(self):
+        """Diagonal elements ``<i|H|i>`` of the Hamiltonian in the computational basis.
+
+        Calculated from the ``terms`` without constructing the dense matrix,
+        in the same way as :attr:`qibo.hamiltonians.SymbolicHamiltonian.energies`,
+        but also for Hamiltonians that are not diagonal. Pauli strings that
+        contain X or Y factors do not contribute.
+
+        Returns:
+            Real ``np.ndarray`` of length ``2 ** nqubits``.
+        """
+        import numpy as np
+
+        if self.pauli_sum is not None:
+            diagonal = self.pauli_sum.diagonal()
+        else:
+            diagonal = np.zeros(2**self.nqubits, dtype=complex)
+            for term in self.terms:
+                tdiag = np.diagonal(self.backend.to_numpy(term.matrix))
+                targets = tuple(term.target_qubits)
+                others = [q for q in range(self.nqubits) if q not in targets]
+                local = _scatter_indices(targets, self.nqubits)
+                rest = _scatter_indices(others, self.nqubits)
+                diagonal[local[:, np.newaxis] + rest] += tdiag[:, np.newaxis]
+        return np.real(diagonal + self.constant)
+
     def _get_symbol_matrix(self, term):
         """Calculates numerical matrix corresponding to symbolic expression.
 
@@ -521,28 +840,37 @@ class SymbolicHamiltonian(AbstractHamiltonian):
         return Hamiltonian(self.nqubits, matrix, backend=self.backend)
 
     def _calculate_dense_from_terms(self):
-        """Calculates equivalent :class:`qibo.core.hamiltonians.Hamiltonian` using the term representation."""
-        from itertools import chain
+        """Calculates equivalent :class:`qibo.core.hamiltonians.Hamiltonian` using the term representation.
 
+        Terms acting on the same qubits are summed before being embedded to the
+        full matrix. Each group of terms is then added to a single preallocated
+        matrix by scattering its elements using index arithmetic, instead of
+        creating and summing a full matrix per term.
+        """
         import numpy as np
 
-        if 2 * self.nqubits > len(EINSUM_CHARS):  # pragma: no cover
-            # case not tested because it only happens in large examples
-            raise_error(NotImplementedError, "Not enough einsum characters.")
-
-        matrix = 0
-        chars = EINSUM_CHARS[: 2 * self.nqubits]
-        for term in self.terms:
-            ntargets = len(term.target_qubits)
-            tmat = np.reshape(term.matrix, 2 * ntargets * (2,))
-            n = self.nqubits - ntargets
-            emat = np.reshape(np.eye(2**n, dtype=tmat.dtype), 2 * n * (2,))
-            gen = lambda x: (chars[i + x] for i in term.target_qubits)
-            tc = "".join(chain(gen(0), gen(self.nqubits)))
-            ec = "".join(c for c in chars if c not in tc)
-            matrix += np.einsum(f"{tc},{ec}->{chars}", tmat, emat)
-        matrix = np.reshape(matrix, 2 * (2**self.nqubits,))
-        return Hamiltonian(self.nqubits, matrix, backend=self.backend) + self.constant
+        if self.pauli_sum is not None:
+            matrix = self.pauli_sum.matrix()
+        else:
+            groups = {}
+            for term in self.terms:
+                targets = tuple(term.target_qubits)
+                if targets in groups:
+                    groups[targets] = groups[targets] + term.matrix
+                else:
+                    groups[targets] = term.matrix
+
+            matrix = np.zeros(2 * (2**self.nqubits,), dtype=complex)
+            for targets, tmat in groups.items():
+                others = [q for q in range(self.nqubits) if q not in targets]
+                local = _scatter_indices(targets, self.nqubits)
+                rest = _scatter_indices(others, self.nqubits)
+                rows = local[:, np.newaxis, np.newaxis] + rest
+                columns = local[np.newaxis, :, np.newaxis] + rest
+                matrix[rows, columns] += tmat[:, :, np.newaxis]
+
+        matrix[np.diag_indices_from(matrix)] += self.constant
+        return Hamiltonian(self.nqubits, matrix, backend=self.backend)
 
     def calculate_dense(self):
         if self._terms is None:
@@ -555,8 +883,6 @@ class SymbolicHamiltonian(AbstractHamiltonian):
         return Hamiltonian.expectation(self, state, normalize)
 
     def expectation_from_samples(self, freq, qubit_map=None):
-        import numpy as np
-
         terms = self.terms
         for term in terms:
             for factor in term.factors:
@@ -566,29 +892,172 @@ class SymbolicHamiltonian(AbstractHamiltonian):
                     )
             if len(term.factors) != len(set(term.factors)):
                 raise_error(NotImplementedError, "Z^k is not implemented since Z^2=I.")
-        keys = list(freq.keys())
-        counts = np.array(list(freq.values())) / sum(freq.values())
-        coeff = list(self.form.as_coefficients_dict().values())
-        qubits = []
-        for term in terms:
-            qubits_term = []
-            for k in term.target_qubits:
-                qubits_term.append(k)
-            qubits.append(qubits_term)
         if qubit_map is None:
-            qubit_map = list(range(len(keys[0])))
-        expval = 0
-        for j, q in enumerate(qubits):
-            subk = []
-            expval_q = 0
-            for i, k in enumerate(keys):
-                subk = [int(k[qubit_map.index(s)]) for s in q]
-                expval_k = 1
-                if subk.count(1) % 2 == 1:
-                    expval_k = -1
-                expval_q += expval_k * counts[i]
-            expval += expval_q * float(coeff[j])
-        return expval
+            qubit_map = list(range(len(next(iter(freq.keys())))))
+        outcomes, probabilities = _decode_frequencies(freq, qubit_map)
+        expval = self.pauli_sum.sample_expectation(outcomes, probabilities)
+        return float((expval + self.constant).real)
+
+    @property
+    def measurement_groups(self):
+        """Groups of qubit-wise commuting strings of the :attr:`pauli_sum`.
+
+        Each group is an array of string indices that can be estimated from the
+        same measurement samples (see
+        :meth:`qibo.hamiltonians.terms.PauliSum.qubitwise_commuting_groups`).
+        """
+        if self._measurement_groups is None:
+            if self.pauli_sum is None:
+                raise_error(
+                    NotImplementedError,
+                    "Measurement groups are available only for Hamiltonians "
+                    "that consist of Pauli strings.",
+                )
+            self._measurement_groups = self.pauli_sum.qubitwise_commuting_groups()
+        return self._measurement_groups
+
+    def _measurement_circuit(self, group, **kwargs):
+        """Basis rotation and measurement circuit of a measurement group."""
+        from qibo import gates
+        from qibo.models import Circuit
+
+        circuit = Circuit(**kwargs)
+        for q, pauli in self.pauli_sum.measurement_basis(group).items():
+            if pauli == "Y":
+                circuit.add(gates.SDG(q))
+            if pauli != "Z":
+                circuit.add(gates.H(q))
+        circuit.add(gates.M(*range(self.nqubits)))
+        return circuit
+
+    def measurement_circuits(self, density_matrix=False):
+        """Circuits that rotate and measure the qubits for each of the :attr:`measurement_groups`.
+
+        Adding these circuits to a state preparation circuit allows estimating
+        the expectation value of the Hamiltonian using one circuit execution
+        per group instead of one per term.
+
+        Args:
+            density_matrix (bool): If ``True`` the circuits are created for
+                density matrix simulation.
+
+        Returns:
+            List of :class:`qibo.models.circuit.Circuit` objects.
+        """
+        return [
+            self._measurement_circuit(
+                group, nqubits=self.nqubits, density_matrix=density_matrix
+            )
+            for group in self.measurement_groups
+        ]
+
+    def expectation_from_circuit(self, circuit, nshots=1000):
+        """Estimates the expectation value on the state prepared by a circuit using measurements.
+
+        The circuit is executed once for each of the :attr:`measurement_groups`,
+        after rotating the qubits so that all strings of the group are
+        measured in the computational basis. The strings are then evaluated
+        from the parities of the sampled bitstrings.
+
+        Args:
+            circuit (:class:`qibo.models.circuit.Circuit`): Circuit that prepares
+                the state. It should not contain measurements.
+            nshots (int): Number of shots for each group. A list with a different
+                number of shots for each group is also accepted.
+
+        Returns:
+            The estimated expectation value as a float.
+        """
+        if circuit.measurements:
+            raise_error(
+                ValueError,
+                "Cannot estimate expectation value for a circuit that "
+                "already contains measurements.",
+            )
+        groups = self.measurement_groups
+        if isinstance(nshots, int):
+            nshots = len(groups) * [nshots]
+        if len(nshots) != len(groups):
+            raise_error(
+                ValueError,
+                "Number of shots was given for {} groups but the "
+                "Hamiltonian has {} measurement groups."
+                "".format(len(nshots), len(groups)),
+            )
+        expval = self.constant
+        for group, shots in zip(groups, nshots):
+            outcomes, probabilities = self._sample_group(circuit, group, shots)
+            expval += self.pauli_sum.sample_expectation(outcomes, probabilities, group)
+        return float(expval.real)
+
+    def allocate_shots(self, nshots, circuit=None, pilot_nshots=100):
+        """Distributes a total number of shots to the :attr:`measurement_groups`.
+
+        The variance of the estimate of
+        :meth:`qibo.hamiltonians.SymbolicHamiltonian.expectation_from_circuit`
+        is :math:`\\sum_g \\sigma_g^2 / n_g`, where :math:`\\sigma_g` is the
+        standard deviation of a single shot estimate of group :math:`g` and
+        :math:`n_g` the number of shots it receives. For a fixed total number
+        of shots this is minimized by :math:`n_g \\propto \\sigma_g`.
+
+        If no circuit is given, :math:`\\sigma_g` is replaced by its upper bound,
+        the sum of the absolute coefficients of the group strings. Otherwise it
+        is estimated from a pilot run of the circuit, which uses
+        ``pilot_nshots`` additional shots for every group.
+
+        Args:
+            nshots (int): Total number of shots to distribute.
+            circuit (:class:`qibo.models.circuit.Circuit`): Optional circuit that
+                prepares the state, used to estimate the variances.
+            pilot_nshots (int): Number of shots per group used in the pilot run.
+
+        Returns:
+            List with the number of shots of each group, which can be passed to
+            :meth:`qibo.hamiltonians.SymbolicHamiltonian.expectation_from_circuit`.
+            Every group receives at least one shot.
+        """
+        import numpy as np
+
+        groups = self.measurement_groups
+        if nshots < len(groups):
+            raise_error(
+                ValueError,
+                "Cannot distribute {} shots to {} measurement groups."
+                "".format(nshots, len(groups)),
+            )
+        coefficients = self.pauli_sum.coefficients
+        if circuit is None:
+            weights = [np.sum(np.abs(coefficients[group])) for group in groups]
+        else:
+            weights = []
+            for group in groups:
+                outcomes, probabilities = self._sample_group(
+                    circuit, group, pilot_nshots
+                )
+                values = self.pauli_sum.sample_values(outcomes, group).real
+                variance = probabilities @ values**2 - (probabilities @ values) ** 2
+                weights.append(np.sqrt(max(variance, 0)))
+        weights = np.array(weights)
+        if not weights.sum():
+            weights = np.ones(len(groups))
+
+        # reserve one shot per group and distribute the rest proportionally,
+        # rounding according to the largest remainders
+        ideal = (nshots - len(groups)) * weights / weights.sum()
+        shots = np.floor(ideal).astype(int)
+        remainder = nshots - len(groups) - shots.sum()
+        shots[np.argsort(shots - ideal, kind="stable")[:remainder]] += 1
+        return [int(n) + 1 for n in shots]
+
+    def _sample_group(self, circuit, group, nshots):
+        """Samples a circuit in the measurement basis of a group.
+
+        Helper method for ``expectation_from_circuit`` and ``allocate_shots``.
+        """
+        measurement = self._measurement_circuit(group, **circuit.init_kwargs)
+        result = self.backend.execute_circuit(circuit + measurement, nshots=nshots)
+        freq = result.frequencies(binary=True)
+        return _decode_frequencies(freq, list(range(self.nqubits)))
 
     def __add__(self, o):
         if isinstance(o, self.__class__):
@@ -603,7 +1072,10 @@ class SymbolicHamiltonian(AbstractHamiltonian):
             if self._form is not None and o._form is not None:
                 new_ham.form = self.form + o.form
                 new_ham.symbol_map.update(o.symbol_map)
-            if self._terms is not None and o._terms is not None:
+            if (self._terms is not None and o._terms is not None) or (
+                new_ham._form is None
+            ):
+                # Hamiltonians without form are added using their terms
                 new_ham.terms = self.terms + o.terms
                 new_ham.constant = self.constant + o.constant
             if self._dense is not None and o._dense is not None:
@@ -643,7 +1115,9 @@ class SymbolicHamiltonian(AbstractHamiltonian):
             if self._form is not None and o._form is not None:
                 new_ham.form = self.form - o.form
                 new_ham.symbol_map.update(o.symbol_map)
-            if self._terms is not None and o._terms is not None:
+            if (self._terms is not None and o._terms is not None) or (
+                new_ham._form is None
+            ):
                 new_ham.terms = self.terms + [-1 * x for x in o.terms]
                 new_ham.constant = self.constant - o.constant
             if self._dense is not None and o._dense is not None:
@@ -710,15 +1184,22 @@ class SymbolicHamiltonian(AbstractHamiltonian):
     def apply_gates(self, state, density_matrix=False):
         """Applies gates corresponding to the Hamiltonian terms to a given state.
         Helper method for ``__matmul__``.
+
+        If all terms are Pauli strings the gates are not used and the
+        :class:`qibo.hamiltonians.terms.PauliSum` representation is applied
+        directly using bit flips and sign changes.
         """
-        total = 0
-        for term in self.terms:
-            total += term(
-                self.backend,
-                self.backend.cast(state, copy=True),
-                self.nqubits,
-                density_matrix=density_matrix,
-            )
+        if self.pauli_sum is not None:
+            total = self.backend.apply_pauli_sum(self.pauli_sum, state, self.nqubits)
+        else:
+            total = 0
+            for term in self.terms:
+                total += term(
+                    self.backend,
+                    self.backend.cast(state, copy=True),
+                    self.nqubits,
+                    density_matrix=density_matrix,
+                )
         if self.constant:  # pragma: no cover
             total += self.constant * state
         return total
@@ -726,7 +1207,7 @@ class SymbolicHamiltonian(AbstractHamiltonian):
     def __matmul__(self, o):
         """Matrix multiplication with other Hamiltonians or state vectors."""
         if isinstance(o, self.__class__):
-            if self._form is None or o._form is None:
+            if self.form is None or o.form is None:
                 raise_error(
                     NotImplementedError,
                     "Multiplication of symbolic Hamiltonians "
@@ -759,19 +1240,101 @@ class SymbolicHamiltonian(AbstractHamiltonian):
             "Hamiltonian matmul to {} not " "implemented.".format(type(o)),
         )
 
-    def circuit(self, dt, accelerators=None):
-        """Circuit that implements a Trotter step of this Hamiltonian for a given time step ``dt``."""
-        if self.trotter_circuit is None:
+    def circuit(self, dt, accelerators=None, minimize_depth=False, order=2):
+        """Circuit that implements a Trotter step of this Hamiltonian for a given time step ``dt``.
+
+        Circuits are cached separately for each ``order``, so that subsequent
+        calls only update the gate parameters.
+
+        Args:
+            dt (float): Time step of the Trotter step.
+            accelerators (dict): Dictionary with accelerators for distributed
+                circuits.
+            minimize_depth (bool): If ``True`` the term groups are ordered
+                greedily to reduce the circuit depth (see
+                :meth:`qibo.hamiltonians.terms.TermGroup.from_terms`).
+                Used only when the circuit is created for the first time.
+            order: Order of the Trotter-Suzuki formula (1, 2 or 4) or
+                ``"qdrift"``. See :class:`qibo.hamiltonians.hamiltonians.TrotterCircuit`
+                for more details.
+        """
+        if order not in self._trotter_circuits:
             from qibo.hamiltonians.terms import TermGroup
 
-            groups = TermGroup.from_terms(self.terms)
-            self.trotter_circuit = TrotterCircuit(
-                groups, dt, self.nqubits, accelerators
+            groups = TermGroup.from_terms(self.terms, minimize_depth)
+            self._trotter_circuits[order] = TrotterCircuit(
+                groups, dt, self.nqubits, accelerators, order
             )
+        self.trotter_circuit = self._trotter_circuits[order]
         self.trotter_circuit.set(dt)
         return self.trotter_circuit.circuit
 
 
+def _linear_operator(hamiltonian):
+    """``scipy.sparse.linalg.LinearOperator`` that applies the Hamiltonian to states."""
+    import numpy as np
+    from scipy.sparse.linalg import LinearOperator
+
+    backend = hamiltonian.backend
+
+    def matvec(vector):
+        state = backend.cast(np.ravel(vector))
+        return backend.to_numpy(hamiltonian @ state)
+
+    shape = 2 * (2**hamiltonian.nqubits,)
+    return LinearOperator(shape, matvec=matvec, dtype=np.dtype(backend.dtype))
+
+
+def _fix_phase(backend, vector):
+    """Fixes the global phase of an eigenvector so that its largest element is real positive.
+
+    Iterative eigensolvers return eigenvectors with an arbitrary phase
+    that depends on the starting vector.
+    """
+    import numpy as np
+
+    vector = np.array(backend.to_numpy(vector))
+    element = vector[np.argmax(np.abs(vector))]
+    return backend.cast(vector * (np.abs(element) / element))
+
+
+def _scatter_indices(qubits, nqubits):
+    """Indices of the full space that correspond to the basis states of a subset of qubits.
+
+    The element ``i`` of the returned array is the index of the full
+    ``nqubits`` basis state where ``qubits`` are in the state ``i``
+    (with ``qubits[0]`` as the most significant bit) and all other qubits
+    are in ``0``.
+    """
+    import numpy as np
+
+    states = np.arange(2 ** len(qubits))
+    indices = np.zeros_like(states)
+    for i, q in enumerate(qubits):
+        bit = (states >> (len(qubits) - i - 1)) & 1
+        indices += bit << (nqubits - q - 1)
+    return indices
+
+
+def _decode_frequencies(freq, qubit_map):
+    """Converts binary frequencies to integer outcomes where bit ``q`` holds qubit ``q``.
+
+    Args:
+        freq (dict): Dictionary that maps bitstrings to the number of times
+            they were observed.
+        qubit_map (list): Qubit measured at each position of the bitstrings.
+
+    Returns:
+        Integer array with the outcomes and array with their relative frequencies.
+    """
+    import numpy as np
+
+    bits = np.array([[int(b) for b in k] for k in freq.keys()], dtype=np.int64)
+    outcomes = bits @ (1 << np.array(qubit_map, dtype=np.int64))
+    counts = np.array(list(freq.values()))
+    return outcomes, counts / counts.sum()
+
+
 class TrotterHamiltonian:
     """"""
 
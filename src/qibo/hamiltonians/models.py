@@ -1,7 +1,7 @@
 from qibo.backends import matrices
 from qibo.config import raise_error
 from qibo.hamiltonians.hamiltonians import Hamiltonian, SymbolicHamiltonian
-from qibo.hamiltonians.terms import HamiltonianTerm
+from qibo.hamiltonians.terms import HamiltonianTerm, PauliSum
 
 
 def multikron(matrix_list):
@@ -22,16 +22,21 @@ def multikron(matrix_list):
     return h
 
 
-def _build_spin_model(nqubits, matrix, condition):
-    """Helper method for building nearest-neighbor spin model Hamiltonians."""
-    h = sum(
-        multikron(matrix if condition(i, j) else matrices.I for j in range(nqubits))
-        for i in range(nqubits)
-    )
-    return h
+def _build_spin_model(nqubits, paulis, coefficient=1, pairs=True):
+    """Helper method for building the Pauli strings of spin models.
+
+    Returns a list of ``(coefficient, paulis)`` pairs that can be passed to
+    :meth:`qibo.hamiltonians.terms.PauliSum.from_strings`.
+    """
+    if pairs:
+        return [
+            (coefficient, {i: paulis, (i + 1) % nqubits: paulis})
+            for i in range(nqubits)
+        ]
+    return [(coefficient, {i: paulis}) for i in range(nqubits)]
 
 
-def XXZ(nqubits, delta=0.5, dense=True, backend=None):
+def XXZ(nqubits, delta=0.5, dense=True, sparse=False, backend=None):
     """Heisenberg XXZ model with periodic boundary conditions.
 
     .. math::
@@ -43,6 +48,10 @@ def XXZ(nqubits, delta=0.5, dense=True, backend=None):
         dense (bool): If ``True`` it creates the Hamiltonian as a
             :class:`qibo.core.hamiltonians.Hamiltonian`, otherwise it creates
             a :class:`qibo.core.hamiltonians.SymbolicHamiltonian`.
+        sparse (bool): If ``True`` it creates the Hamiltonian as a
+            :class:`qibo.core.hamiltonians.Hamiltonian` that holds a
+            ``scipy.sparse`` CSR matrix, regardless of ``dense``.
+            Available for the numpy and qibojit backends.
 
     Example:
         .. testcode::
@@ -50,12 +59,11 @@ def XXZ(nqubits, delta=0.5, dense=True, backend=None):
             from qibo.hamiltonians import XXZ
             h = XXZ(3) # initialized XXZ model with 3 qubits
     """
-    if dense:
-        condition = lambda i, j: i in {j % nqubits, (j + 1) % nqubits}
-        hx = _build_spin_model(nqubits, matrices.X, condition)
-        hy = _build_spin_model(nqubits, matrices.Y, condition)
-        hz = _build_spin_model(nqubits, matrices.Z, condition)
-        matrix = hx + hy + delta * hz
+    if dense or sparse:
+        terms = _build_spin_model(nqubits, "X")
+        terms.extend(_build_spin_model(nqubits, "Y"))
+        terms.extend(_build_spin_model(nqubits, "Z", delta))
+        matrix = PauliSum.from_strings(terms, nqubits).matrix(sparse)
         return Hamiltonian(nqubits, matrix, backend=backend)
 
     hx = multikron([matrices.X, matrices.X])
@@ -69,21 +77,21 @@ def XXZ(nqubits, delta=0.5, dense=True, backend=None):
     return ham
 
 
-def _OneBodyPauli(nqubits, matrix, dense=True, backend=None):
+def _OneBodyPauli(nqubits, pauli, dense=True, sparse=False, backend=None):
     """Helper method for constracting non-interacting X, Y, Z Hamiltonians."""
-    if dense:
-        condition = lambda i, j: i == j % nqubits
-        ham = -_build_spin_model(nqubits, matrix, condition)
+    if dense or sparse:
+        terms = _build_spin_model(nqubits, pauli, -1, pairs=False)
+        ham = PauliSum.from_strings(terms, nqubits).matrix(sparse)
         return Hamiltonian(nqubits, ham, backend=backend)
 
-    matrix = -matrix
+    matrix = -getattr(matrices, pauli)
     terms = [HamiltonianTerm(matrix, i) for i in range(nqubits)]
     ham = SymbolicHamiltonian(backend=backend)
     ham.terms = terms
     return ham
 
 
-def X(nqubits, dense=True, backend=None):
+def X(nqubits, dense=True, sparse=False, backend=None):
     """Non-interacting Pauli-X Hamiltonian.
 
     .. math::
@@ -94,11 +102,15 @@ def X(nqubits, dense=True, backend=None):
         dense (bool): If ``True`` it creates the Hamiltonian as a
             :class:`qibo.core.hamiltonians.Hamiltonian`, otherwise it creates
             a :class:`qibo.core.hamiltonians.SymbolicHamiltonian`.
+        sparse (bool): If ``True`` it creates the Hamiltonian as a
+            :class:`qibo.core.hamiltonians.Hamiltonian` that holds a
+            ``scipy.sparse`` CSR matrix, regardless of ``dense``.
+            Available for the numpy and qibojit backends.
     """
-    return _OneBodyPauli(nqubits, matrices.X, dense, backend=backend)
+    return _OneBodyPauli(nqubits, "X", dense, sparse, backend=backend)
 
 
-def Y(nqubits, dense=True, backend=None):
+def Y(nqubits, dense=True, sparse=False, backend=None):
     """Non-interacting Pauli-Y Hamiltonian.
 
     .. math::
@@ -109,11 +121,15 @@ def Y(nqubits, dense=True, backend=None):
         dense (bool): If ``True`` it creates the Hamiltonian as a
             :class:`qibo.core.hamiltonians.Hamiltonian`, otherwise it creates
             a :class:`qibo.core.hamiltonians.SymbolicHamiltonian`.
+        sparse (bool): If ``True`` it creates the Hamiltonian as a
+            :class:`qibo.core.hamiltonians.Hamiltonian` that holds a
+            ``scipy.sparse`` CSR matrix, regardless of ``dense``.
+            Available for the numpy and qibojit backends.
     """
-    return _OneBodyPauli(nqubits, matrices.Y, dense, backend=backend)
+    return _OneBodyPauli(nqubits, "Y", dense, sparse, backend=backend)
 
 
-def Z(nqubits, dense=True, backend=None):
+def Z(nqubits, dense=True, sparse=False, backend=None):
     """Non-interacting Pauli-Z Hamiltonian.
 
     .. math::
@@ -124,11 +140,15 @@ def Z(nqubits, dense=True, backend=None):
         dense (bool): If ``True`` it creates the Hamiltonian as a
             :class:`qibo.core.hamiltonians.Hamiltonian`, otherwise it creates
             a :class:`qibo.core.hamiltonians.SymbolicHamiltonian`.
+        sparse (bool): If ``True`` it creates the Hamiltonian as a
+            :class:`qibo.core.hamiltonians.Hamiltonian` that holds a
+            ``scipy.sparse`` CSR matrix, regardless of ``dense``.
+            Available for the numpy and qibojit backends.
     """
-    return _OneBodyPauli(nqubits, matrices.Z, dense, backend=backend)
+    return _OneBodyPauli(nqubits, "Z", dense, sparse, backend=backend)
 
 
-def TFIM(nqubits, h=0.0, dense=True, backend=None):
+def TFIM(nqubits, h=0.0, dense=True, sparse=False, backend=None):
     """Transverse field Ising model with periodic boundary conditions.
 
     .. math::
@@ -140,13 +160,16 @@ def TFIM(nqubits, h=0.0, dense=True, backend=None):
         dense (bool): If ``True`` it creates the Hamiltonian as a
             :class:`qibo.core.hamiltonians.Hamiltonian`, otherwise it creates
             a :class:`qibo.core.hamiltonians.SymbolicHamiltonian`.
+        sparse (bool): If ``True`` it creates the Hamiltonian as a
+            :class:`qibo.core.hamiltonians.Hamiltonian` that holds a
+            ``scipy.sparse`` CSR matrix, regardless of ``dense``.
+            Available for the numpy and qibojit backends.
     """
-    if dense:
-        condition = lambda i, j: i in {j % nqubits, (j + 1) % nqubits}
-        ham = -_build_spin_model(nqubits, matrices.Z, condition)
+    if dense or sparse:
+        terms = _build_spin_model(nqubits, "Z", -1)
         if h != 0:
-            condition = lambda i, j: i == j % nqubits
-            ham -= h * _build_spin_model(nqubits, matrices.X, condition)
+            terms.extend(_build_spin_model(nqubits, "X", -h, pairs=False))
+        ham = PauliSum.from_strings(terms, nqubits).matrix(sparse)
         return Hamiltonian(nqubits, ham, backend=backend)
 
     matrix = -(
@@ -159,7 +182,7 @@ def TFIM(nqubits, h=0.0, dense=True, backend=None):
     return ham
 
 
-def MaxCut(nqubits, dense=True, backend=None):
+def MaxCut(nqubits, dense=True, sparse=False, backend=None):
     """Max Cut Hamiltonian.
 
     .. math::
@@ -170,7 +193,20 @@ def MaxCut(nqubits, dense=True, backend=None):
         dense (bool): If ``True`` it creates the Hamiltonian as a
             :class:`qibo.core.hamiltonians.Hamiltonian`, otherwise it creates
             a :class:`qibo.core.hamiltonians.SymbolicHamiltonian`.
+        sparse (bool): If ``True`` it creates the Hamiltonian as a
+            :class:`qibo.core.hamiltonians.Hamiltonian` that holds a
+            ``scipy.sparse`` CSR matrix, regardless of ``dense``.
+            Available for the numpy and qibojit backends.
     """
+    if dense or sparse:
+        # the diagonal ``i == j`` terms vanish and each pair appears twice
+        terms = [
+            (1, {i: "Z", j: "Z"}) for i in range(nqubits) for j in range(i + 1, nqubits)
+        ]
+        terms.append((-nqubits * (nqubits - 1) / 2, {}))
+        ham = PauliSum.from_strings(terms, nqubits).matrix(sparse)
+        return Hamiltonian(nqubits, ham, backend=backend)
+
     import sympy as sp
     from numpy import ones
 
@@ -187,7 +223,4 @@ def MaxCut(nqubits, dense=True, backend=None):
     smap = {s: (i, matrices.Z) for i, s in enumerate(Z)}
     smap.update({s: (i, v[i]) for i, s in enumerate(V)})
 
-    ham = SymbolicHamiltonian(sham, smap, backend=backend)
-    if dense:
-        return ham.dense
-    return ham
+    return SymbolicHamiltonian(sham, smap, backend=backend)
@@ -45,6 +45,8 @@ class HamiltonianTerm:
         self._gate = None
         self.hamiltonian = None
         self._matrix = matrix
+        self._eigenvalues = None
+        self._eigenvectors = None
 
     @property
     def matrix(self):
@@ -59,10 +61,21 @@ class HamiltonianTerm:
         return self._gate
 
     def exp(self, x):
-        """Matrix exponentiation of the term."""
-        from scipy.linalg import expm
+        """Matrix exponentiation of the term.
 
-        return expm(-1j * x * self.matrix)
+        For Hermitian terms the eigendecomposition of the matrix is calculated
+        once and cached, so that exponentiating for a different ``x`` only
+        requires updating the phases of the eigenvalues.
+        """
+        if self._eigenvectors is None:
+            matrix = self.matrix
+            if not np.allclose(matrix, np.conj(matrix).T):
+                from scipy.linalg import expm
+
+                return expm(-1j * x * matrix)
+            self._eigenvalues, self._eigenvectors = np.linalg.eigh(matrix)
+        phases = np.exp(-1j * x * self._eigenvalues)
+        return (self._eigenvectors * phases) @ np.conj(self._eigenvectors).T
 
     def expgate(self, x):
         """:class:`qibo.gates.gates.Unitary` gate implementing the action of exp(term) on states."""
@@ -144,6 +157,8 @@ class SymbolicTerm(HamiltonianTerm):
         self._matrix = None
         self._gate = None
         self.hamiltonian = None
+        self._eigenvalues = None
+        self._eigenvectors = None
 
         # List of :class:`qibo.symbols.Symbol` that represent the term factors
         self.factors = []
@@ -274,16 +289,23 @@ class TermGroup(list):
 
     def can_append(self, term):
         """Checks if a term can be appended to the group based on its target qubits."""
-        return set(term.target_qubits).issubset(self.target_qubits)
+        return self.target_qubits.issuperset(term.target_qubits)
 
     @classmethod
-    def from_terms(cls, terms):
+    def from_terms(cls, terms, minimize_depth=False):
         """Divides a list of terms to multiple :class:`qibo.hamiltonians.terms.TermGroup`s.
 
         Terms that target the same qubits are grouped to the same group.
 
         Args:
             terms (list): List of :class:`qibo.hamiltonians.terms.HamiltonianTerm` objects.
+            minimize_depth (bool): If ``True`` the groups are reordered so that
+                groups acting on disjoint qubits are adjacent. Each group is
+                placed greedily in the first layer of groups that does not
+                share any qubit with it. This reduces the depth of the Trotter
+                circuit created from the groups, as consecutive gates on
+                disjoint qubits can be applied in parallel, but does not
+                guarantee that the depth is minimal.
 
         Returns:
             List of :class:`qibo.hamiltonians.terms.TermGroup` objects that contain
@@ -299,18 +321,39 @@ class TermGroup(list):
                 orders[len(term)] = [term]
 
         groups = []
+        # map from each qubit to the ids of the groups that contain it, used
+        # to find the compatible groups without scanning all of them
+        index = {}
         # start creating groups with the higher order terms as parents and then
         # append each term of lower order to the first compatible group
         for order in sorted(orders.keys())[::-1]:
             for child in orders[order]:
-                flag = True
-                for i, group in enumerate(groups):
-                    if group.can_append(child):
-                        group.append(child)
-                        flag = False
-                        break
-                if flag:
+                candidates = [index.get(q, set()) for q in child.target_qubits]
+                if candidates:
+                    candidates = set.intersection(*candidates)
+                else:
+                    candidates = set(range(len(groups)))
+                if candidates:
+                    groups[min(candidates)].append(child)
+                else:
+                    for q in child.target_qubits:
+                        index.setdefault(q, set()).add(len(groups))
                     groups.append(cls(child))
+
+        if minimize_depth:
+            # greedy layering: each group is placed in the first layer that
+            # does not contain any of its qubits
+            layers, layer_qubits = [], []
+            for group in groups:
+                for layer, qubits in zip(layers, layer_qubits):
+                    if qubits.isdisjoint(group.target_qubits):
+                        layer.append(group)
+                        qubits |= group.target_qubits
+                        break
+                else:
+                    layers.append([group])
+                    layer_qubits.append(set(group.target_qubits))
+            groups = [group for layer in layers for group in layer]
         return groups
 
     @property
@@ -320,6 +363,26 @@ class TermGroup(list):
             self._term = self.to_term()
         return self._term
 
+    def exp(self, x, coefficients={}):
+        """Matrix exponentiation of the sum of terms in the group.
+
+        If all terms belong to the same Hamiltonian, the coefficient only
+        rescales the merged term, so the cached eigendecomposition of
+        :attr:`qibo.hamiltonians.terms.TermGroup.term` is reused
+        (see :meth:`qibo.hamiltonians.terms.HamiltonianTerm.exp`).
+
+        Args:
+            x (float): Exponentiation parameter.
+            coefficients (dict): Optional dictionary with a different coefficient
+                for each parent Hamiltonian, as in
+                :meth:`qibo.hamiltonians.terms.TermGroup.to_term`.
+        """
+        hamiltonians = {term.hamiltonian for term in self}
+        if len(hamiltonians) == 1:
+            c = coefficients.get(hamiltonians.pop())
+            return self.term.exp(x if c is None else c * x)
+        return self.to_term(coefficients).exp(x)
+
     def to_term(self, coefficients={}):
         """Calculates a single :class:`qibo.hamiltonians.terms.HamiltonianTerm` by merging all terms in the group.
 
@@ -334,3 +397,416 @@ class TermGroup(list):
             c = coefficients.get(term.hamiltonian)
             merged = merged.merge(term * c if c is not None else term)
         return merged
+
+
+def _parity(x):
+    """Parity of the number of set bits of each element of an integer array."""
+    for shift in (32, 16, 8, 4, 2, 1):
+        x = x ^ (x >> shift)
+    return x & 1
+
+
+def _pauli_masks(paulis):
+    """X and Z bitmasks of a Pauli string given as a ``{qubit: pauli}`` dictionary."""
+    xmask, zmask = 0, 0
+    for q, pauli in paulis.items():
+        if pauli not in ("I", "X", "Y", "Z"):
+            raise_error(
+                ValueError,
+                f"Unknown Pauli operator {pauli} on qubit {q}. "
+                "Pauli strings should contain only 'I', 'X', 'Y' or 'Z'.",
+            )
+        if pauli in ("X", "Y"):
+            xmask |= 1 << q
+        if pauli in ("Y", "Z"):
+            zmask |= 1 << q
+    return xmask, zmask
+
+
+class PauliSum:
+    """Array representation of a sum of Pauli strings.
+
+    Each Pauli string is stored as a pair of integer bitmasks: bit ``q`` of
+    ``xmasks`` (``zmasks``) is set if the string acts with X or Y (Z or Y) on
+    qubit ``q``. Using ``Y = i X Z`` every string can be written as
+    ``coefficient * phase * X^x Z^z`` with ``phase = 1j ** ny``, where ``ny``
+    is the number of Y factors. This allows the action of the whole sum on a
+    state to be calculated using only bit flips and sign changes, without
+    constructing any matrices (see :meth:`qibo.backends.abstract.Backend.apply_pauli_sum`).
+
+    Bitmasks are stored as ``np.int64`` so up to 63 qubits are supported.
+
+    Args:
+        xmasks (np.ndarray): Integer array with the X bitmask of each string.
+        zmasks (np.ndarray): Integer array with the Z bitmask of each string.
+        coefficients (np.ndarray): Complex array with the coefficient of each string.
+        nqubits (int): Total number of qubits. If ``None`` it is inferred from
+            the largest qubit id that appears in the strings.
+    """
+
+    def __init__(self, xmasks, zmasks, coefficients, nqubits=None):
+        self.xmasks = np.array(xmasks, dtype=np.int64)
+        self.zmasks = np.array(zmasks, dtype=np.int64)
+        self.coefficients = np.array(coefficients, dtype=np.complex128)
+        if not self.xmasks.shape == self.zmasks.shape == self.coefficients.shape:
+            raise_error(
+                ValueError,
+                "Bitmasks and coefficients of Pauli sum should have the same "
+                "shape but have {}, {} and {}.".format(
+                    self.xmasks.shape, self.zmasks.shape, self.coefficients.shape
+                ),
+            )
+        if nqubits is None:
+            masks = self.xmasks | self.zmasks
+            nqubits = max(int(masks.max()).bit_length(), 1) if len(masks) else 1
+        self.nqubits = nqubits
+        self._strings = None
+
+    @classmethod
+    def from_strings(cls, strings, nqubits=None):
+        """Creates the Pauli sum from a list of ``(coefficient, paulis)`` pairs.
+
+        Args:
+            strings (list): List of pairs ``(coefficient, paulis)`` where ``paulis``
+                is a dictionary that maps qubit ids to ``"I"``, ``"X"``, ``"Y"``
+                or ``"Z"``.
+            nqubits (int): Total number of qubits.
+        """
+        xmasks, zmasks, coefficients = [], [], []
+        for coefficient, paulis in strings:
+            xmask, zmask = _pauli_masks(paulis)
+            xmasks.append(xmask)
+            zmasks.append(zmask)
+            coefficients.append(coefficient)
+        return cls(xmasks, zmasks, coefficients, nqubits)
+
+    @classmethod
+    def from_terms(cls, terms, nqubits=None):
+        """Creates the Pauli sum from a list of :class:`qibo.hamiltonians.terms.SymbolicTerm`.
+
+        Products of Pauli operators acting on the same qubit are simplified.
+
+        Args:
+            terms (list): List of :class:`qibo.hamiltonians.terms.SymbolicTerm`.
+            nqubits (int): Total number of qubits.
+
+        Returns:
+            :class:`qibo.hamiltonians.terms.PauliSum` or ``None`` if some of
+            the terms is not a product of Pauli operators.
+        """
+        from qibo.backends import matrices
+
+        paulis = {"I": (0, 0), "X": (1, 0), "Y": (1, 1), "Z": (0, 1)}
+        xmasks, zmasks, coefficients = [], [], []
+        for term in terms:
+            if not isinstance(term, SymbolicTerm):
+                return None
+            xmask, zmask, coefficient = 0, 0, term.coefficient
+            for factor in term.factors:
+                name = next(
+                    (
+                        p
+                        for p in paulis
+                        if np.array_equal(factor.matrix, getattr(matrices, p))
+                    ),
+                    None,
+                )
+                if name is None:
+                    return None
+                x, z = paulis.get(name)
+                bit = 1 << factor.target_qubit
+                # X^x Z^z multiplied by i^(xp zp) X^xp Z^zp
+                if x and zmask & bit:
+                    coefficient *= -1
+                if x and z:
+                    coefficient *= 1j
+                if x:
+                    xmask ^= bit
+                if z:
+                    zmask ^= bit
+            # remove the Y phases so that the coefficient refers to the Pauli string
+            coefficient /= 1j ** bin(xmask & zmask).count("1")
+            xmasks.append(xmask)
+            zmasks.append(zmask)
+            coefficients.append(coefficient)
+        return cls(xmasks, zmasks, coefficients, nqubits)
+
+    @property
+    def phases(self):
+        """Phases ``1j ** ny`` of each string in the ``X^x Z^z`` representation."""
+        ny = np.array([bin(m).count("1") for m in self.xmasks & self.zmasks], dtype=int)
+        return (1j) ** ny
+
+    @property
+    def strings(self):
+        """List of ``(coefficient * phase, xqubits, zqubits)`` tuples, one per string.
+
+        ``xqubits`` and ``zqubits`` are tuples with the qubit ids that are
+        acted by ``X`` and ``Z`` respectively, in the ``X^x Z^z`` representation.
+        """
+        if self._strings is None:
+            qubits = lambda mask: tuple(
+                q for q in range(self.nqubits) if (int(mask) >> q) & 1
+            )
+            self._strings = [
+                (complex(c), qubits(x), qubits(z))
+                for c, x, z in zip(
+                    self.coefficients * self.phases, self.xmasks, self.zmasks
+                )
+            ]
+        return self._strings
+
+    def __len__(self):
+        return len(self.coefficients)
+
+    def to_terms(self):
+        """Creates :class:`qibo.hamiltonians.terms.SymbolicTerm` objects for the strings.
+
+        The terms are created directly from Qibo symbols, without parsing
+        ``sympy`` expressions. Identity strings are not included.
+
+        Returns:
+            List of :class:`qibo.hamiltonians.terms.SymbolicTerm` objects.
+        """
+        from qibo import symbols
+
+        terms = []
+        for coefficient, x, z in zip(self.coefficients, self.xmasks, self.zmasks):
+            factors = []
+            for q in range((int(x) | int(z)).bit_length()):
+                pauli = "IXZY"[((int(x) >> q) & 1) + 2 * ((int(z) >> q) & 1)]
+                if pauli != "I":
+                    factors.append(getattr(symbols, pauli)(q))
+            if factors:
+                term = SymbolicTerm(coefficient)
+                term.factors = factors
+                term.matrix_map = {f.target_qubit: [f.matrix] for f in factors}
+                term.target_qubits = tuple(term.matrix_map.keys())
+                terms.append(term)
+        return terms
+
+    def qubitwise_commuting_groups(self):
+        """Partitions the strings to groups of qubit-wise commuting strings.
+
+        Two strings commute qubit-wise if they act with the same Pauli operator
+        on every qubit that both of them act on non-trivially, so that all
+        strings of a group can be measured simultaneously in the same basis.
+        Strings are assigned greedily to the first compatible group in order
+        of decreasing coefficient magnitude.
+
+        Returns:
+            List of integer arrays with the indices of the strings in each group.
+        """
+        supports = self.xmasks | self.zmasks
+        groups, gxmasks, gzmasks = [], [], []
+        for i in np.argsort(-np.abs(self.coefficients), kind="stable"):
+            x, z = self.xmasks[i], self.zmasks[i]
+            if groups:
+                gx, gz = np.array(gxmasks), np.array(gzmasks)
+                overlap = supports[i] & (gx | gz)
+                compatible = np.flatnonzero(((x ^ gx) | (z ^ gz)) & overlap == 0)
+            else:
+                compatible = []
+            if len(compatible):
+                j = compatible[0]
+                groups[j].append(i)
+                gxmasks[j] |= x
+                gzmasks[j] |= z
+            else:
+                groups.append([i])
+                gxmasks.append(x)
+                gzmasks.append(z)
+        return [np.array(g) for g in groups]
+
+    def measurement_basis(self, indices):
+        """Pauli operator that should be measured on each qubit to estimate the given strings.
+
+        Args:
+            indices (np.ndarray): Indices of qubit-wise commuting strings.
+
+        Returns:
+            Dictionary that maps qubit ids to ``"X"``, ``"Y"`` or ``"Z"``.
+        """
+        xmask = np.bitwise_or.reduce(self.xmasks[indices])
+        zmask = np.bitwise_or.reduce(self.zmasks[indices])
+        basis = {}
+        for q in range((int(xmask) | int(zmask)).bit_length()):
+            x, z = (int(xmask) >> q) & 1, (int(zmask) >> q) & 1
+            if x and z:
+                basis[q] = "Y"
+            elif x:
+                basis[q] = "X"
+            elif z:
+                basis[q] = "Z"
+        return basis
+
+    def sample_values(self, outcomes, indices=None):
+        """Values of the sum of strings on each measured bitstring.
+
+        Assumes that the samples were obtained after rotating each qubit to the
+        :meth:`qibo.hamiltonians.terms.PauliSum.measurement_basis` of the
+        strings, so that each string is evaluated as the parity of the
+        outcomes on the qubits it acts on.
+
+        Args:
+            outcomes (np.ndarray): Integer array with the measured bitstrings,
+                where bit ``q`` holds the outcome of qubit ``q``.
+            indices (np.ndarray): Indices of the strings to evaluate. If
+                ``None`` all strings are used.
+
+        Returns:
+            Complex array with the value of the selected strings on each outcome.
+        """
+        if indices is None:
+            indices = np.arange(len(self))
+        supports = (self.xmasks | self.zmasks)[indices]
+        outcomes = np.array(outcomes, dtype=np.int64)
+        signs = 1 - 2 * _parity(outcomes[:, np.newaxis] & supports[np.newaxis])
+        return signs @ self.coefficients[indices]
+
+    def sample_expectation(self, outcomes, probabilities, indices=None):
+        """Estimates the expectation value of strings from measurement samples.
+
+        See :meth:`qibo.hamiltonians.terms.PauliSum.sample_values` for the
+        assumptions on the samples.
+
+        Args:
+            outcomes (np.ndarray): Integer array with the measured bitstrings,
+                where bit ``q`` holds the outcome of qubit ``q``.
+            probabilities (np.ndarray): Relative frequency of each outcome.
+            indices (np.ndarray): Indices of the strings to evaluate. If
+                ``None`` all strings are used.
+
+        Returns:
+            Complex estimate of the sum of the selected strings.
+        """
+        return np.array(probabilities) @ self.sample_values(outcomes, indices)
+
+    def diagonal(self):
+        """Diagonal of the matrix of the sum in the computational basis.
+
+        Only strings without X or Y factors contribute to the diagonal. Each
+        of them is evaluated as the parity of the basis indices on the qubits
+        it acts on, so the matrix is not constructed.
+
+        Returns:
+            Complex ``np.ndarray`` of length ``2 ** nqubits``.
+        """
+        indices = np.arange(2**self.nqubits, dtype=np.int64)
+        diagonal = np.zeros(len(indices), dtype=np.complex128)
+        for coefficient, xqubits, zqubits in self.strings:
+            if not xqubits:
+                zmask = sum(1 << (self.nqubits - q - 1) for q in zqubits)
+                diagonal += coefficient * (1 - 2 * _parity(indices & zmask))
+        return diagonal
+
+    def matrix(self, sparse=False):
+        """Matrix of the sum in the computational basis.
+
+        The string ``X^x Z^z`` maps column ``j`` to row ``j ^ x`` with value
+        ``(-1) ** popcount(j & z)``, so the non-zero elements are calculated
+        directly from the basis indices, without Kronecker products.
+        Strings with the same X part have non-zero elements on the same
+        positions, so every row has one element per distinct X part and the
+        sparse matrix is written directly in CSR format.
+
+        Args:
+            sparse (bool): If ``True`` a ``scipy.sparse.csr_matrix`` is returned,
+                otherwise a dense ``np.ndarray``.
+        """
+        dim = 2**self.nqubits
+        bit = lambda q: self.nqubits - q - 1
+        groups = {}
+        for coefficient, xqubits, zqubits in self.strings:
+            xmask = sum(1 << bit(q) for q in xqubits)
+            zmask = sum(1 << bit(q) for q in zqubits)
+            groups.setdefault(xmask, []).append((coefficient, zmask))
+
+        def values(strings, columns):
+            """Sum of the values of strings with the same X part on the given columns."""
+            value = np.zeros(len(columns), dtype=np.complex128)
+            for coefficient, zmask in strings:
+                if zmask:
+                    value += coefficient * (1 - 2 * _parity(columns & zmask))
+                else:
+                    value += coefficient
+            return value
+
+        rows = np.arange(dim, dtype=np.int64)
+        if sparse:
+            from scipy import sparse as sp
+
+            xmasks = np.array(list(groups.keys()), dtype=np.int64)[:, np.newaxis]
+            nnz = dim * len(groups)
+            dtype = np.int32 if nnz < 2**31 else np.int64
+            indptr = np.arange(0, nnz + 1, len(groups), dtype=dtype)
+            indices = np.empty((dim, len(groups)), dtype=dtype)
+            data = np.empty((dim, len(groups)), dtype=np.complex128)
+            # rows are filled in blocks to keep the transposition in cache
+            block = min(dim, 2**12)
+            for start in range(0, dim, block):
+                columns = rows[np.newaxis, start : start + block] ^ xmasks
+                indices[start : start + block] = columns.T
+                data[start : start + block] = np.transpose(
+                    [values(g, c) for g, c in zip(groups.values(), columns)]
+                )
+            matrix = sp.csr_matrix(
+                (data.reshape(-1), indices.reshape(-1), indptr), shape=(dim, dim)
+            )
+            matrix.sort_indices()
+            return matrix
+
+        matrix = np.zeros((dim, dim), dtype=np.complex128)
+        for xmask, strings in groups.items():
+            matrix[rows ^ xmask, rows] += values(strings, rows)
+        return matrix
+
+
+class PauliSumBuilder:
+    """Accumulates Pauli strings to a :class:`qibo.hamiltonians.terms.PauliSum`.
+
+    Strings are stored in a dictionary that uses their bitmasks as keys, so
+    that duplicate strings are merged while they are added. This allows
+    constructing Hamiltonians with many terms without ``sympy`` expressions.
+
+    Example:
+        .. testcode::
+
+            from qibo.hamiltonians import SymbolicHamiltonian
+            from qibo.hamiltonians.terms import PauliSumBuilder
+            builder = PauliSumBuilder()
+            for i in range(3):
+                builder.add(1.0, {i: "Z", (i + 1) % 3: "Z"})
+                builder.add(0.5, {i: "X"})
+            ham = SymbolicHamiltonian.from_pauli_sum(builder.build())
+    """
+
+    def __init__(self):
+        self._table = {}
+
+    def add(self, coefficient, paulis):
+        """Adds a Pauli string to the sum.
+
+        Args:
+            coefficient (complex): Coefficient of the string.
+            paulis (dict): Dictionary that maps qubit ids to ``"I"``, ``"X"``,
+                ``"Y"`` or ``"Z"``.
+        """
+        key = _pauli_masks(paulis)
+        self._table[key] = self._table.get(key, 0) + coefficient
+
+    def __len__(self):
+        return len(self._table)
+
+    def build(self, nqubits=None, atol=1e-14):
+        """Creates the :class:`qibo.hamiltonians.terms.PauliSum` of the accumulated strings.
+
+        Args:
+            nqubits (int): Total number of qubits.
+            atol (float): Strings with coefficients smaller than this in
+                absolute value are dropped.
+        """
+        table = {k: c for k, c in self._table.items() if abs(c) > atol}
+        xmasks = [x for x, _ in table.keys()]
+        zmasks = [z for _, z in table.keys()]
+        return PauliSum(xmasks, zmasks, list(table.values()), nqubits)
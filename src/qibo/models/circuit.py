@@ -19,13 +19,41 @@ class _ParametrizedGates(list):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.set = set()
-        self.nparams = 0
+        self.set = set(self)
+        self.nparams = sum(gate.nparams for gate in self)
+        self._index_map = None
 
     def append(self, gate):
         super().append(gate)
         self.set.add(gate)
         self.nparams += gate.nparams
+        self._index_map = None
+
+    @property
+    def index_map(self):
+        """Positions of the parameters of each gate in the flat parameter list.
+
+        List of ``(gate, start, stop, names)`` tuples, where ``names`` holds
+        the indices and names of the parameters that appear in the gate's
+        ``init_kwargs``, or ``None`` if any of the gates requires the full
+        ``gate.parameters`` setter.
+        """
+        if self._index_map is None:
+            from qibo.gates.abstract import ParametrizedGate
+
+            index_map, start = [], 0
+            for gate in self:
+                if type(gate).parameters is not ParametrizedGate.parameters:
+                    index_map = None
+                    break
+                names = gate.parameter_names
+                if isinstance(names, str):
+                    names = [names]
+                names = [(i, n) for i, n in enumerate(names) if n in gate.init_kwargs]
+                index_map.append((gate, start, start + gate.nparams, names))
+                start += gate.nparams
+            self._index_map = index_map
+        return self._index_map
 
 
 class _Queue(list):
@@ -42,7 +70,18 @@ class _Queue(list):
         self.moment_index = nqubits * [0]
         self.nmeasurements = 0
 
-    def to_fused(self):
+    @staticmethod
+    def _fusable(gate, density_matrix):
+        """Checks if a gate can be fused with other gates."""
+        if isinstance(gate, (gates.SpecialGate, gates.M)):
+            return False
+        if isinstance(gate, gates.Channel):
+            # channels with Kraus representation are fused to superoperators
+            # when simulating density matrices
+            return density_matrix and isinstance(gate, gates.KrausChannel)
+        return True
+
+    def to_fused(self, density_matrix=False):
         """Transforms all gates in queue to :class:`qibo.gates.FusedGate`."""
         last_gate = {}
         queue = self.__class__(self.nqubits)
@@ -52,6 +91,8 @@ class _Queue(list):
                 fgate.qubit_set = set(range(self.nqubits))
                 fgate.init_args = sorted(fgate.qubit_set)
                 fgate.target_qubits = tuple(fgate.init_args)
+            elif not self._fusable(gate, density_matrix):
+                fgate.marked = True
 
             for q in fgate.qubits:
                 if q in last_gate:
@@ -62,7 +103,7 @@ class _Queue(list):
             queue.append(fgate)
         return queue
 
-    def from_fused(self):
+    def from_fused(self, density_matrix=False):
         """Creates the fused circuit queue by removing gates that have been fused to others."""
         queue = self.__class__(self.nqubits)
         for gate in self:
@@ -73,7 +114,7 @@ class _Queue(list):
                     queue.append(gate.gates[0])
                 else:
                     queue.append(gate)
-            elif isinstance(gate.gates[0], (gates.SpecialGate, gates.M)):
+            elif not self._fusable(gate.gates[0], density_matrix):
                 # special gates are marked by default so we need
                 # to add them manually
                 queue.append(gate.gates[0])
@@ -135,6 +176,13 @@ class Circuit:
         self._final_state = None
         self.compiled = None
         self.repeated_execution = False
+        # if ``True`` the backend caches the state before each parametrized
+        # gate and restarts execution from the first gate whose parameters
+        # changed since the previous execution
+        self.cache_states = False
+        self._state_cache = None
+        # noise model applied lazily during execution, see ``NoiseModel.apply``
+        self.noise_model = None
 
         self.density_matrix = density_matrix
 
@@ -219,12 +267,17 @@ class Circuit:
                 )
 
         newcircuit = self.__class__(**self.init_kwargs)
-        # Add gates from `self` to `newcircuit` (including measurements)
-        for gate in self.queue:
-            newcircuit.add(gate)
-        # Add gates from `circuit` to `newcircuit` (including measurements)
-        for gate in circuit.queue:
-            newcircuit.add(gate)
+        if self.noise_model is circuit.noise_model:
+            newcircuit.noise_model = self.noise_model
+            queues = (self.queue, circuit.queue)
+        else:
+            # circuits with different lazy noise models cannot share a single
+            # model, so their noise channels are added to the queue explicitly
+            queues = (c._noisy_queue() for c in (self, circuit))
+        # Add gates from `self` and `circuit` to `newcircuit` (including measurements)
+        for queue in queues:
+            for gate in queue:
+                newcircuit.add(gate)
 
         # Re-execute full circuit when sampling if one of the circuit has repeated_execution ``True``
         newcircuit.repeated_execution = (
@@ -295,8 +348,10 @@ class Circuit:
         # original qubits that are in the light cone
         qubits = set(qubits)
         # original gates that are in the light cone
+        # noise channels of lazily noisy circuits are included explicitly,
+        # as for circuits with noise channels in their queue
         gates = []
-        for gate in reversed(self.queue):
+        for gate in reversed(list(self._noisy_queue())):
             gate_qubits = set(gate.qubits)
             if gate_qubits & qubits:
                 # if the gate involves any qubit included in the
@@ -319,8 +374,15 @@ class Circuit:
         new_circuit.parametrized_gates = _ParametrizedGates(self.parametrized_gates)
         new_circuit.trainable_gates = _ParametrizedGates(self.trainable_gates)
         new_circuit.measurements = self.measurements
+        new_circuit.noise_model = self.noise_model
         return new_circuit
 
+    def _noisy_queue(self):
+        """Gates of the circuit including the noise channels of a lazy noise model."""
+        if self.noise_model is None:
+            return self.queue
+        return self.noise_model.noisy_queue(self)
+
     def copy(self, deep: bool = False):
         """Creates a copy of the current ``circuit`` as a new ``Circuit`` model.
 
@@ -382,6 +444,7 @@ class Circuit:
                 new_circuit.add(gate.dagger())
                 skip_measurements = False
         new_circuit.add(measurements[::-1])
+        new_circuit.noise_model = self.noise_model
         return new_circuit
 
     def _check_noise_map(self, noise_map: NoiseMapType) -> NoiseMapType:
@@ -642,7 +705,15 @@ class Circuit:
 
         Also works if ``parameters`` is ``np.ndarray`` or ``tf.Tensor``.
         """
-        if n == len(self.trainable_gates):
+        if (
+            isinstance(parameters, np.ndarray)
+            and parameters.ndim == 1
+            and n == self.trainable_gates.nparams
+            and self.accelerators is None
+            and self.trainable_gates.index_map is not None
+        ):
+            self._set_parameters_array(parameters)
+        elif n == len(self.trainable_gates):
             for i, gate in enumerate(self.trainable_gates):
                 gate.parameters = parameters[i]
         elif n == self.trainable_gates.nparams:
@@ -662,6 +733,19 @@ class Circuit:
                 "".format(n, len(self.trainable_gates)),
             )
 
+    def _set_parameters_array(self, parameters):
+        """Helper method for ``set_parameters`` when a flat ``np.ndarray`` is given.
+
+        Parameters are assigned directly to the gates using the precomputed
+        :attr:`qibo.models.circuit._ParametrizedGates.index_map`, skipping
+        the validation of the ``gate.parameters`` setter.
+        """
+        values = parameters.tolist()
+        for gate, start, stop, names in self.trainable_gates.index_map:
+            gate._parameters = tuple(values[start:stop])
+            for i, name in names:
+                gate.init_kwargs[name] = gate._parameters[i]
+
     def set_parameters(self, parameters):
         """Updates the parameters of the circuit's parametrized gates.
 
@@ -853,6 +937,12 @@ class Circuit:
     def fuse(self, max_qubits=2):
         """Creates an equivalent circuit by fusing gates for increased simulation performance.
 
+        When the circuit uses density matrices, channels that have a Kraus
+        representation are also fused together with the neighboring gates.
+        The resulting fused gates are applied as a single superoperator on
+        their target qubits, instead of one pass over the density matrix
+        for every gate and channel.
+
         Args:
             max_qubits (int): Maximum number of qubits in the fused gates.
 
@@ -881,8 +971,11 @@ class Circuit:
                 NotImplementedError,
                 "Fusion is not implemented for " "distributed circuits.",
             )
+        if self.noise_model is not None:
+            # fused gates do not match the gate types of the noise model
+            return self.noise_model.apply(self).fuse(max_qubits)
 
-        queue = self.queue.to_fused()
+        queue = self.queue.to_fused(self.density_matrix)
         for gate in queue:
             if not gate.marked:
                 for q in gate.qubits:
@@ -896,7 +989,7 @@ class Circuit:
                         neighbor.fuse(gate)
         # create a circuit and assign the new queue
         circuit = self._shallow_copy()
-        circuit.queue = queue.from_fused()
+        circuit.queue = queue.from_fused(self.density_matrix)
         return circuit
 
     def unitary(self, backend=None):
@@ -980,6 +1073,11 @@ class Circuit:
         else:
             from qibo.backends import GlobalBackend
 
+            if self.noise_model is not None and (
+                self.accelerators or not GlobalBackend().supports_lazy_noise
+            ):
+                # execute with the noise channels inserted in the queue
+                return self.noise_model.apply(self).execute(initial_state, nshots)
             if self.accelerators:  # pragma: no cover
                 return GlobalBackend().execute_distributed_circuit(
                     self, initial_state, nshots
@@ -27,6 +27,14 @@ class StateEvolution:
             matrix will be exponentiated to obtain the exact evolution operator.
             Runge-Kutta solvers use simple matrix multiplications of the
             Hamiltonian to the state and no exponentiation is involved.
+            The 'rk45_adaptive' solver splits each time step to internal steps
+            whose size is controlled by the embedded Runge-Kutta error estimate.
+            The 'krylov' solver applies the exact evolution operator using
+            Lanczos iterations that require only Hamiltonian-state products.
+            For symbolic Hamiltonians the order of the Trotter-Suzuki formula
+            can be selected using the 'trotter1', 'trotter2' (equivalent to
+            'exp') or 'trotter4' solvers, while 'qdrift' uses randomized
+            Trotterization.
         callbacks (list): List of callbacks to calculate during evolution.
         accelerators (dict): Dictionary of devices to use for distributed
             execution. This option is available only when the Trotter
@@ -124,11 +132,13 @@ class StateEvolution:
         self.solver.t = start_time
         nsteps = int((final_time - start_time) / self.solver.dt)
         self.calculate_callbacks(state)
-        for _ in range(nsteps):
-            state = self.solver(state)
-            if self.callbacks:
+        if self.callbacks:
+            for _ in range(nsteps):
+                state = self.solver(state)
                 state = self.normalize_state(state)
                 self.calculate_callbacks(state)
+        else:
+            state = self.solver.steps(state, nsteps)
         state = self.normalize_state(state)
         return state
 
@@ -165,6 +175,13 @@ class AdiabaticEvolution(StateEvolution):
             matrix will be exponentiated to obtain the exact evolution operator.
             Runge-Kutta solvers use simple matrix multiplications of the
             Hamiltonian to the state and no exponentiation is involved.
+            The 'rk45_adaptive' solver splits each time step to internal steps
+            whose size is controlled by the embedded Runge-Kutta error estimate.
+            The 'krylov' solver applies the exact evolution operator using
+            Lanczos iterations that require only Hamiltonian-state products.
+            For symbolic Hamiltonians the order of the Trotter-Suzuki formula
+            can be selected using the 'trotter1', 'trotter2' (equivalent to
+            'exp') or 'trotter4' solvers.
         callbacks (list): List of callbacks to calculate during evolution.
         accelerators (dict): Dictionary of devices to use for distributed
             execution. This option is available only when the Trotter
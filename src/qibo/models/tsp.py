@@ -1,9 +1,11 @@
+from itertools import product
+
 import numpy as np
 
 from qibo import gates
 from qibo.hamiltonians import SymbolicHamiltonian
+from qibo.hamiltonians.terms import PauliSumBuilder
 from qibo.models.circuit import Circuit
-from qibo.symbols import X, Y, Z
 
 
 def calculate_two_to_one(num_cities):
@@ -13,40 +15,50 @@ def calculate_two_to_one(num_cities):
 def tsp_phaser(distance_matrix, backend=None):
     num_cities = distance_matrix.shape[0]
     two_to_one = calculate_two_to_one(num_cities)
-    form = 0
+    builder = PauliSumBuilder()
     for i in range(num_cities):
         for u in range(num_cities):
             for v in range(num_cities):
                 if u != v:
-                    form += (
-                        distance_matrix[u, v]
-                        * Z(int(two_to_one[u, i]))
-                        * Z(int(two_to_one[v, (i + 1) % num_cities]))
+                    builder.add(
+                        distance_matrix[u, v],
+                        {
+                            int(two_to_one[u, i]): "Z",
+                            int(two_to_one[v, (i + 1) % num_cities]): "Z",
+                        },
                     )
-    ham = SymbolicHamiltonian(form, backend=backend)
-    return ham
+    pauli_sum = builder.build(nqubits=num_cities**2)
+    return SymbolicHamiltonian.from_pauli_sum(pauli_sum, backend=backend)
 
 
 def tsp_mixer(num_cities, backend=None):
     two_to_one = calculate_two_to_one(num_cities)
-    splus = lambda u, i: X(int(two_to_one[u, i])) + 1j * Y(int(two_to_one[u, i]))
-    sminus = lambda u, i: X(int(two_to_one[u, i])) - 1j * Y(int(two_to_one[u, i]))
-    form = 0
-    for i in range(num_cities):
-        for u in range(num_cities):
+    builder = PauliSumBuilder()
+    # expansion of S+ = X + iY, the second term of the mixer is obtained by
+    # replacing S+ with S- = X - iY which conjugates the coefficients
+    splus = (("X", 1), ("Y", 1j))
+    # the strings are added ordered by their first two qubits, as in the
+    # expanded symbolic form, because the order of the Trotter groups
+    # follows the order in which their qubits first appear
+    for u in range(num_cities):
+        for i in range(num_cities):
             for v in range(num_cities):
                 if u != v:
-                    form += splus(u, i) * splus(v, (i + 1) % num_cities) * sminus(
-                        u, (i + 1) % num_cities
-                    ) * sminus(v, i) + sminus(u, i) * sminus(
-                        v, (i + 1) % num_cities
-                    ) * splus(
-                        u, (i + 1) % num_cities
-                    ) * splus(
-                        v, i
-                    )
-    ham = SymbolicHamiltonian(form, backend=backend)
-    return ham
+                    j = (i + 1) % num_cities
+                    qubits = [
+                        int(two_to_one[u, i]),
+                        int(two_to_one[v, j]),
+                        int(two_to_one[u, j]),
+                        int(two_to_one[v, i]),
+                    ]
+                    for factors in product(splus, repeat=4):
+                        coefficient = 1
+                        for k, (_, c) in enumerate(factors):
+                            coefficient *= c if k < 2 else c.conjugate()
+                        paulis = {q: p for q, (p, _) in zip(qubits, factors)}
+                        builder.add(2 * coefficient.real, paulis)
+    pauli_sum = builder.build(nqubits=num_cities**2)
+    return SymbolicHamiltonian.from_pauli_sum(pauli_sum, backend=backend)
 
 
 class TSP:
@@ -27,6 +27,26 @@ def convert_state_to_count(state):
     return np.abs(state) ** 2
 
 
+def convert_state_to_energies(hamiltonian):
+    """
+    Energies of all computational basis states, ``<i|H|i>``, as a ``np.ndarray``.
+    For diagonal Hamiltonians the cached :attr:`qibo.hamiltonians.Hamiltonian.energies`
+    are used. Otherwise symbolic Hamiltonians calculate the diagonal from their
+    terms (see :meth:`qibo.hamiltonians.SymbolicHamiltonian.diagonal`) and only
+    matrix Hamiltonians use the diagonal of their matrix.
+    """
+    from qibo.hamiltonians import SymbolicHamiltonian
+
+    energies = hamiltonian.energies
+    if energies is None:
+        if isinstance(hamiltonian, SymbolicHamiltonian):
+            energies = hamiltonian.diagonal()
+        else:
+            matrix = hamiltonian.backend.to_numpy(hamiltonian.matrix)
+            energies = np.real(np.diagonal(matrix))
+    return np.asarray(energies)
+
+
 def compute_cvar(probabilities, values, alpha):
     """
     Auxilliary method to computes CVaR for given probabilities, values, and confidence level.
@@ -42,15 +62,10 @@ def compute_cvar(probabilities, values, alpha):
     sorted_indices = np.argsort(values)
     probs = np.array(probabilities)[sorted_indices]
     vals = np.array(values)[sorted_indices]
-    cvar = 0
-    total_prob = 0
-    for i, (p, v) in enumerate(zip(probs, vals)):
-        if p >= alpha - total_prob:
-            p = alpha - total_prob
-        total_prob += p
-        cvar += p * v
-    cvar /= total_prob
-    return cvar
+    # probability of the lowest values is accumulated up to ``alpha``
+    previous = np.cumsum(probs) - probs
+    probs = np.maximum(np.minimum(probs, alpha - previous), 0)
+    return probs @ vals / np.sum(probs)
 
 
 def cvar(hamiltonian, state, alpha=0.1):
@@ -58,15 +73,9 @@ def cvar(hamiltonian, state, alpha=0.1):
     Given the hamiltonian and state, this function estimate the
     corresponding cvar function
     """
-    counts = convert_state_to_count(state)
-    probabilities = np.zeros(len(counts))
-    values = np.zeros(len(counts))
-    m = int(np.log2(state.size))
-    for i, p in enumerate(counts):
-        values[i] = convert_bit_to_energy(hamiltonian, bin(i)[2:].zfill(m))
-        probabilities[i] = p
-    cvar_ans = compute_cvar(probabilities, values, alpha)
-    return cvar_ans
+    probabilities = convert_state_to_count(state)
+    values = convert_state_to_energies(hamiltonian)
+    return compute_cvar(probabilities, values, alpha)
 
 
 def gibbs(hamiltonian, state, eta=0.1):
@@ -75,11 +84,6 @@ def gibbs(hamiltonian, state, eta=0.1):
     it estimate the gibbs function value.
     """
     counts = convert_state_to_count(state)
-    avg = 0
-    sum_count = 0
-    m = int(np.log2(state.size))
-    for bitstring, count in enumerate(counts):
-        obj = convert_bit_to_energy(hamiltonian, bin(bitstring)[2:].zfill(m))
-        avg += np.exp(-eta * obj)
-        sum_count += count
-    return -np.log(avg / sum_count)
+    energies = convert_state_to_energies(hamiltonian)
+    avg = np.sum(np.exp(-eta * energies))
+    return -np.log(avg / np.sum(counts))
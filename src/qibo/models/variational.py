@@ -29,6 +29,10 @@ class VQE:
 
     from qibo import optimizers
 
+    # optimizers that update few parameters between consecutive loss
+    # evaluations, for which the circuit caches the intermediate states
+    COORDINATE_WISE_METHODS = ("Powell", "powell", "rotosolve")
+
     def __init__(self, circuit, hamiltonian):
         """Initialize circuit ansatz and hamiltonian."""
         self.circuit = circuit
@@ -58,6 +62,8 @@ class VQE:
                 See :meth:`qibo.optimizers.optimize` for available optimization
                 methods.
             jac (dict): Method for computing the gradient vector for scipy optimizers.
+                If ``"adjoint"`` the gradient is calculated analytically using
+                :meth:`qibo.derivative.adjoint_gradient`.
             hess (dict): Method for computing the hessian matrix for scipy optimizers.
             hessp (callable): Hessian of objective function times an arbitrary
                 vector for scipy optimizers.
@@ -77,6 +83,13 @@ class VQE:
             and for ``'sgd'`` the options used during the optimization.
         """
 
+        if jac == "adjoint":
+            from qibo.derivative import adjoint_gradient
+
+            def jac(params, circuit, hamiltonian):
+                circuit.set_parameters(params)
+                return adjoint_gradient(circuit, hamiltonian)
+
         def _loss(params, circuit, hamiltonian):
             circuit.set_parameters(params)
             result = hamiltonian.backend.execute_circuit(circuit)
@@ -96,23 +109,33 @@ class VQE:
         elif method != "sgd":
             loss = lambda p, c, h: self.hamiltonian.backend.to_numpy(_loss(p, c, h))
 
-        result, parameters, extra = self.optimizers.optimize(
-            loss,
-            initial_state,
-            args=(self.circuit, self.hamiltonian),
-            method=method,
-            jac=jac,
-            hess=hess,
-            hessp=hessp,
-            bounds=bounds,
-            constraints=constraints,
-            tol=tol,
-            callback=callback,
-            options=options,
-            compile=compile,
-            processes=processes,
-            backend=self.hamiltonian.backend,
-        )
+        # coordinate-wise optimization restarts execution from the cached
+        # state before the first updated parameter. Powell's method starts
+        # with line searches along each parameter
+        cache_states = self.circuit.cache_states
+        if method in self.COORDINATE_WISE_METHODS:
+            self.circuit.cache_states = True
+        try:
+            result, parameters, extra = self.optimizers.optimize(
+                loss,
+                initial_state,
+                args=(self.circuit, self.hamiltonian),
+                method=method,
+                jac=jac,
+                hess=hess,
+                hessp=hessp,
+                bounds=bounds,
+                constraints=constraints,
+                tol=tol,
+                callback=callback,
+                options=options,
+                compile=compile,
+                processes=processes,
+                backend=self.hamiltonian.backend,
+            )
+        finally:
+            self.circuit.cache_states = cache_states
+            self.circuit._state_cache = None
         self.circuit.set_parameters(parameters)
         return result, parameters, extra
 
@@ -276,12 +299,23 @@ class AAVQE:
             compile (bool): whether the TensorFlow graph should be compiled.
             processes (int): number of processes when using the parallel BFGS method.
         """
-        from qibo import models
-
+        from qibo import hamiltonians, models
+        from qibo.hamiltonians.adiabatic import InterpolatedHamiltonian
+
+        # the same circuit, Hamiltonian and VQE are reused in all steps and
+        # only the interpolation coefficient is updated
+        hamiltonian = InterpolatedHamiltonian(self._h0, self._h1, 0.0)
+        dense = isinstance(self._h0, hamiltonians.Hamiltonian) and isinstance(
+            self._h1, hamiltonians.Hamiltonian
+        )
+        vqe = models.VQE(self._circuit, hamiltonian)
         t = 0.0
         while (t - self._t_max) <= self.ATOL_TIME:
-            H = self.hamiltonian(t)
-            vqe = models.VQE(self._circuit, H)
+            hamiltonian.s = self.schedule(t)
+            if dense:
+                # calculate the matrix once per step so that every loss
+                # evaluation uses a single matrix multiplication
+                hamiltonian._buffered_matrix
             best, params, _ = vqe.minimize(
                 params,
                 method=method,
@@ -312,6 +346,11 @@ class QAOA:
             If ``None``, :class:`qibo.hamiltonians.X` is used.
         solver (str): solver used to apply the exponential operators.
             Default solver is 'exp' (:class:`qibo.solvers.Exponential`).
+            With this solver, diagonal problem Hamiltonians (for example
+            MaxCut or Ising models) are applied as elementwise phases using
+            their cached :attr:`qibo.hamiltonians.Hamiltonian.energies` and mixers of the form
+            ``sum_q c_q X_q`` (including the default) as products of
+            :class:`qibo.gates.RX` rotations, without exponentiating matrices.
         callbacks (list): List of callbacks to calculate during evolution.
         accelerators (dict): Dictionary of devices to use for distributed
             execution. This option is available only when ``hamiltonian``
@@ -394,6 +433,19 @@ class QAOA:
         self.ham_solver = get_solver(solver, 1e-2, self.hamiltonian)
         self.mix_solver = get_solver(solver, 1e-2, self.mixer)
 
+        # diagonal problem Hamiltonians and ``X`` mixers are applied directly
+        # to the state instead of using the solvers
+        self._energies = None
+        self._mixer_coefficients = None
+        if solver == "exp" and accelerators is None:
+            energies = self.hamiltonian.energies
+            if energies is not None:
+                self._energies = self.hamiltonian.backend.cast(energies)
+            if mixer is None:
+                self._mixer_coefficients = [(q, -1) for q in range(self.nqubits)]
+            else:
+                self._mixer_coefficients = self._x_mixer_coefficients(self.mixer)
+
         self.callbacks = callbacks
         self.backend = (
             hamiltonian.backend
@@ -413,10 +465,68 @@ class QAOA:
         """
         self.params = p
 
+    @staticmethod
+    def _x_mixer_coefficients(mixer):
+        """Coefficients ``c_q`` if the mixer is of the form ``sum_q c_q X_q``.
+
+        Returns:
+            List of ``(q, c_q)`` pairs or ``None`` if the mixer contains
+            other terms.
+        """
+        import numpy as np
+
+        coefficients = {}
+        if isinstance(mixer, QAOA.hamiltonians.SymbolicHamiltonian):
+            for term in mixer.terms:
+                matrix = mixer.backend.to_numpy(term.matrix)
+                c = matrix[0, 1]
+                if len(term.target_qubits) != 1 or not np.array_equal(
+                    matrix, [[0, c], [c, 0]]
+                ):
+                    return None
+                q = term.target_qubits[0]
+                coefficients[q] = coefficients.get(q, 0) + c
+        else:
+            # read the coefficients from the first column and compare with
+            # the matrix of the corresponding sum of ``X``
+            from qibo.hamiltonians.terms import PauliSum
+
+            n = mixer.nqubits
+            matrix = mixer.backend.to_numpy(mixer.matrix)
+            strings = [(matrix[2 ** (n - q - 1), 0], {q: "X"}) for q in range(n)]
+            if not np.allclose(matrix, PauliSum.from_strings(strings, n).matrix()):
+                return None
+            coefficients = {q: strings[q][0] for q in range(n)}
+
+        if any(np.imag(c) != 0 for c in coefficients.values()):
+            return None
+        return [(q, float(np.real(c))) for q, c in coefficients.items() if c != 0]
+
+    def _apply_cost_phases(self, state, p):
+        """Applies ``exp(-i p H)`` for diagonal ``H`` as elementwise phases."""
+        backend = self.hamiltonian.backend
+        phases = backend.np.exp(-1j * backend.cast(p) * self._energies)
+        return state * phases
+
+    def _apply_mixer_rotations(self, state, p):
+        """Applies ``exp(-i p sum_q c_q X_q)`` as a product of ``RX`` rotations."""
+        from qibo import gates
+
+        backend = self.hamiltonian.backend
+        for q, c in self._mixer_coefficients:
+            gate = gates.RX(q, theta=2 * c * p)
+            state = backend.apply_gate(gate, state, self.nqubits)
+        return state
+
     def _apply_exp(self, state, solver, p):
         """Helper method for ``execute``."""
-        solver.dt = p
-        state = solver(state)
+        if solver is self.ham_solver and self._energies is not None:
+            state = self._apply_cost_phases(state, p)
+        elif solver is self.mix_solver and self._mixer_coefficients is not None:
+            state = self._apply_mixer_rotations(state, p)
+        else:
+            solver.dt = p
+            state = solver(state)
         if self.callbacks:
             state = self.normalize_state(state)
             self.calculate_callbacks(state)
@@ -584,15 +694,33 @@ class FALQON(QAOA):
         self, hamiltonian, mixer=None, solver="exp", callbacks=[], accelerators=None
     ):
         super().__init__(hamiltonian, mixer, solver, callbacks, accelerators)
-        self.evol_hamiltonian = 1j * (
-            self.hamiltonian @ self.mixer - self.mixer @ self.hamiltonian
-        )
+        self._evol_hamiltonian = None
+
+    @property
+    def evol_hamiltonian(self):
+        """Commutator ``i[H_problem, H_mixer]`` whose expectation value defines the feedback."""
+        if self._evol_hamiltonian is None:
+            self._evol_hamiltonian = 1j * (
+                self.hamiltonian @ self.mixer - self.mixer @ self.hamiltonian
+            )
+        return self._evol_hamiltonian
+
+    def _apply_layer(self, state, gamma, beta):
+        """Applies a single FALQON layer to the given state."""
+        state = self._apply_exp(state, self.ham_solver, gamma)
+        state = self._apply_exp(state, self.mix_solver, beta)
+        return self.normalize_state(state)
 
     def minimize(
         self, delta_t, max_layers, initial_state=None, tol=None, callback=None
     ):
         """Optimizes the variational parameters of the FALQON.
 
+        The parameters of each layer are fixed once the layer is added, so
+        the state is evolved one layer per iteration and the feedback
+        ``<i[H_problem, H_mixer]>`` is calculated directly from the evolved
+        state, without re-executing the previous layers.
+
         Args:
             delta_t (float): initial guess for the time step. A too large delta_t will make the algorithm fail.
             max_layers (int): maximum number of layers allowed for the FALQON.
@@ -608,26 +736,27 @@ class FALQON(QAOA):
         """
         import numpy as np
 
-        parameters = np.array([delta_t, 0])
-
-        def _loss(params, falqon, hamiltonian):
-            falqon.set_parameters(params)
-            state = falqon(initial_state)
-            return hamiltonian.expectation(state)
+        backend = self.hamiltonian.backend
+        if initial_state is None:
+            state = backend.plus_state(self.nqubits)
+        else:
+            state = backend.cast(initial_state, copy=True)
+        self.calculate_callbacks(state)
 
+        parameters = np.array([delta_t, 0])
         energy = [np.inf]
         callback_result = []
         for it in range(1, max_layers + 1):
-            beta = self.hamiltonian.backend.to_numpy(
-                _loss(parameters, self, self.evol_hamiltonian)
-            )
+            state = self._apply_layer(state, parameters[-2], parameters[-1])
+            # <i[H, M]> = -2 Im(<H psi|M psi>)
+            hstate = self.hamiltonian @ state
+            mstate = self.mixer @ state
+            overlap = backend.np.sum(backend.np.conj(hstate) * mstate)
+            beta = -2 * np.imag(backend.to_numpy(overlap))
 
             if tol is not None:
-                energy.append(
-                    self.hamiltonian.backend.to_numpy(
-                        _loss(parameters, self, self.hamiltonian)
-                    )
-                )
+                overlap = backend.np.sum(backend.np.conj(state) * hstate)
+                energy.append(np.real(backend.to_numpy(overlap)))
                 if abs(energy[-1] - energy[-2]) < tol:
                     break
 
@@ -635,8 +764,10 @@ class FALQON(QAOA):
                 callback_result.append(callback(parameters))
 
             parameters = np.concatenate([parameters, [delta_t, delta_t * beta]])
+        else:
+            state = self._apply_layer(state, parameters[-2], parameters[-1])
 
         self.set_parameters(parameters)
-        final_loss = _loss(parameters, self, self.hamiltonian)
+        final_loss = self.hamiltonian.expectation(state)
         extra = {"energies": energy, "callbacks": callback_result}
         return final_loss, parameters, extra
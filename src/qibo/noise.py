@@ -158,6 +158,8 @@ class NoiseModel:
 
     def __init__(self):
         self.errors = {}
+        # noise channels that follow each ``(gate type, qubits)`` pair
+        self._noise_gates = {}
 
     def add(self, error, gate, qubits=None):
         """Add a quantum error for a specific gate and qubit to the noise model.
@@ -177,38 +179,90 @@ class NoiseModel:
             qubits = (qubits,)
 
         self.errors[gate] = (error, qubits)
+        self._noise_gates = {}
 
-    def apply(self, circuit):
+    def noise_gates(self, gate):
+        """Noise channels that follow a gate according to the noise model.
+
+        Channel objects are created once for every gate type and qubits
+        and are reused for all identical gates.
+
+        Args:
+            gate (:class:`qibo.gates.Gate`): gate of the noiseless circuit.
+
+        Returns:
+            Tuple of :class:`qibo.gates.Channel` to be applied after ``gate``.
+        """
+        key = (gate.__class__, gate.qubits)
+        if key in self._noise_gates:
+            return self._noise_gates.get(key)
+
+        noise_gates = []
+        if gate.__class__ in self.errors:
+            error, qubits = self.errors.get(gate.__class__)
+            if qubits is None:
+                qubits = gate.qubits
+            else:
+                qubits = tuple(set(gate.qubits) & set(qubits))
+            if isinstance(error, CustomError) and qubits:
+                noise_gates.append(error.channel)
+            elif isinstance(error, DepolarizingError) and qubits:
+                noise_gates.append(error.channel(qubits, *error.options))
+            elif isinstance(error, UnitaryError) or isinstance(error, KrausError):
+                if error.rank == 2:
+                    for q in qubits:
+                        noise_gates.append(error.channel([q]))
+                elif error.rank == 2 ** len(qubits):
+                    noise_gates.append(error.channel(qubits))
+            else:
+                for q in qubits:
+                    noise_gates.append(error.channel(q, *error.options))
+
+        noise_gates = tuple(noise_gates)
+        self._noise_gates[key] = noise_gates
+        return noise_gates
+
+    def noisy_queue(self, circuit):
+        """Generator of the gates of a circuit followed by their noise channels.
+
+        Used by the backends to execute circuits created with
+        ``NoiseModel.apply(circuit, lazy=True)``.
+
+        Args:
+            circuit (:class:`qibo.models.circuit.Circuit`): noiseless circuit.
+        """
+        for gate in circuit.queue:
+            yield gate
+            yield from self.noise_gates(gate)
+
+    def apply(self, circuit, lazy=False):
         """Generate a noisy quantum circuit according to the noise model built.
 
         Args:
             circuit (:class:`qibo.models.circuit.Circuit`): quantum circuit
+            lazy (bool): If ``True`` the noise channels are not added to the
+                queue of the returned circuit. Instead they are generated
+                by the backend during execution, which avoids building
+                a new (longer) gate queue. Default is ``False``.
 
         Returns:
             A (:class:`qibo.models.circuit.Circuit`) which corresponds
             to the initial circuit with noise gates added according
             to the noise model.
         """
+        if lazy:
+            noisy_circuit = circuit.copy()
+            noisy_circuit.noise_model = self
+            if not circuit.density_matrix:
+                noisy_circuit.repeated_execution = circuit.repeated_execution or any(
+                    isinstance(channel, gates.UnitaryChannel)
+                    for gate in circuit.queue
+                    for channel in self.noise_gates(gate)
+                )
+            return noisy_circuit
+
         noisy_circuit = circuit.__class__(**circuit.init_kwargs)
         for gate in circuit.queue:
             noisy_circuit.add(gate)
-            if gate.__class__ in self.errors:
-                error, qubits = self.errors.get(gate.__class__)
-                if qubits is None:
-                    qubits = gate.qubits
-                else:
-                    qubits = tuple(set(gate.qubits) & set(qubits))
-                if isinstance(error, CustomError) and qubits:
-                    noisy_circuit.add(error.channel)
-                elif isinstance(error, DepolarizingError) and qubits:
-                    noisy_circuit.add(error.channel(qubits, *error.options))
-                elif isinstance(error, UnitaryError) or isinstance(error, KrausError):
-                    if error.rank == 2:
-                        for q in qubits:
-                            noisy_circuit.add(error.channel([q]))
-                    elif error.rank == 2 ** len(qubits):
-                        noisy_circuit.add(error.channel(qubits))
-                else:
-                    for q in qubits:
-                        noisy_circuit.add(error.channel(q, *error.options))
+            noisy_circuit.add(self.noise_gates(gate))
         return noisy_circuit
@@ -19,6 +19,7 @@ def optimize(
         - :meth:`qibo.optimizers.cmaes`
         - :meth:`qibo.optimizers.newtonian`
         - :meth:`qibo.optimizers.sgd`
+        - :meth:`qibo.optimizers.rotosolve`
 
     Args:
         loss (callable): Loss as a function of ``parameters`` and optional extra
@@ -27,8 +28,8 @@ def optimize(
         initial_parameters (np.ndarray): Initial guess for the variational
             parameters that are optimized.
         args (tuple): optional arguments for the loss function.
-        method (str): Name of optimizer to use. Can be ``'cma'``, ``'sgd'`` or
-            one of the Newtonian methods supported by
+        method (str): Name of optimizer to use. Can be ``'cma'``, ``'sgd'``,
+            ``'rotosolve'`` or one of the Newtonian methods supported by
             :meth:`qibo.optimizers.newtonian` and ``'parallel_L-BFGS-B'``. ``sgd`` is
             only available for backends based on tensorflow.
         jac (dict): Method for computing the gradient vector for scipy optimizers.
@@ -83,6 +84,8 @@ def optimize(
 
             backend = GlobalBackend()
         return sgd(loss, initial_parameters, args, options, compile, backend)
+    elif method == "rotosolve":
+        return rotosolve(loss, initial_parameters, args, tol, callback, options)
     else:
         if backend is None:
             from qibo.backends import GlobalBackend
@@ -265,6 +268,77 @@ def sgd(loss, initial_parameters, args=(), options=None, compile=False, backend=
     return loss(vparams, *args).numpy(), vparams.numpy(), sgd_options
 
 
+def rotosolve(loss, initial_parameters, args=(), tol=None, callback=None, options=None):
+    """Sequential minimal optimization of parametrized rotations (Rotosolve).
+
+    Minimizes the loss with respect to one parameter at a time, assuming that
+    each parameter is the angle of a rotation gate whose generator has
+    eigenvalues :math:`\\pm 1/2` (such as ``RX``, ``RY``, ``RZ``). The loss is
+    then a sinusoid of each parameter and its exact minimum along the
+    parameter is found from three evaluations
+    (`arXiv:1905.09692 <https://arxiv.org/abs/1905.09692>`_).
+    When the loss executes a circuit with ``circuit.cache_states = True`` each
+    evaluation simulates only the gates after the updated parameter.
+
+    Args:
+        loss (callable): Loss as a function of variational parameters to be
+            optimized.
+        initial_parameters (np.ndarray): Initial guess for the variational
+            parameters.
+        args (tuple): optional arguments for the loss function.
+        tol (float): The optimization stops when the loss decreases less than
+            ``tol`` during a sweep over all parameters.
+        callback (callable): Called with the current parameters after each sweep.
+        options (dict): Dictionary with options. Supports the key ``'maxiter'``
+            (int, default: ``100``) for the maximum number of sweeps.
+
+    Returns:
+        (float, np.ndarray, dict): Final loss; best parameters; dictionary
+        with the number of sweeps ``'nit'`` and loss evaluations ``'nfev'``.
+    """
+    import numpy as np
+
+    maxiter = 100
+    if options is not None:
+        maxiter = options.get("maxiter", maxiter)
+    if tol is None:
+        tol = 1e-8
+
+    parameters = np.array(initial_parameters, dtype=float)
+    nfev = 0
+
+    def evaluate(i, theta):
+        nonlocal nfev
+        nfev += 1
+        parameters[i] = theta
+        return float(loss(parameters, *args))
+
+    value = float(loss(parameters, *args))
+    nfev += 1
+    for nit in range(1, maxiter + 1):
+        previous = value
+        for i in range(len(parameters)):
+            phi = parameters[i]
+            m0 = value
+            mplus = evaluate(i, phi + np.pi / 2)
+            mminus = evaluate(i, phi - np.pi / 2)
+            # the loss is ``a * cos(theta - b) + c`` along this parameter
+            c = (mplus + mminus) / 2
+            a = np.hypot(m0 - c, (mplus - mminus) / 2)
+            b = phi + np.arctan2(mplus - mminus, 2 * (m0 - c))
+            theta = np.angle(np.exp(1j * (b + np.pi)))
+            parameters[i] = theta
+            value = c - a
+        if callback is not None:
+            callback(np.copy(parameters))
+        if previous - value < tol:
+            break
+
+    value = float(loss(parameters, *args))
+    nfev += 1
+    return value, parameters, {"nit": nit, "nfev": nfev}
+
+
 class ParallelBFGS:  # pragma: no cover
     """Computes the L-BFGS-B using parallel evaluation using multiprocessing.
     This implementation here is based on https://doi.org/10.32614/RJ-2019-030.
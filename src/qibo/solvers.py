@@ -21,6 +21,7 @@ class BaseSolver:
         else:
             self.backend = hamiltonian(0).backend
             self.hamiltonian = hamiltonian
+        self._hamiltonian_cache = {}
         self.t = 0
 
     @property
@@ -31,13 +32,46 @@ class BaseSolver:
     @t.setter
     def t(self, new_t):
         """Updates solver's current time."""
+        if self._hamiltonian_cache and new_t > self._t:
+            self._hamiltonian_cache = {
+                t: h for t, h in self._hamiltonian_cache.items() if t >= new_t
+            }
+        else:
+            # restarting the evolution, the Hamiltonian may have changed
+            self._hamiltonian_cache = {}
         self._t = new_t
-        self.current_hamiltonian = self.hamiltonian(self.t)
+        self.current_hamiltonian = self.hamiltonian_at(new_t)
+
+    def hamiltonian_at(self, t):
+        """Hamiltonian at time ``t``.
+
+        Evaluations are cached so that Hamiltonians shared between different
+        stages or steps of the solver are constructed only once. Times
+        earlier than the solver's current time are removed from the cache,
+        which is cleared completely when the time is set backwards.
+        """
+        if t not in self._hamiltonian_cache:
+            self._hamiltonian_cache[t] = self.hamiltonian(t)
+        return self._hamiltonian_cache[t]
+
+    def _norm(self, state):
+        np = self.backend.np
+        return float(np.sqrt(np.sum(np.abs(state) ** 2)))
 
     def __call__(self, state):  # pragma: no cover
         # abstract method
         raise_error(NotImplementedError)
 
+    def steps(self, state, nsteps):
+        """Applies ``nsteps`` consecutive time steps to the state.
+
+        Used when the intermediate states are not required, so that solvers
+        can combine operations of consecutive steps.
+        """
+        for _ in range(nsteps):
+            state = self(state)
+        return state
+
 
 class TrotterizedExponential(BaseSolver):
     """Solver that uses Trotterized exponentials.
@@ -45,14 +79,25 @@ class TrotterizedExponential(BaseSolver):
     Created automatically from the :class:`qibo.solvers.Exponential` if the
     given Hamiltonian object is a
     :class:`qibo.hamiltonians.hamiltonians.TrotterHamiltonian`.
+
+    Args:
+        order: Order of the Trotter-Suzuki formula (1, 2 or 4) or ``"qdrift"``
+            for randomized Trotterization. Higher orders allow larger time steps
+            for the same accuracy.
     """
 
-    def __init__(self, dt, hamiltonian):
+    def __init__(self, dt, hamiltonian, order=2):
         super().__init__(dt, hamiltonian)
+        self.order = order
+        self.time_independent = isinstance(hamiltonian, AbstractHamiltonian)
         if isinstance(self.hamiltonian, BaseAdiabaticHamiltonian):
-            self.circuit = lambda t, dt: self.hamiltonian.circuit(self.dt, t=self.t)
+            self.circuit = lambda t, dt: self.hamiltonian.circuit(
+                self.dt, t=self.t, order=self.order
+            )
         else:
-            self.circuit = lambda t, dt: self.hamiltonian(self.t).circuit(self.dt)
+            self.circuit = lambda t, dt: self.hamiltonian(self.t).circuit(
+                self.dt, order=self.order
+            )
 
     def __call__(self, state):
         circuit = self.circuit(self.t, self.dt)
@@ -60,6 +105,29 @@ class TrotterizedExponential(BaseSolver):
         result = self.backend.execute_circuit(circuit, initial_state=state)
         return result.state()
 
+    def steps(self, state, nsteps):
+        """Applies ``nsteps`` Trotter steps to the state.
+
+        For time-independent Hamiltonians the last exponential of each step
+        is fused with the first exponential of the following step, when both
+        belong to the same group as in the second and fourth order formulas
+        (see :meth:`qibo.hamiltonians.hamiltonians.TrotterCircuit.boundary_circuits`).
+        """
+        if not self.time_independent or nsteps < 2:
+            return super().steps(state, nsteps)
+        hamiltonian = self.hamiltonian(self.t)
+        hamiltonian.circuit(self.dt, order=self.order)
+        circuits = hamiltonian.trotter_circuit.boundary_circuits()
+        if circuits is None:
+            return super().steps(state, nsteps)
+
+        first, middle, last = circuits
+        for circuit in [first] + (nsteps - 1) * [middle] + [last]:
+            state = self.backend.execute_circuit(circuit, initial_state=state).state()
+        for _ in range(nsteps):
+            self.t += self.dt
+        return state
+
 
 class Exponential(BaseSolver):
     """Solver that uses the matrix exponential of the Hamiltonian:
@@ -77,53 +145,148 @@ class Exponential(BaseSolver):
         return (propagator @ state[:, self.backend.np.newaxis])[:, 0]
 
 
+class Krylov(BaseSolver):
+    """Solver that applies the evolution operator using a Krylov subspace method.
+
+    The action of :math:`e^{-i H(t) \\delta t}` on the state is approximated in
+    the Krylov subspace generated by the Lanczos iteration, which requires only
+    Hamiltonian-state products. Therefore the full evolution operator is never
+    constructed and symbolic Hamiltonians are applied without calculating
+    their dense matrix.
+
+    Args:
+        krylov_dim (int): Maximum dimension of the Krylov subspace. If the
+            approximation has not converged within this dimension, the
+            subspace is used for a fraction of the time step and the iteration
+            is restarted from the resulting state.
+        atol (float): Tolerance for the a posteriori error estimate of the
+            Lanczos approximation.
+    """
+
+    def __init__(self, dt, hamiltonian, krylov_dim=30, atol=1e-12):
+        super().__init__(dt, hamiltonian)
+        self.krylov_dim = krylov_dim
+        self.atol = atol
+
+    def expmv(self, hamiltonian, state, dt):
+        """Calculates :math:`e^{-i H \\delta t}|\\psi \\rangle` using the Lanczos iteration.
+
+        If the approximation does not converge within ``krylov_dim`` for the
+        whole ``dt``, the Krylov subspace that was built is used to advance
+        the state for the largest fraction of ``dt`` that converges, and the
+        iteration is restarted from the new state for the remaining time.
+        """
+        remaining = dt
+        while remaining > 0:
+            state, step = self._lanczos_step(hamiltonian, state, remaining)
+            remaining -= step
+        return state
+
+    def _lanczos_step(self, hamiltonian, state, dt):
+        """Advances the state for a time step of up to ``dt`` using a single Krylov subspace.
+
+        Returns:
+            The evolved state and the time step that was applied.
+        """
+        import numpy as np
+        from scipy.linalg import eigh_tridiagonal
+
+        bnp = self.backend.np
+        norm = self._norm(state)
+        if norm == 0:
+            return state, dt
+
+        def coefficients(step):
+            return eigvecs @ (np.exp(-1j * step * eigvals) * eigvecs[0])
+
+        vectors = [state / norm]
+        alphas, betas = [], []
+        for j in range(self.krylov_dim):
+            w = hamiltonian @ vectors[j]
+            alphas.append(float(bnp.real(bnp.sum(bnp.conj(vectors[j]) * w))))
+            w = w - alphas[j] * vectors[j]
+            if j > 0:
+                w = w - betas[j - 1] * vectors[j - 1]
+            # full reorthogonalization against the Krylov basis, so that the
+            # tridiagonal approximation remains accurate for large subspaces
+            for v in vectors:
+                w = w - bnp.sum(bnp.conj(v) * w) * v
+            beta = self._norm(w)
+
+            if j == 0:
+                eigvals, eigvecs = np.array(alphas), np.ones((1, 1))
+            else:
+                eigvals, eigvecs = eigh_tridiagonal(alphas, betas)
+            if beta * abs(coefficients(dt)[-1]) < self.atol:
+                break
+            if j == self.krylov_dim - 1:
+                # subspace not large enough for this time step, use it for
+                # the largest fraction of the step that converges
+                while beta * abs(coefficients(dt)[-1]) >= self.atol:
+                    dt = dt / 2
+                break
+            betas.append(beta)
+            vectors.append(w / beta)
+
+        result = 0
+        for c, v in zip(coefficients(dt), vectors):
+            result = result + norm * c * v
+        return result, dt
+
+    def __call__(self, state):
+        state = self.expmv(self.current_hamiltonian, state, self.dt)
+        self.t += self.dt
+        return state
+
+
 class RungeKutta4(BaseSolver):
     """Solver based on the 4th order Runge-Kutta method."""
 
     def __call__(self, state):
         ham1 = self.current_hamiltonian
-        ham2 = self.hamiltonian(self.t + self.dt / 2.0)
-        ham3 = self.hamiltonian(self.t + self.dt)
-        k1 = ham1 @ state
-        k2 = ham2 @ (state + self.dt * k1 / 2.0)
-        k3 = ham2 @ (state + self.dt * k2 / 2.0)
-        k4 = ham3 @ (state + self.dt * k3)
+        ham2 = self.hamiltonian_at(self.t + self.dt / 2.0)
+        ham3 = self.hamiltonian_at(self.t + self.dt)
+        k1 = -1j * (ham1 @ state)
+        k2 = -1j * (ham2 @ (state + self.dt * k1 / 2.0))
+        k3 = -1j * (ham2 @ (state + self.dt * k2 / 2.0))
+        k4 = -1j * (ham3 @ (state + self.dt * k3))
         self.t += self.dt
-        return state - 1j * self.dt * (k1 + 2 * k2 + 2 * k3 + k4) / 6.0
+        return state + self.dt * (k1 + 2 * k2 + 2 * k3 + k4) / 6.0
 
 
 class RungeKutta45(BaseSolver):
     """Solver based on the 5th order Runge-Kutta method."""
 
-    def __call__(self, state):
-        ham1 = self.current_hamiltonian
-        ham2 = self.hamiltonian(self.t + self.dt / 4.0)
-        ham3 = self.hamiltonian(self.t + 3 * self.dt / 8.0)
-        ham4 = self.hamiltonian(self.t + 12 * self.dt / 13.0)
-        ham5 = self.hamiltonian(self.t + self.dt)
-        ham6 = self.hamiltonian(self.t + self.dt / 2.0)
-        k1 = ham1 @ state
-        k2 = ham2 @ (state + self.dt * k1 / 4.0)
-        k3 = ham3 @ (state + self.dt * (3 * k1 + 9 * k2) / 32.0)
-        k4 = ham4 @ (state + self.dt * (1932 * k1 - 7200 * k2 + 7296 * k3) / 2197.0)
-        k5 = ham5 @ (
-            state
-            + self.dt
-            * (439 * k1 / 216.0 - 8 * k2 + 3680 * k3 / 513.0 - 845 * k4 / 4104.0)
+    def stages(self, state, t, dt):
+        """Calculates the six stages of the Runge-Kutta-Fehlberg method."""
+        ham1 = self.hamiltonian_at(t)
+        ham2 = self.hamiltonian_at(t + dt / 4.0)
+        ham3 = self.hamiltonian_at(t + 3 * dt / 8.0)
+        ham4 = self.hamiltonian_at(t + 12 * dt / 13.0)
+        ham5 = self.hamiltonian_at(t + dt)
+        ham6 = self.hamiltonian_at(t + dt / 2.0)
+        k1 = -1j * (ham1 @ state)
+        k2 = -1j * (ham2 @ (state + dt * k1 / 4.0))
+        k3 = -1j * (ham3 @ (state + dt * (3 * k1 + 9 * k2) / 32.0))
+        k4 = -1j * (ham4 @ (state + dt * (1932 * k1 - 7200 * k2 + 7296 * k3) / 2197.0))
+        k5 = state + dt * (
+            439 * k1 / 216.0 - 8 * k2 + 3680 * k3 / 513.0 - 845 * k4 / 4104.0
         )
-        k6 = ham6 @ (
-            state
-            + self.dt
-            * (
-                -8 * k1 / 27.0
-                + 2 * k2
-                - 3544 * k3 / 2565
-                + 1859 * k4 / 4104
-                - 11 * k5 / 40.0
-            )
+        k5 = -1j * (ham5 @ k5)
+        k6 = state + dt * (
+            -8 * k1 / 27.0
+            + 2 * k2
+            - 3544 * k3 / 2565
+            + 1859 * k4 / 4104
+            - 11 * k5 / 40.0
         )
+        k6 = -1j * (ham6 @ k6)
+        return k1, k2, k3, k4, k5, k6
+
+    def __call__(self, state):
+        k1, _, k3, k4, k5, k6 = self.stages(state, self.t, self.dt)
         self.t += self.dt
-        return state - 1j * self.dt * (
+        return state + self.dt * (
             16 * k1 / 135.0
             + 6656 * k3 / 12825.0
             + 28561 * k4 / 56430.0
@@ -132,25 +295,102 @@ class RungeKutta45(BaseSolver):
         )
 
 
+class AdaptiveRungeKutta45(RungeKutta45):
+    """Runge-Kutta-Fehlberg solver with adaptive step size.
+
+    Each call evolves the state by ``dt`` using internal steps whose size is
+    controlled by the difference between the embedded 4th and 5th order
+    solutions. Steps with error larger than ``atol`` are rejected and repeated
+    with a smaller step, while the step grows when the error is small, so that
+    smooth Hamiltonians require fewer Hamiltonian-state products.
+
+    Args:
+        atol (float): Tolerance for the local error estimate of each step.
+        safety (float): Safety factor used when updating the step size.
+        min_dt (float): Minimum allowed internal step size.
+    """
+
+    def __init__(self, dt, hamiltonian, atol=1e-8, safety=0.9, min_dt=1e-12):
+        super().__init__(dt, hamiltonian)
+        self.atol = atol
+        self.safety = safety
+        self.min_dt = min_dt
+        self.step = dt
+
+    def __call__(self, state):
+        final_t = self.t + self.dt
+        while self.t < final_t:
+            remaining = final_t - self.t
+            dt = min(self.step, remaining)
+            k1, _, k3, k4, k5, k6 = self.stages(state, self.t, dt)
+            error = dt * self._norm(
+                k1 / 360.0
+                - 128 * k3 / 4275.0
+                - 2197 * k4 / 75240.0
+                + k5 / 50.0
+                + 2 * k6 / 55.0
+            )
+            if error > 0:
+                factor = self.safety * (self.atol / error) ** 0.2
+                factor = min(max(factor, 0.2), 5.0)
+            else:
+                factor = 5.0
+
+            if error <= self.atol or dt <= self.min_dt:
+                state = state + dt * (
+                    16 * k1 / 135.0
+                    + 6656 * k3 / 12825.0
+                    + 28561 * k4 / 56430.0
+                    - 9 * k5 / 50.0
+                    + 2 * k6 / 55.0
+                )
+                self.t = final_t if dt == remaining else self.t + dt
+                if dt < self.step:
+                    # do not shrink the step because of a truncated final step
+                    self.step = max(self.step, dt * factor)
+                else:
+                    self.step = dt * factor
+            else:
+                self.step = max(dt * factor, self.min_dt)
+        return state
+
+
+TROTTER_ORDERS = {"trotter1": 1, "trotter2": 2, "trotter4": 4, "qdrift": "qdrift"}
+
+
 def get_solver(solver_name, dt, hamiltonian):
-    if solver_name == "exp":
-        if isinstance(hamiltonian, AbstractHamiltonian):
-            h0 = hamiltonian
-        elif isinstance(hamiltonian, BaseAdiabaticHamiltonian):
-            h0 = hamiltonian.h0
-        else:
-            h0 = hamiltonian(0)
+    if isinstance(hamiltonian, AbstractHamiltonian):
+        h0 = hamiltonian
+    elif isinstance(hamiltonian, BaseAdiabaticHamiltonian):
+        h0 = hamiltonian.h0
+    else:
+        h0 = hamiltonian(0)
 
+    if solver_name == "exp":
         if isinstance(h0, SymbolicHamiltonian):
             return TrotterizedExponential(dt, hamiltonian)
         else:
             return Exponential(dt, hamiltonian)
 
+    elif solver_name in TROTTER_ORDERS:
+        if not isinstance(h0, SymbolicHamiltonian):
+            raise_error(
+                TypeError,
+                f"Solver {solver_name} is available only for symbolic Hamiltonians.",
+            )
+        return TrotterizedExponential(dt, hamiltonian, TROTTER_ORDERS[solver_name])
+
+    elif solver_name == "krylov":
+        return Krylov(dt, hamiltonian)
+
     elif solver_name == "rk4":
         return RungeKutta4(dt, hamiltonian)
 
     elif solver_name == "rk45":
         return RungeKutta45(dt, hamiltonian)
 
+    elif solver_name == "rk45_adaptive":
+        return AdaptiveRungeKutta45(dt, hamiltonian)
+
     else:  # pragma: no cover
         raise_error(ValueError, f"Unknown solver {solver_name}.")
@@ -416,6 +416,65 @@ def test_gap(backend, dense, check_degenerate):
         backend.assert_allclose(v, targets.get(k))
 
 
+@pytest.mark.parametrize("dense", [False, True])
+def test_gap_interval(backend, dense):
+    from qibo import hamiltonians
+
+    h0 = hamiltonians.X(6, dense=dense, backend=backend)
+    h1 = hamiltonians.TFIM(6, h=0.5, dense=dense, backend=backend)
+    gap = callbacks.Gap(interval=3)
+    ground = callbacks.Gap(0)
+    evolution = AdiabaticEvolution(
+        h0, h1, lambda t: t, dt=1e-1, callbacks=[gap, ground]
+    )
+    final_state = evolution(final_time=1.0)
+    backend.assert_allclose(gap.times, [0, 0.3, 0.6, 0.9])
+    assert len(ground[:]) == 11
+
+    m0 = backend.to_numpy(h0.matrix)
+    m1 = backend.to_numpy(h1.matrix)
+    target_ground, target_gap = [], []
+    for t in np.linspace(0, 1, 11):
+        eigvals = np.linalg.eigvalsh((1 - t) * m0 + t * m1)
+        target_ground.append(eigvals[0])
+        target_gap.append(eigvals[1] - eigvals[0])
+    values = np.array([backend.to_numpy(x) for x in ground])
+    backend.assert_allclose(values, target_ground, atol=1e-10)
+    values = np.array([backend.to_numpy(x) for x in gap])
+    backend.assert_allclose(values, target_gap[::3], atol=1e-10)
+
+    # restarting the evolution starts a new sequence of evaluations
+    final_state = evolution(final_time=0.2)
+    backend.assert_allclose(gap.times, [0, 0.3, 0.6, 0.9, 0])
+    assert len(ground[:]) == 14
+
+
+def test_gap_small_symbolic(backend):
+    """Check gap callback when all eigenpairs of the Hamiltonian are needed."""
+    from qibo import hamiltonians
+
+    h0 = hamiltonians.X(2, dense=False, backend=backend)
+    h1 = hamiltonians.TFIM(2, h=1, dense=False, backend=backend)
+    gap = callbacks.Gap(check_degenerate=False)
+    ground = callbacks.Gap(0)
+    evolution = AdiabaticEvolution(
+        h0, h1, lambda t: t, dt=1e-1, callbacks=[gap, ground]
+    )
+    final_state = evolution(final_time=1.0)
+
+    m0 = backend.to_numpy(h0.matrix)
+    m1 = backend.to_numpy(h1.matrix)
+    target_ground, target_gap = [], []
+    for t in np.linspace(0, 1, 11):
+        eigvals = np.linalg.eigvalsh((1 - t) * m0 + t * m1)
+        target_ground.append(eigvals[0])
+        target_gap.append(eigvals[1] - eigvals[0])
+    values = np.array([backend.to_numpy(x) for x in ground])
+    backend.assert_allclose(values, target_ground, atol=1e-10)
+    values = np.array([backend.to_numpy(x) for x in gap])
+    backend.assert_allclose(values, target_gap, atol=1e-10)
+
+
 def test_gap_errors():
     """Check errors in gap callback instantiation."""
     # invalid string ``mode``
@@ -424,6 +483,9 @@ def test_gap_errors():
     # invalid ``mode`` type
     with pytest.raises(TypeError):
         gap = callbacks.Gap([])
+    # invalid ``interval``
+    with pytest.raises(ValueError):
+        gap = callbacks.Gap(interval=0)
 
     gap = callbacks.Gap()
     # call before setting evolution model
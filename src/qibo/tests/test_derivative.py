@@ -2,8 +2,9 @@ import numpy as np
 import pytest
 
 from qibo import gates, hamiltonians
-from qibo.derivative import parameter_shift
+from qibo.derivative import adjoint_gradient, parameter_shift, parameter_shift_gradient
 from qibo.models import Circuit
+from qibo.tests.utils import random_state
 
 
 # defining an observable
@@ -11,6 +12,19 @@ def hamiltonian(nqubits, backend):
     return (1 / nqubits) * hamiltonians.Z(nqubits, backend=backend)
 
 
+def inplace_backend():
+    """Numpy backend that overwrites the given state when applying gates."""
+    from qibo.backends import NumpyBackend
+
+    class InplaceBackend(NumpyBackend):
+        def apply_gate(self, gate, state, nqubits):
+            result = super().apply_gate(gate, state, nqubits)
+            state[:] = result
+            return state
+
+    return InplaceBackend()
+
+
 # defining a dummy circuit
 def circuit(nqubits=1):
     c = Circuit(nqubits)
@@ -74,3 +88,152 @@ def test_derivative(backend, scale_factor, grads):
     backend.assert_allclose(grad_0, grads[0], atol=1e-8)
     backend.assert_allclose(grad_1, grads[1], atol=1e-8)
     backend.assert_allclose(grad_2, grads[2], atol=1e-8)
+
+
+def finite_difference_gradient(circuit, hamiltonian, eps=1e-6):
+    backend = hamiltonian.backend
+    params = np.array(circuit.get_parameters(format="flatlist"), dtype=float)
+    gradient = []
+    for i in range(len(params)):
+        shifted = np.copy(params)
+        values = []
+        for shift in (eps, -eps):
+            shifted[i] = params[i] + shift
+            circuit.set_parameters(shifted)
+            state = backend.execute_circuit(circuit).state()
+            values.append(backend.to_numpy(hamiltonian.expectation(state)))
+        gradient.append((values[0] - values[1]) / (2 * eps))
+    circuit.set_parameters(params)
+    return np.array(gradient)
+
+
+@pytest.mark.parametrize("dense", [True, False])
+def test_adjoint_gradient(backend, dense):
+    c = Circuit(3)
+    c.add(gates.H(0))
+    c.add(gates.RY(0, theta=0.1))
+    c.add(gates.RX(1, theta=0.2).controlled_by(0, 2))
+    c.add(gates.CNOT(0, 1))
+    c.add(gates.U3(2, theta=0.3, phi=0.4, lam=0.5))
+    c.add(gates.fSim(1, 2, theta=0.6, phi=0.7))
+    c.add(gates.RZ(1, theta=0.8, trainable=False))
+    c.add(gates.CU1(2, 0, theta=0.9))
+    c.add(gates.RZZ(0, 2, theta=1.0))
+    c.add(gates.M(0, 1))
+    ham = hamiltonians.TFIM(3, h=0.7, dense=dense, backend=backend)
+
+    gradient = adjoint_gradient(c, ham)
+    assert gradient.shape == (9,)
+    target = finite_difference_gradient(c, ham)
+    backend.assert_allclose(gradient, target, atol=1e-7)
+
+
+def test_adjoint_gradient_inplace_backend():
+    c = Circuit(2)
+    c.add(gates.RY(0, theta=0.3))
+    c.add(gates.CNOT(0, 1))
+    c.add(gates.RX(1, theta=0.5))
+    c.add(gates.H(0))
+    backend = inplace_backend()
+    gradient = adjoint_gradient(c, hamiltonians.XXZ(2, backend=backend))
+    target = adjoint_gradient(c, hamiltonians.XXZ(2))
+    backend.assert_allclose(gradient, target, atol=1e-10)
+
+
+def test_adjoint_gradient_parameter_shift(backend):
+    c = circuit(nqubits=1)
+    c.set_parameters(np.linspace(0.1, 1, 3))
+    test_hamiltonian = hamiltonian(nqubits=1, backend=backend)
+    gradient = adjoint_gradient(c, test_hamiltonian)
+    target = [parameter_shift(c, test_hamiltonian, i) for i in range(3)]
+    backend.assert_allclose(gradient, target, atol=1e-10)
+
+
+def test_adjoint_gradient_errors(backend):
+    c = circuit(nqubits=1)
+    with pytest.raises(TypeError):
+        adjoint_gradient(c, c)
+    ham = hamiltonian(nqubits=1, backend=backend)
+    c = Circuit(1, density_matrix=True)
+    c.add(gates.RX(0, theta=0.1))
+    with pytest.raises(NotImplementedError):
+        adjoint_gradient(c, ham)
+    c = Circuit(1)
+    c.add(gates.RX(0, theta=0.1))
+    c.add(gates.PauliNoiseChannel(0, px=0.1))
+    with pytest.raises(NotImplementedError):
+        adjoint_gradient(c, ham)
+    c = Circuit(1)
+    c.add(gates.Unitary(np.eye(2), 0))
+    with pytest.raises(NotImplementedError):
+        adjoint_gradient(c, ham)
+    c = Circuit(2)
+    c.add(gates.RX(0, theta=0.1))
+    c.add(gates.RY(0, theta=0.2))
+    with pytest.raises(NotImplementedError):
+        adjoint_gradient(c.fuse(), hamiltonian(nqubits=2, backend=backend))
+
+
+@pytest.mark.parametrize("dense", [True, False])
+@pytest.mark.parametrize("scale_factor", [1, 0.5])
+def test_parameter_shift_gradient(backend, dense, scale_factor):
+    c = Circuit(3)
+    c.add(gates.H(0))
+    c.add(gates.RY(0, theta=0.1))
+    c.add(gates.RX(1, theta=0.2))
+    c.add(gates.CNOT(0, 1))
+    c.add(gates.RZ(2, theta=0.3))
+    c.add(gates.RX(1, theta=0.4, trainable=False))
+    c.add(gates.CZ(2, 0))
+    c.add(gates.RY(2, theta=0.5))
+    c.add(gates.M(0, 1))
+    ham = hamiltonians.TFIM(3, h=0.7, dense=dense, backend=backend)
+    initial_state = random_state(3)
+
+    gradient = parameter_shift_gradient(c, ham, initial_state, scale_factor)
+    target = [parameter_shift(c, ham, i, initial_state, scale_factor) for i in range(4)]
+    backend.assert_allclose(gradient, target, atol=1e-10)
+    target = scale_factor * adjoint_gradient(c, ham, initial_state)
+    backend.assert_allclose(gradient, target, atol=1e-10)
+
+
+def test_parameter_shift_gradient_inplace_backend():
+    c = Circuit(2)
+    c.add(gates.RY(0, theta=0.3))
+    c.add(gates.CNOT(0, 1))
+    c.add(gates.RX(1, theta=0.5))
+    c.add(gates.H(0))
+    backend = inplace_backend()
+    gradient = parameter_shift_gradient(c, hamiltonians.XXZ(2, backend=backend))
+    target = parameter_shift_gradient(c, hamiltonians.XXZ(2))
+    backend.assert_allclose(gradient, target, atol=1e-10)
+
+
+def test_parameter_shift_gradient_errors(backend):
+    c = circuit(nqubits=1)
+    with pytest.raises(TypeError):
+        parameter_shift_gradient(c, c)
+    ham = hamiltonian(nqubits=1, backend=backend)
+    c = Circuit(1, density_matrix=True)
+    c.add(gates.RX(0, theta=0.1))
+    with pytest.raises(NotImplementedError):
+        parameter_shift_gradient(c, ham)
+    c = Circuit(1)
+    c.add(gates.RX(0, theta=0.1))
+    c.add(gates.PauliNoiseChannel(0, px=0.1))
+    with pytest.raises(NotImplementedError):
+        parameter_shift_gradient(c, ham)
+    c = Circuit(2)
+    c.add(gates.RX(0, theta=0.1))
+    c.add(gates.RY(0, theta=0.2))
+    with pytest.raises(NotImplementedError):
+        parameter_shift_gradient(c.fuse(), hamiltonian(nqubits=2, backend=backend))
+    # gate without generator eigenvalue
+    c = Circuit(1)
+    c.add(gates.U1(0, theta=0.1))
+    with pytest.raises(NotImplementedError):
+        parameter_shift_gradient(c, ham)
+    c = Circuit(2)
+    c.add(gates.RX(0, theta=0.1).controlled_by(1))
+    with pytest.raises(NotImplementedError):
+        parameter_shift_gradient(c, hamiltonian(nqubits=2, backend=backend))
@@ -150,6 +150,28 @@ def test_pauli_noise_channel(backend):
     assert norm < PRECISION_TOL
 
 
+@pytest.mark.parametrize("nqubits,target", [(1, 0), (3, 0), (3, 1), (4, 3)])
+def test_pauli_noise_channel_density_matrix(backend, nqubits, target):
+    """Check the Pauli error kernel against the sum of Pauli conjugations."""
+    initial_rho = random_density_matrix(nqubits)
+    channel = gates.PauliNoiseChannel(target, px=0.1, py=0.2, pz=0.3)
+    final_rho = channel.apply_density_matrix(backend, np.copy(initial_rho), nqubits)
+    target_rho = backend.apply_channel_density_matrix(
+        channel, np.copy(initial_rho), nqubits
+    )
+    backend.assert_allclose(final_rho, target_rho)
+
+
+@pytest.mark.parametrize("qubits", [(0,), (2,), (1, 2), (0, 2), (0, 1, 3)])
+def test_depolarizing_channel_density_matrix(backend, qubits):
+    """Check the depolarizing error kernel against the sum of Pauli conjugations."""
+    initial_rho = random_density_matrix(4)
+    channel = gates.DepolarizingChannel(qubits, 0.3)
+    final_rho = channel.apply_density_matrix(backend, np.copy(initial_rho), 4)
+    target_rho = backend.apply_channel_density_matrix(channel, np.copy(initial_rho), 4)
+    backend.assert_allclose(final_rho, target_rho)
+
+
 def test_depolarizing_channel(backend):
     initial_rho = random_density_matrix(3)
     lam = 0.3
@@ -417,3 +417,82 @@ def test_hamiltonian_exponentiation(backend, sparse_type, dense):
 
     backend.assert_allclose(H.exp(0.5), target_matrix)
     backend.assert_allclose(H1.exp(0.5), target_matrix)
+
+
+@pytest.mark.parametrize("sparse_type", [None, "csr"])
+def test_hamiltonian_energies(backend, sparse_type):
+    if sparse_type is not None and backend.name == "tensorflow":
+        pytest.skip("Tensorflow does not support operations with sparse matrices.")
+    diagonal = np.random.random(16)
+    matrix = np.diag(diagonal)
+    if sparse_type is not None:
+        from scipy import sparse
+
+        matrix = getattr(sparse, f"{sparse_type}_matrix")(matrix)
+    ham = hamiltonians.Hamiltonian(4, matrix, backend=backend)
+    backend.assert_allclose(ham.energies, diagonal)
+    assert ham.energies is ham.energies
+    ham = hamiltonians.TFIM(4, h=1.0, backend=backend)
+    assert ham.energies is None
+
+
+@pytest.mark.parametrize("sparse_type", [None, "csr"])
+def test_hamiltonian_partial_eigenvectors(backend, sparse_type):
+    if sparse_type is not None and backend.name == "tensorflow":
+        pytest.skip("Tensorflow does not support operations with sparse matrices.")
+    ham = hamiltonians.TFIM(6, h=1.0, backend=backend)
+    matrix = backend.to_numpy(ham.matrix)
+    if sparse_type is not None:
+        from scipy import sparse
+
+        ham = hamiltonians.Hamiltonian(6, sparse.csr_matrix(matrix), backend=backend)
+    target_values, target_vectors = np.linalg.eigh(matrix)
+
+    eigvals, eigvecs = ham.partial_eigenvectors(k=3)
+    backend.assert_allclose(eigvals, target_values[:3])
+    eigvecs = backend.to_numpy(eigvecs)
+    backend.assert_allclose(matrix @ eigvecs, eigvecs * target_values[:3], atol=1e-8)
+    # warm start from the eigenvectors of a slightly different Hamiltonian
+    ham2 = hamiltonians.TFIM(6, h=1.05, backend=backend)
+    target_values2 = np.linalg.eigvalsh(backend.to_numpy(ham2.matrix))
+    eigvals, _ = ham2.partial_eigenvectors(k=3, v0=eigvecs)
+    backend.assert_allclose(eigvals, target_values2[:3])
+    # shift-invert for interior eigenvalues
+    sigma = 0.3
+    eigvals, _ = ham.partial_eigenvectors(k=2, sigma=sigma)
+    target = np.sort(target_values[np.argsort(np.abs(target_values - sigma))[:2]])
+    backend.assert_allclose(eigvals, target, atol=1e-10)
+    # ground state without full diagonalization
+    ham.FULL_DIAGONALIZATION_QUBITS = 0
+    ground_state = backend.to_numpy(ham.ground_state())
+    assert ham._eigenvectors is None
+    backend.assert_allclose(np.abs(np.vdot(ground_state, target_vectors[:, 0])), 1)
+
+
+@pytest.mark.parametrize("full_qubits", [0, 10])
+def test_hamiltonian_ground_state_deterministic(backend, full_qubits):
+    """Check that degenerate ground states do not change between calls."""
+    ham = hamiltonians.MaxCut(4, backend=backend)
+    ham.FULL_DIAGONALIZATION_QUBITS = full_qubits
+    target = backend.to_numpy(ham.ground_state())
+    for _ in range(3):
+        backend.assert_allclose(ham.ground_state(), target)
+    ham = hamiltonians.TFIM(4, h=0, dense=False, backend=backend)
+    target = backend.to_numpy(ham.ground_state())
+    for _ in range(3):
+        backend.assert_allclose(ham.ground_state(), target)
+    # phase does not depend on whether the eigenvectors were calculated
+    ham = hamiltonians.XXZ(4, delta=0.5, backend=backend)
+    ham.FULL_DIAGONALIZATION_QUBITS = full_qubits
+    target = backend.to_numpy(ham.ground_state())
+    ham.eigenvectors()
+    backend.assert_allclose(ham.ground_state(), target, atol=1e-8)
+
+
+def test_partial_eigenvectors_small_matrix(backend):
+    ham = hamiltonians.XXZ(2, backend=backend)
+    target_values = np.linalg.eigvalsh(backend.to_numpy(ham.matrix))
+    eigvals, eigvecs = ham.partial_eigenvectors(k=3)
+    backend.assert_allclose(eigvals, target_values[:3])
+    eigvals, eigvecs = ham.partial_eigenvectors(k=3, sigma=-3)
+    backend.assert_allclose(eigvals, target_values[:3])
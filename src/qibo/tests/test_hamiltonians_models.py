@@ -52,3 +52,27 @@ def test_maxcut(backend, nqubits, dense, calcterms):
     if (not dense) and calcterms:
         _ = final_ham.terms
     backend.assert_allclose(final_ham.matrix, target_ham)
+
+
+@pytest.mark.parametrize(
+    "model,kwargs",
+    [
+        ("TFIM", {"nqubits": 4, "h": 0.5}),
+        ("XXZ", {"nqubits": 4, "delta": 0.5}),
+        ("X", {"nqubits": 3}),
+        ("Y", {"nqubits": 3}),
+        ("Z", {"nqubits": 3}),
+        ("MaxCut", {"nqubits": 4}),
+    ],
+)
+def test_hamiltonian_models_sparse(backend, model, kwargs):
+    """Test that sparse model matrices agree with the symbolic construction."""
+    from scipy import sparse
+
+    if backend.name == "tensorflow":
+        pytest.skip("Tensorflow does not support scipy sparse matrices.")
+    sparse_ham = getattr(hamiltonians, model)(**kwargs, sparse=True, backend=backend)
+    assert sparse.issparse(sparse_ham.matrix)
+    symbolic_ham = getattr(hamiltonians, model)(**kwargs, dense=False, backend=backend)
+    target = backend.to_numpy(symbolic_ham.matrix)
+    backend.assert_allclose(sparse_ham.matrix.toarray(), target)
@@ -5,14 +5,12 @@ import sympy
 
 from qibo import gates, hamiltonians
 from qibo.models import Circuit
-from qibo.symbols import I, Y, Z
+from qibo.symbols import I, X, Y, Z
 from qibo.tests.utils import random_complex
 
 
 def symbolic_tfim(nqubits, h=1.0):
     """Constructs symbolic Hamiltonian for TFIM."""
-    from qibo.symbols import X, Z
-
     sham = -sum(Z(i) * Z(i + 1) for i in range(nqubits - 1))
     sham -= Z(0) * Z(nqubits - 1)
     sham -= h * sum(X(i) for i in range(nqubits))
@@ -56,8 +54,6 @@ def test_symbolictfim_hamiltonian_to_dense(backend, nqubits, calcterms):
 @pytest.mark.parametrize("nqubits", [3, 4])
 @pytest.mark.parametrize("calcterms", [False, True])
 def test_symbolicxxz_hamiltonian_to_dense(backend, nqubits, calcterms):
-    from qibo.symbols import X, Y, Z
-
     sham = sum(X(i) * X(i + 1) for i in range(nqubits - 1))
     sham += sum(Y(i) * Y(i + 1) for i in range(nqubits - 1))
     sham += 0.5 * sum(Z(i) * Z(i + 1) for i in range(nqubits - 1))
@@ -304,7 +300,7 @@ def test_hamiltonian_expectation_from_samples_errors(backend):
 @pytest.mark.parametrize("density_matrix", [False, True])
 @pytest.mark.parametrize("calcterms", [False, True])
 def test_symbolic_hamiltonian_abstract_symbol_ev(backend, density_matrix, calcterms):
-    from qibo.symbols import Symbol, X
+    from qibo.symbols import Symbol
 
     matrix = np.random.random((2, 2))
     form = X(0) * Symbol(1, matrix) + Symbol(0, matrix) * X(1)
@@ -345,3 +341,197 @@ def test_trotter_hamiltonian_operation_errors(backend):
     h2 = hamiltonians.XXZ(3, dense=False, backend=backend)
     with pytest.raises(NotImplementedError):
         h = h1 @ h2
+
+
+@pytest.mark.parametrize("density_matrix", [False, True])
+def test_symbolic_hamiltonian_pauli_sum_matmul(backend, density_matrix):
+    """Test matmul of Hamiltonians with Pauli products on the same qubit."""
+    form = X(0) * Y(0) * Z(1) + 0.5 * Y(1) * X(2) * Y(1) - 2 * Z(0) * Y(2) + 3
+    local_ham = hamiltonians.SymbolicHamiltonian(form, backend=backend)
+    assert local_ham.pauli_sum is not None
+    if density_matrix:
+        state = backend.cast(random_complex((8, 8)))
+    else:
+        state = backend.cast(random_complex((8,)))
+    backend.assert_allclose(local_ham @ state, local_ham.matrix @ state)
+
+
+@pytest.mark.parametrize("density_matrix", [False, True])
+def test_symbolic_hamiltonian_expectation_from_circuit(backend, density_matrix):
+    form = 0.5 * X(0) * X(1) + Y(0) * Z(2) - 0.3 * Z(0) * Z(1) + 0.7 * X(1) * Y(2) + 2
+    ham = hamiltonians.SymbolicHamiltonian(form, backend=backend)
+    circuits = ham.measurement_circuits(density_matrix=density_matrix)
+    assert len(circuits) == len(ham.measurement_groups) == 3
+    c = Circuit(3, density_matrix=density_matrix)
+    c.add(gates.RX(q, theta=np.random.random()) for q in range(3))
+    c.add(gates.RY(q, theta=np.random.random()) for q in range(3))
+    c.add(gates.CNOT(0, 1))
+    c.add(gates.CNOT(1, 2))
+    target = ham.expectation(backend.execute_circuit(c).state())
+    nshots = 10**5
+    expval = ham.expectation_from_circuit(c, nshots=nshots)
+    backend.assert_allclose(expval, target, atol=10 / np.sqrt(nshots))
+    expval = ham.expectation_from_circuit(c, nshots=[nshots, 2 * nshots, nshots])
+    backend.assert_allclose(expval, target, atol=10 / np.sqrt(nshots))
+
+
+def test_symbolic_hamiltonian_expectation_from_circuit_errors(backend):
+    from qibo.symbols import Symbol
+
+    ham = hamiltonians.SymbolicHamiltonian(X(0) * Y(1) + Z(0), backend=backend)
+    c = Circuit(2)
+    c.add(gates.H(0))
+    with pytest.raises(ValueError):
+        ham.expectation_from_circuit(c, nshots=[100, 100, 100])
+    c.add(gates.M(0, 1))
+    with pytest.raises(ValueError):
+        ham.expectation_from_circuit(c)
+    form = X(0) * Symbol(1, np.random.random((2, 2)))
+    ham = hamiltonians.SymbolicHamiltonian(form, backend=backend)
+    with pytest.raises(NotImplementedError):
+        ham.measurement_circuits()
+
+
+def test_symbolic_hamiltonian_allocate_shots(backend):
+    form = 3 * X(0) * X(1) + Z(0) * Z(1) + 0.5 * Z(0) + 0.5 * Z(1) + Y(0)
+    ham = hamiltonians.SymbolicHamiltonian(form, backend=backend)
+    groups = ham.measurement_groups
+    weights = [sum(abs(ham.pauli_sum.coefficients[i]) for i in g) for g in groups]
+    nshots = ham.allocate_shots(1003)
+    assert sum(nshots) == 1003
+    assert np.argmax(nshots) == np.argmax(weights)
+    with pytest.raises(ValueError):
+        ham.allocate_shots(len(groups) - 1)
+
+    # the state is an eigenstate of X(0) * X(1) so its group has zero variance
+    c = Circuit(2)
+    c.add(gates.H(0))
+    c.add(gates.H(1))
+    nshots = ham.allocate_shots(1000, circuit=c, pilot_nshots=100)
+    assert sum(nshots) == 1000
+    assert nshots[np.argmax(weights)] == 1
+    target = ham.expectation(backend.execute_circuit(c).state())
+    expval = ham.expectation_from_circuit(c, nshots=nshots)
+    backend.assert_allclose(expval, target, atol=0.5)
+
+
+@pytest.mark.parametrize("nqubits", [3, 4])
+def test_symbolic_hamiltonian_from_pauli_sum(backend, nqubits):
+    from qibo.hamiltonians.terms import PauliSumBuilder
+
+    builder = PauliSumBuilder()
+    for i in range(nqubits):
+        builder.add(-1, {i: "Z", (i + 1) % nqubits: "Z"})
+        builder.add(-1, {i: "X"})
+    builder.add(2, {})
+    ham = hamiltonians.SymbolicHamiltonian.from_pauli_sum(builder.build(), backend)
+    assert ham._form is None
+    assert ham.nqubits == nqubits
+    target_ham = hamiltonians.TFIM(nqubits, h=1.0, backend=backend) + 2
+    backend.assert_allclose(ham.matrix, target_ham.matrix)
+    state = backend.cast(random_complex((2**nqubits,)))
+    backend.assert_allclose(ham @ state, target_ham @ state)
+    backend.assert_allclose(ham.expectation(state), target_ham.expectation(state))
+
+    # arithmetic with Hamiltonians that have a symbolic form
+    other = X(0) * Y(1) + 0.5 * Z(nqubits - 1)
+    other = hamiltonians.SymbolicHamiltonian(other, backend=backend)
+    matrix, other_matrix = target_ham.matrix, other.matrix
+    for sum_ham in (ham + other, other + ham):
+        backend.assert_allclose(sum_ham.matrix, matrix + other_matrix)
+    backend.assert_allclose((ham - other).matrix, matrix - other_matrix)
+    backend.assert_allclose((other - ham).matrix, other_matrix - matrix)
+    backend.assert_allclose((ham @ other).matrix, matrix @ other_matrix)
+    backend.assert_allclose((ham @ ham).matrix, matrix @ matrix)
+
+
+def test_symbolic_hamiltonian_from_pauli_sum_constant(backend):
+    from qibo.hamiltonians.terms import PauliSum
+
+    pauli_sum = PauliSum.from_strings([(2, {}), (0.5, {1: "I"})], nqubits=2)
+    ham = hamiltonians.SymbolicHamiltonian.from_pauli_sum(pauli_sum, backend)
+    assert ham.terms == []
+    assert ham.nqubits == 2
+    backend.assert_allclose(ham.matrix, 2.5 * np.eye(4))
+    state = backend.cast(random_complex((4,)))
+    backend.assert_allclose(ham @ state, 2.5 * state)
+
+
+def test_symbolic_hamiltonian_dense_from_unordered_terms(backend):
+    from qibo.hamiltonians.terms import HamiltonianTerm
+
+    matrix1 = random_complex((4, 4))
+    matrix2 = random_complex((2, 2))
+    ham = hamiltonians.SymbolicHamiltonian(backend=backend)
+    ham.terms = [
+        HamiltonianTerm(matrix1, 2, 0),
+        HamiltonianTerm(matrix2, 1),
+        HamiltonianTerm(2 * matrix1, 2, 0),
+    ]
+    ham.constant = 1.5
+    # permutation that moves qubit 2 to the first position
+    target = np.kron(3 * matrix1, np.eye(2)).reshape(6 * (2,))
+    target = np.transpose(target, [1, 2, 0, 4, 5, 3]).reshape(8, 8)
+    target += np.kron(np.kron(np.eye(2), matrix2), np.eye(2))
+    target += 1.5 * np.eye(8)
+    backend.assert_allclose(ham.matrix, target)
+
+
+@pytest.mark.parametrize("nqubits", [3, 4])
+def test_symbolic_hamiltonian_energies(backend, nqubits):
+    form = sum(Z(i) * Z(i + 1) for i in range(nqubits - 1)) - 0.5 * Z(0) + 2
+    ham = hamiltonians.SymbolicHamiltonian(form, backend=backend)
+    target = np.real(np.diagonal(backend.to_numpy(ham.matrix)))
+    backend.assert_allclose(ham.energies, target)
+    # terms that are not products of Pauli operators
+    ham = hamiltonians.TFIM(nqubits, h=0.0, dense=False, backend=backend)
+    assert ham.pauli_sum is None
+    target = np.real(np.diagonal(backend.to_numpy(ham.matrix)))
+    backend.assert_allclose(ham.energies, target)
+    ham = hamiltonians.SymbolicHamiltonian(form + X(0), backend=backend)
+    assert ham.energies is None
+    # the diagonal is available also for non-diagonal Hamiltonians
+    target = np.real(np.diagonal(backend.to_numpy(ham.matrix)))
+    backend.assert_allclose(ham.diagonal(), target)
+    ham = hamiltonians.TFIM(nqubits, h=1.0, dense=False, backend=backend)
+    target = np.real(np.diagonal(backend.to_numpy(ham.matrix)))
+    backend.assert_allclose(ham.diagonal(), target)
+
+
+def test_symbolic_hamiltonian_partial_eigenvectors(backend):
+    ham = hamiltonians.TFIM(6, h=1.0, dense=False, backend=backend)
+    eigvals, eigvecs = ham.partial_eigenvectors(k=2)
+    ground_state = backend.to_numpy(ham.ground_state())
+    # the dense form is not calculated
+    assert ham._dense is None
+    target_values, target_vectors = np.linalg.eigh(backend.to_numpy(ham.matrix))
+    backend.assert_allclose(eigvals, target_values[:2])
+    backend.assert_allclose(np.abs(np.vdot(ground_state, target_vectors[:, 0])), 1)
+    # shift-invert uses the dense form
+    eigvals, _ = ham.partial_eigenvectors(k=1, sigma=target_values[3] + 1e-3)
+    backend.assert_allclose(eigvals, target_values[3:4])
+
+
+@pytest.mark.parametrize("nqubits", [1, 2])
+def test_symbolic_hamiltonian_ground_state_small(backend, nqubits):
+    """Test the matrix-free ground state for operators that ARPACK cannot handle."""
+    form = sum(X(i) for i in range(nqubits)) + 0.5 * Z(0)
+    ham = hamiltonians.SymbolicHamiltonian(form, backend=backend)
+    ground_state = backend.to_numpy(ham.ground_state())
+    assert ham._dense is None
+    target_values, target_vectors = np.linalg.eigh(backend.to_numpy(ham.matrix))
+    backend.assert_allclose(np.abs(np.vdot(ground_state, target_vectors[:, 0])), 1)
+    eigvals, _ = ham.partial_eigenvectors(k=2**nqubits - 1)
+    backend.assert_allclose(eigvals, target_values[:-1])
+    ham = hamiltonians.X(nqubits, dense=False, backend=backend)
+    backend.assert_allclose(
+        ham.ground_state(), np.ones(2**nqubits) / 2 ** (nqubits / 2)
+    )
+
+
+def test_partial_eigenvectors_matrix_free_sigma_error(backend):
+    from qibo.hamiltonians.hamiltonians import _linear_operator
+
+    ham = hamiltonians.TFIM(3, h=1.0, dense=False, backend=backend)
+    with pytest.raises(NotImplementedError):
+        backend.calculate_partial_eigenvectors(_linear_operator(ham), k=1, sigma=0.1)
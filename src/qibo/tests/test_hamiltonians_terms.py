@@ -4,7 +4,7 @@ import pytest
 
 from qibo import gates, matrices, models
 from qibo.hamiltonians import terms
-from qibo.tests.utils import random_density_matrix, random_state
+from qibo.tests.utils import random_complex, random_density_matrix, random_state
 
 
 def test_hamiltonian_term_initialization(backend):
@@ -70,6 +70,38 @@ def test_hamiltonian_term_exponentiation(backend):
     backend.assert_allclose(final_state, target_state)
 
 
+def test_hamiltonian_term_hermitian_exponentiation(backend):
+    """Test exponentiation of Hermitian terms using the cached eigendecomposition."""
+    from scipy.linalg import expm
+
+    matrix = random_complex((4, 4))
+    matrix = matrix + np.conj(matrix).T
+    term = terms.HamiltonianTerm(matrix, 0, 1)
+    for x in [0.5, 0.1, -2]:
+        backend.assert_allclose(term.exp(x), expm(-1j * x * matrix))
+    assert term._eigenvectors is not None
+
+
+def test_term_group_exp(backend):
+    """Test ``TermGroup.exp`` with coefficients of different Hamiltonians."""
+    from scipy.linalg import expm
+
+    matrix0 = random_complex((4, 4))
+    matrix0 = matrix0 + np.conj(matrix0).T
+    matrix1 = np.kron(matrices.X, np.eye(2))
+    term0 = terms.HamiltonianTerm(matrix0, 0, 1)
+    term0.hamiltonian = "h0"
+    term1 = terms.HamiltonianTerm(matrices.X, 0)
+    term1.hamiltonian = "h1"
+    group = terms.TermGroup(term0)
+    coefficients = {"h0": 0.3, "h1": 0.7}
+    target = expm(-0.5j * 0.3 * matrix0)
+    backend.assert_allclose(group.exp(0.5, coefficients), target)
+    group.append(term1)
+    target = expm(-0.5j * (0.3 * matrix0 + 0.7 * matrix1))
+    backend.assert_allclose(group.exp(0.5, coefficients), target)
+
+
 def test_hamiltonian_term_mul(backend):
     """Test scalar multiplication of ``HamiltonianTerm``."""
     matrix = np.random.random((4, 4))
@@ -231,3 +263,162 @@ def test_term_group_to_term(backend):
     matrix3 = np.kron(np.kron(np.eye(2), matrices.X), np.eye(2))
     target_matrix = matrix + matrix2 + 2 * matrix3
     backend.assert_allclose(group.term.matrix, target_matrix)
+
+
+def test_pauli_sum_from_terms(backend):
+    """Test ``PauliSum`` simplifies products of Pauli operators."""
+    from qibo.hamiltonians import SymbolicHamiltonian
+    from qibo.symbols import X, Y, Z
+
+    expressions = [X(0) * Y(0) * Z(2), Y(1) * Z(1) * Y(1) * X(2), Y(0) * X(2)]
+    sterms = [terms.SymbolicTerm(c, e) for c, e in zip([1, 2, -0.5], expressions)]
+    paulis = terms.PauliSum.from_terms(sterms)
+    assert paulis.nqubits == 3
+    backend.assert_allclose(paulis.xmasks, [0, 4, 5])
+    backend.assert_allclose(paulis.zmasks, [5, 2, 1])
+    backend.assert_allclose(paulis.coefficients, [1j, -2, -0.5])
+    form = X(0) * Y(0) * Z(2) + 2 * Y(1) * Z(1) * Y(1) * X(2) - 0.5 * Y(0) * X(2)
+    target_matrix = SymbolicHamiltonian(form, backend=backend).matrix
+    backend.assert_allclose(paulis.matrix(), target_matrix)
+    backend.assert_allclose(paulis.matrix(sparse=True).toarray(), target_matrix)
+
+
+def test_pauli_sum_sparse_matrix_structure(backend):
+    """Test the CSR arrays of ``PauliSum.matrix`` for a large number of qubits."""
+    from qibo import hamiltonians
+
+    nqubits = 14
+    strings = []
+    for i in range(nqubits):
+        strings.append((-1.0, {i: "Z", (i + 1) % nqubits: "Z"}))
+        strings.append((-0.5, {i: "X"}))
+        strings.append((0.3, {i: "Y", (i + 1) % nqubits: "X"}))
+    paulis = terms.PauliSum.from_strings(strings, nqubits)
+    matrix = paulis.matrix(sparse=True)
+    # one element per distinct X part on each row, with 32-bit indices
+    nnz_per_row = 2 * nqubits + 1
+    assert matrix.nnz == nnz_per_row * 2**nqubits
+    np.testing.assert_array_equal(np.diff(matrix.indptr), nnz_per_row)
+    assert matrix.indices.dtype == np.int32
+    assert matrix.data.nbytes + matrix.indices.nbytes == matrix.nnz * 20
+    assert matrix.has_sorted_indices
+    np.testing.assert_array_equal(
+        np.diff(matrix.indices.reshape(-1, nnz_per_row), axis=1) > 0, True
+    )
+    # compare with the matrix-free application of the same strings
+    ham = hamiltonians.SymbolicHamiltonian.from_pauli_sum(paulis, backend=backend)
+    state = random_state(nqubits)
+    backend.assert_allclose(matrix @ state, ham @ backend.cast(state), atol=1e-10)
+
+
+def test_pauli_sum_from_terms_not_pauli():
+    """Test ``PauliSum`` is not created for terms that are not Pauli strings."""
+    from qibo.symbols import Symbol, X
+
+    sterm = terms.SymbolicTerm(1, X(0) * Symbol(1, np.random.random((2, 2))))
+    assert terms.PauliSum.from_terms([sterm]) is None
+    hterm = terms.HamiltonianTerm(matrices.X, 0)
+    assert terms.PauliSum.from_terms([hterm]) is None
+
+
+def test_pauli_sum_errors():
+    with pytest.raises(ValueError):
+        terms.PauliSum([0, 1], [1], [1, 2])
+    with pytest.raises(ValueError):
+        terms.PauliSum.from_strings([(1, {0: "X", 1: "x"})])
+    builder = terms.PauliSumBuilder()
+    with pytest.raises(ValueError):
+        builder.add(1, {0: "A"})
+
+
+@pytest.mark.parametrize("density_matrix", [False, True])
+def test_apply_pauli_sum(backend, density_matrix):
+    """Test applying ``PauliSum`` to states without using gates."""
+    strings = [
+        (0.5, {0: "X", 2: "Z"}),
+        (1 - 2j, {1: "Y", 2: "X", 3: "Z"}),
+        (2, {0: "Y", 3: "Y"}),
+        (-1, {1: "Z"}),
+    ]
+    paulis = terms.PauliSum.from_strings(strings, nqubits=4)
+    state = random_density_matrix(4) if density_matrix else random_state(4)
+    final_state = backend.apply_pauli_sum(paulis, np.copy(state), 4)
+    backend.assert_allclose(final_state, paulis.matrix() @ state)
+
+
+def test_pauli_sum_qubitwise_commuting_groups():
+    strings = [
+        (0.5, {0: "X", 1: "X"}),
+        (1.0, {0: "Y", 2: "Z"}),
+        (-0.3, {0: "Z", 1: "Z"}),
+        (0.7, {1: "X", 2: "Y"}),
+        (0.2, {1: "Z"}),
+        (0.1, {2: "Z"}),
+    ]
+    paulis = terms.PauliSum.from_strings(strings)
+    groups = paulis.qubitwise_commuting_groups()
+    assert sorted(i for g in groups for i in g) == list(range(len(strings)))
+    for group in groups:
+        basis = paulis.measurement_basis(group)
+        for i in group:
+            for q, pauli in strings[i][1].items():
+                assert basis[q] == pauli
+    assert [list(g) for g in groups] == [[1, 4, 5], [3, 0], [2]]
+
+
+def test_pauli_sum_builder():
+    builder = terms.PauliSumBuilder()
+    builder.add(1, {0: "X", 2: "Z"})
+    builder.add(0.5, {1: "Y"})
+    builder.add(2, {2: "Z", 0: "X"})
+    builder.add(-0.5, {1: "Y"})
+    builder.add(3, {})
+    builder.add(-1, {1: "I"})
+    assert len(builder) == 3
+    paulis = builder.build(nqubits=4)
+    assert paulis.nqubits == 4
+    assert len(paulis) == 2
+    table = sorted(zip(paulis.xmasks, paulis.zmasks, paulis.coefficients))
+    assert table == [(0, 0, 2), (1, 4, 3)]
+
+
+def test_pauli_sum_to_terms(backend):
+    from qibo.symbols import X, Y, Z
+
+    strings = [(1, {0: "X", 2: "Z"}), (0.5, {1: "Y", 2: "X"}), (2, {})]
+    sterms = terms.PauliSum.from_strings(strings).to_terms()
+    assert len(sterms) == 2
+    assert sterms[0].target_qubits == (0, 2)
+    assert sterms[0].factors == [X(0), Z(2)]
+    assert sterms[1].target_qubits == (1, 2)
+    assert sterms[1].factors == [Y(1), X(2)]
+    backend.assert_allclose(sterms[0].matrix, np.kron(matrices.X, matrices.Z))
+    backend.assert_allclose(sterms[1].matrix, 0.5 * np.kron(matrices.Y, matrices.X))
+
+
+def test_term_group_from_terms():
+    """Test that terms are appended to the first compatible group."""
+    qubits = [(0, 1, 2), (2, 3), (1, 2), (3, 4), (1,), (3,), (4,), (5,), (2, 3)]
+    hterms = [terms.HamiltonianTerm(np.eye(2 ** len(q)), *q) for q in qubits]
+    groups = terms.TermGroup.from_terms(hterms)
+    targets = [sorted(group.target_qubits) for group in groups]
+    assert targets == [[0, 1, 2], [2, 3], [3, 4], [5]]
+    assert [len(group) for group in groups] == [3, 3, 2, 1]
+
+
+def test_term_group_from_terms_minimize_depth():
+    from qibo.symbols import X, Z
+
+    nqubits = 6
+    sterms = [terms.SymbolicTerm(1, Z(i) * Z(i + 1)) for i in range(nqubits - 1)]
+    sterms.extend(terms.SymbolicTerm(1, X(i)) for i in range(nqubits))
+    groups = terms.TermGroup.from_terms(sterms)
+    min_groups = terms.TermGroup.from_terms(sterms, minimize_depth=True)
+    assert sum(len(g) for g in min_groups) == len(sterms)
+    assert {id(g[0]) for g in min_groups} == {id(g[0]) for g in groups}
+    depths = []
+    for grouping in [groups, min_groups]:
+        c = models.Circuit(nqubits)
+        c.add(gates.Unitary(np.eye(4), *g.target_qubits) for g in grouping)
+        depths.append(c.depth)
+    assert depths == [nqubits - 1, 2]
@@ -141,6 +141,44 @@ def test_random_circuit_fusion(backend, nqubits, ngates, max_qubits):
     backend.assert_circuitclose(fused_c, c, atol=1e-7)
 
 
+@pytest.mark.parametrize("max_qubits", [2, 3])
+def test_noisy_circuit_fusion(backend, max_qubits):
+    """Check fusion of gates and channels to superoperators in density matrices."""
+    from qibo.tests.utils import random_density_matrix
+
+    a1 = np.sqrt(0.4) * np.array([[0, 1], [1, 0]])
+    a2 = np.sqrt(0.6) * np.array([[1, 0], [0, -1]])
+    c = Circuit(4, density_matrix=True)
+    c.add(gates.H(i) for i in range(4))
+    c.add(gates.PauliNoiseChannel(i, 0.1, 0.05, 0.2) for i in range(4))
+    c.add(gates.CNOT(0, 1))
+    c.add(gates.DepolarizingChannel((0, 1), 0.1))
+    c.add(gates.RY(2, theta=0.1234).controlled_by(3))
+    c.add(gates.KrausChannel([((2,), a1), ((2,), a2)]))
+    c.add(gates.ResetChannel(3, p0=0.2, p1=0.1))
+    c.add(gates.CZ(1, 2))
+    c.add(gates.UnitaryChannel([0.3], [((1, 2), np.eye(4)[[1, 0, 3, 2]])]))
+    c.add(gates.RX(3, theta=0.4321))
+    fused_c = c.fuse(max_qubits=max_qubits)
+    assert len(fused_c.queue) < len(c.queue)
+    assert c.queue[-4] in fused_c.queue
+
+    initial_rho = random_density_matrix(4)
+    target_rho = backend.execute_circuit(c, np.copy(initial_rho))
+    final_rho = backend.execute_circuit(fused_c, np.copy(initial_rho))
+    backend.assert_allclose(final_rho, target_rho, atol=1e-10)
+
+
+def test_noisy_circuit_fusion_state_vector():
+    """Check that channels are not fused when using state vectors."""
+    c = Circuit(2)
+    c.add(gates.H(0))
+    c.add(gates.PauliNoiseChannel(0, px=0.2))
+    c.add(gates.CNOT(0, 1))
+    fused_c = c.fuse()
+    assert fused_c.queue == c.queue
+
+
 def test_controlled_by_gates_fusion(backend):
     """Check circuit fusion that contains ``controlled_by`` gates."""
     c = Circuit(4)
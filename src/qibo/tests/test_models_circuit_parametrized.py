@@ -233,3 +233,95 @@ def test_variable_theta():
     c.add(gates.RY(1, 0.4321))
     target_state = backend.execute_circuit(c)
     backend.assert_allclose(final_state, target_state)
+
+
+def test_circuit_state_cache(backend):
+    c = Circuit(3)
+    for q in range(3):
+        c.add(gates.RY(q, theta=0))
+    c.add(gates.CNOT(0, 1))
+    c.add(gates.CNOT(1, 2))
+    c.add(gates.fSim(0, 2, theta=0, phi=0))
+    for q in range(3):
+        c.add(gates.RX(q, theta=0))
+    target_circuit = c.copy(deep=True)
+    c.cache_states = True
+
+    params = np.random.random(8)
+    for i in [None, 4, 0, 7, None, 2]:
+        if i is not None:
+            params[i] += 0.5
+        c.set_parameters(params)
+        target_circuit.set_parameters(params)
+        final_state = backend.execute_circuit(c).state()
+        target_state = backend.execute_circuit(target_circuit).state()
+        backend.assert_allclose(final_state, target_state)
+    # states before each parametrized gate are cached
+    assert set(c._state_cache["states"].keys()) == {0, 1, 2, 5, 6, 7, 8}
+
+
+def test_circuit_state_cache_inplace_backend():
+    from qibo.backends import NumpyBackend
+
+    class InplaceBackend(NumpyBackend):
+        """Backend that overwrites the given state when applying gates."""
+
+        def apply_gate(self, gate, state, nqubits):
+            result = super().apply_gate(gate, state, nqubits)
+            state[:] = result
+            return state
+
+    backend = InplaceBackend()
+    c = Circuit(2)
+    c.add(gates.RY(0, theta=0.1))
+    c.add(gates.CNOT(0, 1))
+    c.add(gates.RX(1, theta=0.2))
+    target_circuit = c.copy(deep=True)
+    c.cache_states = True
+    backend.execute_circuit(c)
+    c.set_parameters([0.1, 0.5])
+    target_circuit.set_parameters([0.1, 0.5])
+    final_state = backend.execute_circuit(c).state()
+    target_state = NumpyBackend().execute_circuit(target_circuit).state()
+    backend.assert_allclose(final_state, target_state)
+
+
+def test_set_parameters_array_index_map(backend):
+    c = Circuit(3)
+    c.add(gates.RX(0, theta=0))
+    c.add(gates.U3(1, theta=0, phi=0, lam=0))
+    c.add(gates.RY(2, theta=0, trainable=False))
+    c.add(gates.CZ(1, 2))
+    c.add(gates.fSim(0, 2, theta=0, phi=0))
+    index_map = c.trainable_gates.index_map
+    assert [(start, stop) for _, start, stop, _ in index_map] == [
+        (0, 1),
+        (1, 4),
+        (4, 6),
+    ]
+
+    params = np.random.random(6)
+    c.set_parameters(params)
+    target_circuit = Circuit(3)
+    target_circuit.add(gates.RX(0, theta=params[0]))
+    target_circuit.add(gates.U3(1, theta=params[1], phi=params[2], lam=params[3]))
+    target_circuit.add(gates.RY(2, theta=0))
+    target_circuit.add(gates.CZ(1, 2))
+    target_circuit.add(gates.fSim(0, 2, theta=params[4], phi=params[5]))
+    assert c.get_parameters(format="flatlist") == list(params)
+    backend.assert_allclose(
+        backend.execute_circuit(c).state(),
+        backend.execute_circuit(target_circuit).state(),
+    )
+    # gate initialization arguments are also updated
+    assert c.copy(deep=True).get_parameters(format="flatlist") == list(params)
+    # copied circuits keep the number of parameters
+    assert c.copy().trainable_gates.nparams == 6
+
+    # gates with custom parameter setters do not use the index map
+    c = Circuit(1)
+    c.add(gates.U3(0, theta=0, phi=0, lam=0))
+    c.add(gates.Unitary(np.eye(2), 0))
+    assert c.trainable_gates.index_map is None
+    c.set_parameters([(0.1, 0.2, 0.3), np.eye(2)])
+    assert c.get_parameters()[0] == (0.1, 0.2, 0.3)
@@ -4,6 +4,7 @@ from scipy.linalg import expm
 
 from qibo import callbacks, hamiltonians, models
 from qibo.config import raise_error
+from qibo.tests.utils import random_state
 
 
 def assert_states_equal(backend, state, target_state, atol=0):
@@ -53,7 +54,14 @@ def test_state_evolution_get_initial_state(backend):
 
 
 @pytest.mark.parametrize(
-    ("solver", "atol"), [("exp", 0), ("rk4", 1e-2), ("rk45", 1e-1)]
+    ("solver", "atol"),
+    [
+        ("exp", 0),
+        ("krylov", 1e-10),
+        ("rk4", 1e-2),
+        ("rk45", 1e-1),
+        ("rk45_adaptive", 1e-6),
+    ],
 )
 def test_state_evolution_constant_hamiltonian(backend, solver, atol):
     nsteps = 200
@@ -114,6 +122,147 @@ def test_state_evolution_trotter_hamiltonian(
         assert_states_equal(backend, final_psi, target_psi[-1], atol=atol)
 
 
+@pytest.mark.parametrize("solver", ["trotter1", "trotter2", "trotter4"])
+def test_state_evolution_trotter_orders(backend, solver, nqubits=4, dt=1e-1):
+    ham = hamiltonians.TFIM(nqubits, h=1.0, dense=False, backend=backend)
+    initial_psi = np.ones(2**nqubits) / np.sqrt(2**nqubits)
+    matrix = backend.to_numpy(ham.dense.matrix)
+    target_psi = expm(-1j * matrix).dot(initial_psi)
+
+    evolution = models.StateEvolution(ham, dt, solver=solver)
+    final_psi = evolution(final_time=1, initial_state=np.copy(initial_psi))
+    error = np.abs(backend.to_numpy(final_psi) - target_psi).max()
+    assert error < {"trotter1": 1e-1, "trotter2": 1e-2, "trotter4": 1e-4}[solver]
+
+
+@pytest.mark.parametrize("dense", [True, False])
+def test_state_evolution_krylov(backend, dense, nqubits=4):
+    ham = hamiltonians.TFIM(nqubits, h=1.0, dense=dense, backend=backend)
+    initial_psi = np.ones(2**nqubits) / np.sqrt(2**nqubits)
+    matrix = backend.to_numpy(ham.matrix)
+    target_psi = expm(-1j * 2 * matrix).dot(initial_psi)
+    # large time step that requires splitting the Krylov approximation
+    for dt in [1e-1, 2.0]:
+        evolution = models.StateEvolution(ham, dt, solver="krylov")
+        final_psi = evolution(final_time=2, initial_state=np.copy(initial_psi))
+        backend.assert_allclose(final_psi, target_psi, atol=1e-10)
+
+
+@pytest.mark.parametrize("krylov_dim", [12, 60])
+def test_krylov_solver_restart(backend, krylov_dim, nqubits=6):
+    from qibo import solvers
+
+    ham = hamiltonians.TFIM(nqubits, h=1.0, backend=backend)
+    initial_psi = random_state(nqubits)
+    matrix = backend.to_numpy(ham.matrix)
+    target_psi = expm(-1j * 3 * matrix).dot(initial_psi)
+
+    solver = solvers.Krylov(3.0, ham, krylov_dim=krylov_dim)
+    nproducts = 0
+    matmul = ham.__class__.__matmul__
+
+    class CountedHamiltonian:
+        def __matmul__(self, state):
+            nonlocal nproducts
+            nproducts += 1
+            return matmul(ham, state)
+
+    final_psi = solver.expmv(CountedHamiltonian(), backend.cast(initial_psi), 3.0)
+    backend.assert_allclose(final_psi, target_psi, atol=1e-10)
+    if krylov_dim == 12:
+        # the iteration was restarted
+        assert nproducts > krylov_dim
+    else:
+        # the subspace converges before reaching the dimension of the space
+        assert nproducts < 2**nqubits
+
+
+def test_trotter_circuit_orders(backend, nqubits=4):
+    ham = hamiltonians.TFIM(nqubits, h=1.0, dense=False, backend=backend)
+    circuit1 = ham.circuit(1e-2, order=1)
+    ngroups = len(circuit1.queue)
+    # second order fuses the two middle exponentials
+    circuit2 = ham.circuit(1e-2, order=2)
+    assert len(circuit2.queue) == 2 * ngroups - 1
+    # fourth order also fuses the boundaries of the five second order steps
+    circuit4 = ham.circuit(1e-2, order=4)
+    assert len(circuit4.queue) == 5 * (2 * ngroups - 1) - 4
+    # circuits are cached per order
+    assert ham.circuit(1e-2, order=2) is circuit2
+    with pytest.raises(ValueError):
+        ham.circuit(1e-2, order=3)
+    # Trotter solvers require symbolic Hamiltonians
+    with pytest.raises(TypeError):
+        models.StateEvolution(
+            hamiltonians.TFIM(nqubits, backend=backend), 1e-2, solver="trotter4"
+        )
+
+
+@pytest.mark.parametrize("order", [1, 2, 4])
+def test_trotter_boundary_circuits(backend, order, nqubits=4, dt=1e-1):
+    ham = hamiltonians.TFIM(nqubits, h=1.0, dense=False, backend=backend)
+    step = ham.circuit(dt, order=order)
+    circuits = ham.trotter_circuit.boundary_circuits()
+    if order == 1:
+        assert circuits is None
+    else:
+        first, middle, last = circuits
+        assert len(first.queue) == 1
+        assert len(middle.queue) == len(last.queue) == len(step.queue) - 1
+
+    # fused boundaries give the same state as separate steps
+    initial_psi = random_state(nqubits)
+    evolution = models.StateEvolution(ham, dt, solver=f"trotter{order}")
+    final_psi = evolution(final_time=1, initial_state=np.copy(initial_psi))
+    norm = callbacks.Norm()
+    evolution = models.StateEvolution(
+        ham, dt, solver=f"trotter{order}", callbacks=[norm]
+    )
+    target_psi = evolution(final_time=1, initial_state=np.copy(initial_psi))
+    backend.assert_allclose(final_psi, target_psi, atol=1e-12)
+    # the parameters of the fused circuits follow the time step
+    evolution = models.StateEvolution(ham, dt / 2, solver=f"trotter{order}")
+    final_psi = evolution(final_time=1, initial_state=np.copy(initial_psi))
+    evolution = models.StateEvolution(
+        ham, dt / 2, solver=f"trotter{order}", callbacks=[norm]
+    )
+    target_psi = evolution(final_time=1, initial_state=np.copy(initial_psi))
+    backend.assert_allclose(final_psi, target_psi, atol=1e-12)
+
+
+def test_state_evolution_qdrift(backend, nqubits=3, dt=1e-2):
+    np.random.seed(123)
+    ham = hamiltonians.TFIM(nqubits, h=1.0, dense=False, backend=backend)
+    initial_psi = np.ones(2**nqubits) / np.sqrt(2**nqubits)
+    matrix = backend.to_numpy(ham.dense.matrix)
+    target_psi = expm(-1j * 0.5 * matrix).dot(initial_psi)
+
+    evolution = models.StateEvolution(ham, dt, solver="qdrift")
+    final_psi = backend.to_numpy(
+        evolution(final_time=0.5, initial_state=np.copy(initial_psi))
+    )
+    backend.assert_allclose(np.linalg.norm(final_psi), 1.0)
+    assert np.abs(np.vdot(final_psi, target_psi)) > 0.9
+
+
+def test_adaptive_rk45_solver(backend, nqubits=3):
+    h0 = hamiltonians.X(nqubits, backend=backend)
+    h1 = hamiltonians.TFIM(nqubits, h=1.0, backend=backend)
+    initial_psi = np.ones(2**nqubits) / np.sqrt(2**nqubits)
+    # reference using small fixed steps
+    evolution = models.AdiabaticEvolution(h0, h1, lambda t: t, 1e-3, solver="rk45")
+    target_psi = evolution(final_time=1, initial_state=np.copy(initial_psi))
+
+    # first internal step is too large and needs to be rejected
+    evolution = models.AdiabaticEvolution(
+        h0, h1, lambda t: t, 0.5, solver="rk45_adaptive"
+    )
+    final_psi = evolution(final_time=1, initial_state=np.copy(initial_psi))
+    backend.assert_allclose(final_psi, target_psi, atol=1e-7)
+    assert evolution.solver.step < 0.5
+    assert evolution.solver.t == 1
+
+
 def test_adiabatic_evolution_init(backend):
     # Hamiltonians of bad type
     h0 = hamiltonians.X(3, backend=backend)
@@ -201,6 +350,64 @@ def test_adiabatic_evolution_hamiltonian(backend, dense):
         backend.assert_allclose(matrix, ham(t, 2))
 
 
+@pytest.mark.parametrize("dense", [False, True])
+def test_adiabatic_hamiltonian_lazy_matrix(backend, dense):
+    from qibo.hamiltonians.adiabatic import InterpolatedHamiltonian
+
+    h0 = hamiltonians.X(3, dense=dense, backend=backend)
+    h1 = hamiltonians.TFIM(3, h=0.5, dense=dense, backend=backend)
+    adev = models.AdiabaticEvolution(h0, h1, lambda t: t, dt=1e-2)
+    adev.hamiltonian.total_time = 1
+    m0 = backend.to_numpy(h0.matrix)
+    m1 = backend.to_numpy(h1.matrix)
+
+    state = random_state(3)
+    ham = adev.hamiltonian(0.3)
+    assert isinstance(ham, InterpolatedHamiltonian)
+    target_matrix = 0.7 * m0 + 0.3 * m1
+    backend.assert_allclose(ham @ state, target_matrix @ state)
+    backend.assert_allclose(ham.matrix, target_matrix)
+    backend.assert_allclose(
+        ham.expectation(state), np.vdot(state, target_matrix @ state)
+    )
+    # operations with other Hamiltonians create new matrices
+    ham2 = adev.hamiltonian(0.6)
+    new_ham = ham + ham2
+    backend.assert_allclose(new_ham.matrix, 1.1 * m0 + 0.9 * m1)
+    backend.assert_allclose((2 * ham).matrix, 2 * target_matrix)
+    backend.assert_allclose((ham - ham2).matrix, 0.3 * m0 - 0.3 * m1)
+    backend.assert_allclose((1 - ham).matrix, np.eye(8) - target_matrix)
+    backend.assert_allclose((ham @ ham2).matrix, target_matrix @ (0.4 * m0 + 0.6 * m1))
+    # the matrix of the latest requested time is stored in the shared buffer
+    # and the public matrix is a copy that is not modified by other times
+    matrix = ham.matrix
+    backend.assert_allclose(ham2.matrix, 0.4 * m0 + 0.6 * m1)
+    backend.assert_allclose(matrix, target_matrix)
+    backend.assert_allclose(ham.matrix, target_matrix)
+    assert ham._buffered_matrix is ham2._buffered_matrix
+    # updating ``s`` in place resets the cached matrix
+    ham.s = 0.5
+    backend.assert_allclose(ham @ state, 0.5 * (m0 + m1) @ state)
+    backend.assert_allclose(ham.matrix, 0.5 * (m0 + m1))
+    backend.assert_allclose(ham @ state, 0.5 * (m0 + m1) @ state)
+
+
+@pytest.mark.parametrize("dense", [True, False])
+def test_adiabatic_hamiltonian_partial_eigenvectors(backend, dense):
+    h0 = hamiltonians.X(4, dense=dense, backend=backend)
+    h1 = hamiltonians.TFIM(4, h=0.5, dense=dense, backend=backend)
+    adev = models.AdiabaticEvolution(h0, h1, lambda t: t, dt=1e-2)
+    adev.hamiltonian.total_time = 1
+    m0 = backend.to_numpy(h0.matrix)
+    m1 = backend.to_numpy(h1.matrix)
+    for t in [0.2, 0.25]:
+        eigvals, eigvecs = adev.hamiltonian(t).partial_eigenvectors(k=2)
+        target = np.linalg.eigvalsh((1 - t) * m0 + t * m1)
+        backend.assert_allclose(eigvals, target[:2])
+        # eigenvectors are kept to warm-start the next time step
+        assert adev.hamiltonian._buffer["eigenvectors"] is eigvecs
+
+
 @pytest.mark.parametrize("dt", [1e-1])
 def test_adiabatic_evolution_execute_exp(backend, dt):
     """Test adiabatic evolution with exponential solver."""
@@ -338,3 +545,11 @@ def test_scheduling_optimization(backend, method, options, messages, dense, file
 
     if filename is not None:
         assert_regression_fixture(backend, params, filename)
+
+
+def test_adiabatic_evolution_qdrift_error(backend):
+    h0 = hamiltonians.X(3, dense=False, backend=backend)
+    h1 = hamiltonians.TFIM(3, dense=False, backend=backend)
+    with pytest.raises(NotImplementedError):
+        adev = models.AdiabaticEvolution(h0, h1, lambda t: t, dt=1e-2, solver="qdrift")
+        adev(final_time=1)
@@ -44,3 +44,23 @@ def test_tsp(backend, nlayers):
     assert_regression_fixture(
         backend, final_state.imag, f"tsp_layer{nlayers}_imag.out", rtol=1e-3, atol=1e-5
     )
+
+
+def test_tsp_hamiltonians_arithmetic(backend):
+    from qibo import symbols
+    from qibo.hamiltonians import SymbolicHamiltonian
+    from qibo.models.tsp import tsp_mixer, tsp_phaser
+
+    distance_matrix = np.array([[0, 0.9, 0.8], [0.4, 0, 0.1], [0, 0.7, 0]])
+    phaser = tsp_phaser(distance_matrix, backend=backend)
+    mixer = tsp_mixer(3, backend=backend)
+    target_phaser = backend.to_numpy(phaser.matrix)
+    target_mixer = backend.to_numpy(mixer.matrix)
+
+    backend.assert_allclose((phaser @ phaser).matrix, target_phaser @ target_phaser)
+    backend.assert_allclose((phaser + mixer).matrix, target_phaser + target_mixer)
+    # addition with a Hamiltonian defined by its symbolic form
+    xham = SymbolicHamiltonian(sum(symbols.X(i) for i in range(9)), backend=backend)
+    backend.assert_allclose(
+        (mixer + xham).matrix, target_mixer + backend.to_numpy(xham.matrix)
+    )
@@ -86,11 +86,13 @@ def test_vqc(backend, method, options, compile, filename):
 test_names = "method,options,compile,filename"
 test_values = [
     ("Powell", {"maxiter": 1}, True, "vqe_powell.out"),
+    ("Powell", {"maxiter": 1}, False, "vqe_powell.out"),
     ("BFGS", {"maxiter": 1}, True, "vqe_bfgs.out"),
     ("BFGS", {"maxiter": 1}, False, "vqe_bfgs.out"),
     ("parallel_L-BFGS-B", {"maxiter": 1}, True, None),
     ("parallel_L-BFGS-B", {"maxiter": 1}, False, None),
     ("cma", {"maxfevals": 2}, False, None),
+    ("rotosolve", {"maxiter": 1}, False, "vqe_rotosolve.out"),
     ("sgd", {"nepochs": 5}, False, None),
     ("sgd", {"nepochs": 5}, True, None),
 ]
@@ -132,6 +134,73 @@ def test_vqe(backend, method, options, compile, filename):
         assert_regression_fixture(backend, params, filename)
 
 
+@pytest.mark.parametrize("method", ["Powell", "BFGS"])
+def test_vqe_state_cache(backend, method):
+    circuit = models.Circuit(3)
+    for q in range(3):
+        circuit.add(gates.RY(q, theta=0))
+    circuit.add(gates.CZ(0, 1))
+    circuit.add(gates.CZ(1, 2))
+    for q in range(3):
+        circuit.add(gates.RX(q, theta=0))
+    hamiltonian = hamiltonians.XXZ(3, backend=backend)
+    vqe = models.VQE(circuit, hamiltonian)
+    cache_states = []
+    vqe.minimize(
+        np.random.random(6),
+        method=method,
+        options={"maxiter": 1},
+        callback=lambda x: cache_states.append(circuit.cache_states),
+    )
+    assert cache_states and all(cache_states) == (method == "Powell")
+    # the cache is disabled and cleared after the optimization
+    assert not circuit.cache_states
+    assert circuit._state_cache is None
+
+
+def test_rotosolve():
+    from qibo.optimizers import optimize
+
+    def loss(parameters, shifts):
+        return np.sum(np.cos(parameters - shifts)) + 0.5 * np.sin(
+            parameters[0] - shifts[0]
+        )
+
+    shifts = np.array([0.1, -0.7, 2.3])
+    callback_parameters = []
+    best, params, extra = optimize(
+        loss,
+        np.zeros(3),
+        args=(shifts,),
+        method="rotosolve",
+        callback=callback_parameters.append,
+    )
+    np.testing.assert_allclose(best, -2 - np.sqrt(1.25))
+    np.testing.assert_allclose(best, loss(params, shifts))
+    assert extra["nit"] == len(callback_parameters) == 2
+
+
+def test_vqe_adjoint_gradient(backend):
+    nqubits = 4
+    circuit = models.Circuit(nqubits)
+    for q in range(nqubits):
+        circuit.add(gates.RY(q, theta=0))
+    for q in range(nqubits - 1):
+        circuit.add(gates.CZ(q, q + 1))
+    for q in range(nqubits):
+        circuit.add(gates.RY(q, theta=0))
+    hamiltonian = hamiltonians.XXZ(nqubits=nqubits, backend=backend)
+    np.random.seed(0)
+    initial_parameters = np.random.uniform(0, 2 * np.pi, 2 * nqubits)
+    v = models.VQE(circuit, hamiltonian)
+    best, params, result = v.minimize(initial_parameters, method="BFGS")
+    best_adjoint, params, result_adjoint = v.minimize(
+        initial_parameters, method="BFGS", jac="adjoint"
+    )
+    backend.assert_allclose(best_adjoint, best, atol=1e-6)
+    assert result_adjoint.nfev < result.nfev
+
+
 @pytest.mark.parametrize(
     "solver,dense",
     [
@@ -270,6 +339,29 @@ def test_falqon_optimization(backend, delta_t, max_layers, tolerance, filename):
         assert_regression_fixture(backend, params, filename)
 
 
+@pytest.mark.parametrize("dense", [True, False])
+def test_falqon_carried_state(backend, dense):
+    h = hamiltonians.TFIM(3, h=0.5, dense=dense, backend=backend)
+    falqon = models.FALQON(h)
+    assert falqon._evol_hamiltonian is None
+    best, params, extra = falqon.minimize(0.1, 4, tol=1e-10)
+    assert len(params) == 10
+    h_matrix = backend.to_numpy(h.matrix)
+    m_matrix = backend.to_numpy(falqon.mixer.matrix)
+    commutator = 1j * (h_matrix @ m_matrix - m_matrix @ h_matrix)
+    # every layer parameter is the feedback of the state before it
+    for i in range(1, 5):
+        falqon.set_parameters(params[: 2 * i])
+        state = backend.to_numpy(falqon.execute())
+        target_beta = 0.1 * np.real(np.vdot(state, commutator @ state))
+        backend.assert_allclose(params[2 * i + 1], target_beta, atol=1e-10)
+        backend.assert_allclose(
+            extra["energies"][i], np.real(np.vdot(state, h_matrix @ state))
+        )
+    falqon.set_parameters(params)
+    backend.assert_allclose(best, h.expectation(falqon.execute()))
+
+
 def test_falqon_optimization_callback(backend):
     class TestCallback:
         def __call__(self, x):
@@ -330,6 +422,32 @@ def test_aavqe(backend, method, options, compile, filename):
         assert_regression_fixture(backend, params, filename, rtol=1e-2)
 
 
+@pytest.mark.parametrize("dense", [True, False])
+def test_aavqe_reused_hamiltonian(backend, dense):
+    """Check that AAVQE agrees with a new VQE per step."""
+    circuit = models.Circuit(3)
+    circuit.add(gates.RY(q, theta=0) for q in range(3))
+    circuit.add(gates.CZ(0, 1))
+    circuit.add(gates.CZ(1, 2))
+    circuit.add(gates.RY(q, theta=0) for q in range(3))
+    h0 = hamiltonians.X(3, dense=dense, backend=backend)
+    h1 = hamiltonians.XXZ(3, dense=dense, backend=backend)
+    aavqe = models.AAVQE(circuit, h0, h1, lambda t: t, nsteps=3, t_max=1)
+    initial_parameters = np.random.uniform(0, 2 * np.pi, 6)
+    options = {"maxiter": 2}
+    best, params = aavqe.minimize(initial_parameters, options=options)
+
+    target_params = initial_parameters
+    for t in [0, 0.5, 1]:
+        vqe = models.VQE(circuit, h0 * (1 - t) + h1 * t)
+        target_best, target_params, _ = vqe.minimize(
+            target_params, method="BFGS", options=options
+        )
+    # finite difference gradients are sensitive to rounding differences
+    backend.assert_allclose(best, target_best, atol=1e-5)
+    backend.assert_allclose(params, target_params, atol=1e-4)
+
+
 @pytest.mark.parametrize("test_input,expected", [("cvar", -0.5), ("gibbs", -2.08)])
 def test_custom_loss(test_input, expected):
     from qibo import hamiltonians
@@ -339,3 +457,71 @@ def test_custom_loss(test_input, expected):
     initial_p = [0.314, 0.22, 0.05, 0.59]
     best, params, _ = qaoa.minimize(initial_p, mode=test_input)
     assert abs(best - expected) <= 0.01
+
+
+@pytest.mark.parametrize("dense", [False, True])
+@pytest.mark.parametrize("model", ["MaxCut", "XXZ"])
+def test_cvar_gibbs_energies(dense, model):
+    from qibo import hamiltonians
+    from qibo.models.utils import compute_cvar, convert_bit_to_energy, cvar, gibbs
+
+    h = getattr(hamiltonians, model)(4, dense=dense)
+    state = random_state(4)
+    probabilities = np.abs(state) ** 2
+    energies = [convert_bit_to_energy(h, format(i, "04b")) for i in range(16)]
+    target_cvar = compute_cvar(probabilities, energies, 0.1)
+    target_gibbs = -np.log(np.sum(np.exp(-0.1 * np.array(energies))))
+    np.testing.assert_allclose(cvar(h, state), target_cvar)
+    np.testing.assert_allclose(gibbs(h, state), target_gibbs)
+    if not dense:
+        # the energies are calculated without the dense matrix
+        assert h._dense is None
+
+
+def test_compute_cvar():
+    from qibo.models.utils import compute_cvar
+
+    probabilities = [0.2, 0.05, 0.5, 0.25]
+    values = [3, 1, 4, 2]
+    # 0.05 * 1 + 0.05 * 2 for alpha = 0.1
+    np.testing.assert_allclose(compute_cvar(probabilities, values, 0.1), 1.5)
+    np.testing.assert_allclose(compute_cvar(probabilities, values, 1), 3.15)
+
+
+@pytest.mark.parametrize("dense", [False, True])
+@pytest.mark.parametrize("mixer", [None, "X", "scaled"])
+def test_qaoa_diagonal_execution(backend, dense, mixer):
+    h = hamiltonians.MaxCut(5, dense=dense, backend=backend)
+    if mixer is not None:
+        m = hamiltonians.X(5, dense=dense, backend=backend)
+        if mixer == "scaled":
+            m = 0.5 * m
+    else:
+        m = None
+    params = np.random.random(6)
+    state = random_state(5)
+    qaoa = models.QAOA(h, mixer=m)
+    assert qaoa._energies is not None
+    assert qaoa._mixer_coefficients is not None
+
+    target_state = np.copy(state)
+    h_matrix = backend.to_numpy(h.matrix)
+    m_matrix = backend.to_numpy(qaoa.mixer.matrix)
+    for i, p in enumerate(params):
+        if i % 2:
+            u = expm(-1j * p * m_matrix)
+        else:
+            u = expm(-1j * p * h_matrix)
+        target_state = u @ target_state
+
+    qaoa.set_parameters(params)
+    final_state = qaoa(backend.cast(state, copy=True))
+    backend.assert_allclose(final_state, target_state, atol=1e-10)
+
+
+def test_qaoa_non_diagonal_fallback(backend):
+    h = hamiltonians.XXZ(3, backend=backend)
+    m = hamiltonians.Y(3, backend=backend)
+    qaoa = models.QAOA(h, mixer=m)
+    assert qaoa._energies is None
+    assert qaoa._mixer_coefficients is None
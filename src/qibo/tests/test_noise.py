@@ -323,3 +323,105 @@ def test_kraus_error(backend, density_matrix, nshots):
         backend.assert_allclose(final_state, target_final_state)
     else:
         backend.assert_allclose(final_state_samples, target_final_state_samples)
+
+
+@pytest.mark.parametrize("density_matrix", [False, True])
+@pytest.mark.parametrize("nshots", [None, 10])
+def test_lazy_noise_model(backend, density_matrix, nshots):
+    noise = NoiseModel()
+    noise.add(PauliError(0, 0.2, 0.3), gates.X, 1)
+    noise.add(DepolarizingError(0.3), gates.CNOT)
+    noise.add(PauliError(0.1, 0, 0.2), gates.Z, (0, 1))
+
+    circuit = Circuit(3, density_matrix=density_matrix)
+    circuit.add(gates.CNOT(0, 1))
+    circuit.add(gates.Z(1))
+    circuit.add(gates.X(1))
+    circuit.add(gates.X(2))
+    circuit.add(gates.Z(2))
+    circuit.add(gates.CNOT(0, 1))
+    circuit.add(gates.M(0, 1, 2))
+
+    noisy_circuit = noise.apply(circuit)
+    lazy_circuit = noise.apply(circuit, lazy=True)
+    assert lazy_circuit.queue == circuit.queue
+    assert lazy_circuit.repeated_execution == noisy_circuit.repeated_execution
+    # channels are reused for identical gates
+    assert noisy_circuit.queue[1] is noisy_circuit.queue[-2]
+
+    initial_psi = random_density_matrix(3) if density_matrix else random_state(3)
+    backend.set_seed(123)
+    final_state = backend.execute_circuit(
+        lazy_circuit, initial_state=np.copy(initial_psi), nshots=nshots
+    )
+    final_state_samples = final_state.samples() if nshots else None
+    backend.set_seed(123)
+    target_final_state = backend.execute_circuit(
+        noisy_circuit, initial_state=np.copy(initial_psi), nshots=nshots
+    )
+    target_final_state_samples = target_final_state.samples() if nshots else None
+
+    if nshots is None:
+        backend.assert_allclose(final_state, target_final_state)
+    else:
+        backend.assert_allclose(final_state_samples, target_final_state_samples)
+
+
+def test_lazy_noise_model_circuit_operations(backend):
+    noise = NoiseModel()
+    noise.add(PauliError(0.3, 0, 0), gates.H, 0)
+    noise.add(PauliError(0, 0, 0.2), gates.CNOT, 1)
+
+    circuit = Circuit(3, density_matrix=True)
+    circuit.add(gates.H(0))
+    circuit.add(gates.CNOT(0, 1))
+    circuit.add(gates.H(2))
+    noisy_circuit = noise.apply(circuit)
+    lazy_circuit = noise.apply(circuit, lazy=True)
+    target_state = backend.execute_circuit(noisy_circuit)
+
+    final_state = backend.execute_circuit(lazy_circuit.fuse())
+    backend.assert_allclose(final_state, target_state)
+    assert lazy_circuit.copy().noise_model is noise
+    assert lazy_circuit.invert().noise_model is noise
+
+    # circuits sharing the same noise model stay lazy
+    circuit2 = Circuit(3, density_matrix=True)
+    circuit2.add(gates.CNOT(0, 1))
+    lazy_sum = lazy_circuit + noise.apply(circuit2, lazy=True)
+    assert lazy_sum.noise_model is noise
+    final_state = backend.execute_circuit(lazy_sum)
+    target_state = backend.execute_circuit(noise.apply(circuit + circuit2))
+    backend.assert_allclose(final_state, target_state)
+    # noise of the lazy circuit is kept when adding a noiseless circuit
+    mixed_sum = lazy_circuit + circuit2
+    assert mixed_sum.noise_model is None
+    final_state = backend.execute_circuit(mixed_sum)
+    target_state = backend.execute_circuit(noisy_circuit + circuit2)
+    backend.assert_allclose(final_state, target_state)
+
+    # noise channels are part of the light cone, as in circuits that
+    # contain them explicitly
+    cone, qubit_map = lazy_circuit.light_cone(2)
+    assert qubit_map == {2: 0}
+    assert cone.noise_model is None
+    with pytest.raises(NotImplementedError):
+        cone, qubit_map = lazy_circuit.light_cone(1)
+
+
+def test_lazy_noise_model_unsupported_backend():
+    from qibo.backends import GlobalBackend
+
+    noise = NoiseModel()
+    noise.add(PauliError(0.3, 0, 0), gates.H)
+    circuit = Circuit(1, density_matrix=True)
+    circuit.add(gates.H(0))
+    target_state = noise.apply(circuit)().state()
+
+    backend = GlobalBackend()
+    backend.supports_lazy_noise = False
+    try:
+        final_state = noise.apply(circuit, lazy=True)().state()
+    finally:
+        backend.supports_lazy_noise = True
+    backend.assert_allclose(final_state, target_state)